@@ -6,7 +6,6 @@ Auto-fill all missing place_ids to Google Sheets
 import sys
 import random
 import string
-import time
 from pathlib import Path
 
 # Add pipeline to path
@@ -32,7 +31,7 @@ def main():
     
     # Get all records
     print("Reading sheet data...")
-    records = ws.get_all_records()
+    records = client.gateway.read(ws.get_all_records)
     
     print(f"\nTotal rows: {len(records)}")
     
@@ -70,36 +69,23 @@ def main():
     
     new_ids = list(new_ids)
     
-    # Update sheet in batches
+    # Update sheet: adjacent cells are coalesced into ranges and written
+    # with values.batchUpdate, quota and 429 retries handled by the gateway
     print(f"\n📝 Updating Google Sheets (batch mode)...")
     place_id_col = 1  # Column A
     
-    # Prepare batch updates
-    updates = []
     for i, item in enumerate(rows_needing_ids):
-        new_id = new_ids[i]
-        updates.append({
-            'range': f'A{item["row"]}',
-            'values': [[new_id]]
-        })
+        client.gateway.queue_cell(ws, item["row"], place_id_col, new_ids[i])
     
-    # Batch update (50 at a time to avoid rate limits)
-    batch_size = 50
-    total = len(updates)
-    
-    for i in range(0, total, batch_size):
-        batch = updates[i:i+batch_size]
-        try:
-            # Use batch_update for efficiency
-            for update in batch:
-                ws.update(update['range'], update['values'])
-            print(f"  Updated {min(i+batch_size, total)}/{total} rows...")
-            time.sleep(1)  # Rate limit protection
-        except Exception as e:
-            print(f"  ❌ Error in batch {i//batch_size + 1}: {e}")
-            time.sleep(2)
+    try:
+        requests_sent = client.gateway.flush()
+        print(f"  Updated {len(rows_needing_ids)} rows in {requests_sent} request(s)")
+    except Exception as e:
+        print(f"  ❌ Error updating sheet: {e}")
+        return
     
     print("\n✅ Done! All place_ids filled.")
+    client.gateway.print_summary()
 
 if __name__ == "__main__":
     main()
@@ -296,6 +296,12 @@ def run_crawlers() -> List[Event]:
             unique_events.append(event)
     
     print(f"\n📊 總計: {len(unique_events)} 個獨立活動")
+    
+    # 自動建議 venue_slug（對比現有地點）
+    from venue_linker import VenueLinker
+    linked = VenueLinker().link(unique_events)
+    print(f"📍 自動關聯地點: {linked} 個活動")
+    
     return unique_events
 
 if __name__ == '__main__':
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Event Radar - 自動建議 venue_slug
+用活動地點文字（同座標，如有）對比 data/locations.json 嘅現有地點
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# 共用比對模組（pipeline/src/matching.py, geo_index.py）
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline" / "src"))
+from matching import PlaceMatcher, PlaceRecord, normalize_name
+
+LOCATIONS_FILE = Path(__file__).parent.parent / "data" / "locations.json"
+
+# 有座標時，最近地點要喺呢個距離（米）之內先會建議
+VENUE_RADIUS_M = 150
+# 地點名稱最少要有幾多個字先會用嚟對比活動地點文字（避免太短嘅名誤配）
+MIN_NAME_LENGTH = 3
+
+
+class VenueLinker:
+    """Suggest venue slugs for events from the place catalogue"""
+    
+    def __init__(self, locations_file: Path = LOCATIONS_FILE):
+        self.matcher = PlaceMatcher()
+        try:
+            with open(locations_file, encoding="utf-8") as f:
+                locations = json.load(f).get("locations", [])
+        except Exception as e:
+            print(f"⚠️ 讀取地點資料失敗: {e}")
+            locations = []
+        
+        for location in locations:
+            if location.get("slug"):
+                self.matcher.add(PlaceRecord.from_dict(location, key=location["slug"]))
+    
+    def suggest(self, location: str, lat: Optional[float] = None, lng: Optional[float] = None) -> Optional[str]:
+        """Best matching place slug for an event location, or None"""
+        if lat is not None and lng is not None:
+            nearest = self.matcher.geo.nearest(lat, lng, k=1, max_distance_m=VENUE_RADIUS_M)
+            if nearest:
+                return nearest[0][0]
+        
+        if not location:
+            return None
+        
+        record = PlaceRecord(key="", name=location, lat=lat, lng=lng)
+        match = self.matcher.match(record)
+        if match:
+            return match.key
+        
+        # Event locations are often "<venue> <room>", so look for the longest
+        # place name contained in the location text
+        text = normalize_name(location).replace(" ", "")
+        best_slug, best_length = None, MIN_NAME_LENGTH - 1
+        for slug, features in self.matcher.features.items():
+            for name in features.exact_names:
+                name = name.replace(" ", "")
+                if len(name) > best_length and name in text:
+                    best_slug, best_length = slug, len(name)
+        return best_slug
+    
+    def link(self, events: List) -> int:
+        """Fill in venue_slug where missing; returns how many were linked"""
+        linked = 0
+        for event in events:
+            if event.venue_slug:
+                continue
+            slug = self.suggest(event.location, getattr(event, "lat", None), getattr(event, "lng", None))
+            if slug:
+                event.venue_slug = slug
+                linked += 1
+        return linked
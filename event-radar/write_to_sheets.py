@@ -14,6 +14,12 @@ import hashlib
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from crawler import run_crawlers
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline', 'src'))
+from sheets_gateway import SheetsGateway
+
+GATEWAY = SheetsGateway()
+
 # Google Sheets 配置
 SHEET_ID = os.getenv('GOOGLE_SHEETS_ID', '1xUL8jiJckSTe3ScThsh-USNWb2DqpGnkroGdarafJgk')
 WORKSHEET_NAME = '20_events'  # 新的事件 tab
@@ -41,17 +47,17 @@ COLUMNS = [
 def init_worksheet(sheet):
     """初始化 worksheet，如果不存在則創建"""
     try:
-        worksheet = sheet.worksheet(WORKSHEET_NAME)
+        worksheet = GATEWAY.read(sheet.worksheet, WORKSHEET_NAME)
         print(f"✅ 找到現有 worksheet: {WORKSHEET_NAME}")
     except gspread.WorksheetNotFound:
         print(f"🆕 創建新 worksheet: {WORKSHEET_NAME}")
-        worksheet = sheet.add_worksheet(title=WORKSHEET_NAME, rows=1000, cols=20)
+        worksheet = GATEWAY.write(sheet.add_worksheet, title=WORKSHEET_NAME, rows=1000, cols=20)
         
         # 設置標題行
-        worksheet.append_row(COLUMNS)
+        GATEWAY.append(worksheet.append_row, COLUMNS)
         
         # 設置標題行格式
-        worksheet.format('A1:P1', {
+        GATEWAY.write(worksheet.format, 'A1:P1', {
             'backgroundColor': {'red': 1, 'green': 0.8, 'blue': 0.4},
             'textFormat': {'bold': True}
         })
@@ -62,7 +68,7 @@ def get_existing_event_ids(worksheet) -> set:
     """獲取已存在的活動 ID，用於去重"""
     try:
         # 獲取 A 欄所有值（跳過標題）
-        ids = worksheet.col_values(1)[1:]
+        ids = GATEWAY.read(worksheet.col_values, 1)[1:]
         return set(ids)
     except:
         return set()
@@ -73,10 +79,10 @@ def generate_event_id(event) -> str:
     return hashlib.md5(key.encode()).hexdigest()[:12]
 
 def append_events_to_sheet(worksheet, events):
-    """將活動追加到 sheet"""
+    """將活動追加到 sheet（新活動一次過 append）"""
     existing_ids = get_existing_event_ids(worksheet)
     
-    new_count = 0
+    new_rows = []
     duplicate_count = 0
     
     for event in events:
@@ -107,11 +113,13 @@ def append_events_to_sheet(worksheet, events):
             ''  # notes
         ]
         
-        worksheet.append_row(row)
+        new_rows.append(row)
         existing_ids.add(event_id)
-        new_count += 1
     
-    return new_count, duplicate_count
+    if new_rows:
+        GATEWAY.append(worksheet.append_rows, new_rows)
+    
+    return len(new_rows), duplicate_count
 
 def main():
     print("=" * 60)
@@ -143,7 +151,7 @@ def main():
         return
     
     client = gspread.authorize(creds)
-    sheet = client.open_by_key(SHEET_ID)
+    sheet = GATEWAY.read(client.open_by_key, SHEET_ID)
     
     # 初始化 worksheet
     worksheet = init_worksheet(sheet)
@@ -164,6 +172,7 @@ def main():
     print(f"   新增: {new_count} 個活動")
     print(f"   重複: {duplicate_count} 個活動（已跳過）")
     print(f"\n📊 請查看 Google Sheets: {WORKSHEET_NAME}")
+    GATEWAY.print_summary()
 
 if __name__ == '__main__':
     main()
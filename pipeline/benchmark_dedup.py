@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark duplicate detection: linear name scan vs DedupIndex
+Uses synthetic Chinese place names, no sheet or network access needed
+
+Usage: python benchmark_dedup.py [sizes...]   (default: 1000 10000 100000)
+"""
+
+import sys
+import re
+import random
+import time
+from collections import namedtuple
+from pathlib import Path
+
+# Add pipeline dir to path so the src package resolves
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.dedup_index import DedupIndex
+
+PlaceStub = namedtuple("PlaceStub", ["place_id", "name", "district"])
+
+DISTRICTS = [
+    "中西區", "灣仔", "東區", "南區", "油尖旺", "深水埗", "九龍城", "黃大仙", "觀塘",
+    "葵青", "荃灣", "屯門", "元朗", "北區", "大埔", "沙田", "西貢", "離島",
+]
+PREFIXES = ["親子", "兒童", "室內", "歡樂", "小小", "童夢", "探索", "森林", "海洋", "星空"]
+KINDS = ["遊樂場", "樂園", "圖書館", "公園", "博物館", "遊戲室", "農莊", "體驗館"]
+CHARS = "天地玄黃宇宙洪荒日月盈昃辰宿列張寒來暑往秋收冬藏閏餘成歲律呂調陽雲騰致雨露結為霜金生麗水玉出崑岡"
+
+
+def make_places(n: int, rng: random.Random) -> list:
+    """Generate n synthetic places"""
+    places = []
+    for i in range(n):
+        middle = "".join(rng.choice(CHARS) for _ in range(rng.randint(1, 3)))
+        name = f"{rng.choice(PREFIXES)}{middle}{rng.choice(KINDS)}"
+        places.append(PlaceStub(f"p{i}", name, rng.choice(DISTRICTS)))
+    return places
+
+
+def make_queries(places: list, count: int, rng: random.Random) -> list:
+    """Mix of exact repeats, near-duplicates and new names"""
+    queries = []
+    for i in range(count):
+        place = rng.choice(places)
+        kind = i % 3
+        if kind == 0:
+            queries.append((place.name, place.district))
+        elif kind == 1:
+            queries.append((place.name + "（分店）", place.district))
+        else:
+            queries.append((f"全新{i}號{rng.choice(KINDS)}", rng.choice(DISTRICTS)))
+    return queries
+
+
+def _normalize(name: str) -> str:
+    name = name.lower()
+    name = re.sub(r'[^\w\s]', '', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def _word_similarity(name1: str, name2: str) -> float:
+    set1, set2 = set(name1.split()), set(name2.split())
+    if not set1 or not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+def linear_scan(name: str, district: str, places: list):
+    """The previous O(N) lookup, kept here as the baseline"""
+    normalized = _normalize(name)
+    for place in places:
+        existing = _normalize(place.name)
+        if normalized == existing:
+            return place.place_id
+        if _word_similarity(normalized, existing) > 0.8 and district == place.district:
+            return place.place_id
+    return None
+
+
+def run(size: int):
+    rng = random.Random(size)
+    places = make_places(size, rng)
+    queries = make_queries(places, 1000, rng)
+    
+    # The linear scan gets slow quickly, so time a sample and extrapolate
+    linear_sample = queries[:max(10, 1000 * 1000 // size)]
+    start = time.perf_counter()
+    for name, district in linear_sample:
+        linear_scan(name, district, places)
+    linear_per_query = (time.perf_counter() - start) / len(linear_sample)
+    
+    start = time.perf_counter()
+    index = DedupIndex.build(places)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    found = sum(1 for name, district in queries if index.find_duplicate(name, district))
+    index_per_query = (time.perf_counter() - start) / len(queries)
+    
+    print(f"{size:>8,} places | linear {linear_per_query * 1000:9.3f} ms/query | "
+          f"index build {build_time * 1000:8.1f} ms, {index_per_query * 1000:7.4f} ms/query | "
+          f"speedup {linear_per_query / index_per_query:8.0f}x | {found}/{len(queries)} matched")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    print("=" * 70)
+    print("🔍 Duplicate detection benchmark")
+    print("=" * 70)
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
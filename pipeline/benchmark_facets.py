@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precomputed facet index against a full scan
+Replays every combination of index.html's dropdown filters (district x
+category x age x price x indoor) over data/locations.json, scanning every
+location the way renderLocations() does vs intersecting facet bitsets,
+and checks both give the same places
+
+Usage: python benchmark_facets.py [copies]   (default 1; copies > 1 repeats the data)
+"""
+
+import sys
+import itertools
+import json
+import time
+from pathlib import Path
+
+# Add pipeline/src to path (facet_index has no package imports)
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from facet_index import AGE_BUCKETS, PRICE_FILTERS, FacetIndex, build_facets
+
+LOCATIONS_PATH = Path(__file__).parent.parent / "data" / "locations.json"
+
+# Dropdown options in index.html
+DISTRICTS = [
+    "中西區", "灣仔", "東區", "南區", "油尖旺", "深水埗", "九龍城", "黃大仙", "觀塘",
+    "荃灣", "屯門", "元朗", "北區", "大埔", "沙田", "西貢", "離島", "葵青",
+]
+CATEGORIES = ["playhouse", "park", "museum"]
+INDOOR = ["indoor", "outdoor"]
+
+
+def scan(locations, district, category, age, price, indoor):
+    """renderLocations() filter, one location at a time"""
+    matched = []
+    for position, l in enumerate(locations):
+        if district != "all" and district not in (l.get("district") or ""):
+            continue
+        if category != "all" and l.get("category") != category:
+            continue
+        if age != "all":
+            parts = [12 if a == "12+" else int(a) for a in age.split("-")]
+            min_age, max_age = parts[0], parts[1] if len(parts) > 1 else None
+            if max_age:
+                if l["ageRange"][1] < min_age or l["ageRange"][0] > max_age:
+                    continue
+            elif l["ageRange"][1] < 12:
+                continue
+        if price != "all" and l.get("priceType") not in PRICE_FILTERS[price]:
+            continue
+        if indoor == "indoor" and not l.get("indoor"):
+            continue
+        if indoor == "outdoor" and l.get("indoor"):
+            continue
+        matched.append(position)
+    return matched
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    with open(LOCATIONS_PATH, "r", encoding="utf-8") as f:
+        locations = json.load(f)["locations"] * copies
+    
+    combos = list(itertools.product(
+        ["all"] + DISTRICTS,
+        ["all"] + CATEGORIES,
+        ["all"] + list(AGE_BUCKETS),
+        ["all"] + list(PRICE_FILTERS),
+        ["all"] + INDOOR,
+    ))
+    
+    print("=" * 70)
+    print(f"🔎 Facet index benchmark: {len(locations)} locations, {len(combos)} filter combinations")
+    print("=" * 70)
+    
+    start = time.perf_counter()
+    facets = build_facets(locations)
+    build_time = time.perf_counter() - start
+    size = len(json.dumps(facets, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    index = FacetIndex(facets["facets"], len(locations))
+    
+    start = time.perf_counter()
+    expected = [scan(locations, *combo) for combo in combos]
+    scan_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    results = [index.query(*combo) for combo in combos]
+    index_time = time.perf_counter() - start
+    
+    per_scan = scan_time / len(combos) * 1e6
+    per_query = index_time / len(combos) * 1e6
+    print(f"  build index     {build_time * 1000:8.1f} ms ({size / 1024:.1f} KB minified)")
+    print(f"  full scan       {scan_time * 1000:8.1f} ms ({per_scan:7.1f} µs / combination)")
+    print(f"  facet index     {index_time * 1000:8.1f} ms ({per_query:7.1f} µs / combination, "
+          f"{scan_time / index_time:.1f}x)")
+    print(f"  identical: {results == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark the freshness check scheduler against the local Sheets stand-in
+(no network, no credentials)
+- Fixed asyncio.gather batches (the old FreshnessChecker loop) vs the
+  sliding worker pool, over the same due places and simulated site
+  latencies (most sites fast, some slow)
+- A run with a time budget: which tiers got checked, what was deferred
+- Daily load: how many checks come due per day after checking everything
+  on one day, without and with jitter, and after rebalance_all_schedules
+
+Usage: python benchmark_freshness.py [places] [latency_scale]   (default: 1000 0.01)
+latency_scale multiplies the simulated 0.2-8 s site latencies
+"""
+
+import os
+import sys
+import asyncio
+import hashlib
+import random
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PLACES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+LATENCY_SCALE = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+
+WORK_DIR = Path(tempfile.mkdtemp(prefix="freshness-bench-"))
+os.environ.update({
+    "SHEETS_BACKEND": "local",
+    "SHEETS_LOCAL_PATH": str(WORK_DIR / "sheets.db"),
+    "SHEETS_LOCAL_LATENCY_MS": "0",
+    "SHEETS_LOCAL_READ_QUOTA": "0",
+    "SHEETS_LOCAL_WRITE_QUOTA": "0",
+    "SHEETS_READ_PER_MINUTE": "0",
+    "SHEETS_WRITE_PER_MINUTE": "0",
+    "SHEETS_REVISION_CHECK_SECONDS": "0",
+})
+
+# Add pipeline to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_sheets import synthetic_place
+from src.check_schedule import check_interval_days, next_check_time, spread_check_time
+from src.config import config
+from src.freshness_check import FreshnessChecker
+from src.models import PlaceStatus, PlaceValidation, ValidationStage
+from src.sheets_client import SheetsClient
+
+
+def site_latency(place_id: str) -> float:
+    """Seconds a check takes: 0.2-0.5 s for most sites, 3-8 s for one in ten"""
+    h = int(hashlib.sha1(place_id.encode("utf-8")).hexdigest()[:8], 16)
+    if h % 10 == 0:
+        return (3 + (h >> 4) % 500 / 100) * LATENCY_SCALE
+    return (0.2 + (h >> 4) % 30 / 100) * LATENCY_SCALE
+
+
+class SimulatedValidator:
+    """Stands in for PlaceValidator: waits site_latency(), then passes"""
+    
+    async def validate_place(self, place):
+        await asyncio.sleep(site_latency(place.place_id))
+        return PlaceValidation(
+            place_id=place.place_id,
+            status=place.status,
+            validation_stage=ValidationStage.CHEAP_PASS,
+            confidence=place.confidence,
+            risk_tier=place.risk_tier,
+            next_check_at=next_check_time(place.risk_tier),
+        )
+
+
+async def batched_run(checker: FreshnessChecker):
+    """The previous loop: fixed batches, each waiting for its slowest check"""
+    places = checker.sheets.get_places_for_freshness_check()
+    batch_size = config.max_concurrent_requests
+    with checker.sheets.batch():
+        for i in range(0, len(places), batch_size):
+            await asyncio.gather(*[
+                checker._check_place(place, dry_run=True)
+                for place in places[i:i + batch_size]
+            ])
+
+
+def new_checker(run_id: str) -> FreshnessChecker:
+    checker = FreshnessChecker(run_id)
+    checker.validator = SimulatedValidator()
+    return checker
+
+
+def quietly(run):
+    """Run a coroutine without the per-place output"""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        start = time.perf_counter()
+        result = asyncio.run(run)
+        return result, time.perf_counter() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def daily_peak(times, now: datetime) -> int:
+    return max(Counter((t - now).days for t in times).values())
+
+
+def main():
+    print("=" * 70)
+    print(f"⏱️ Freshness scheduler benchmark: {PLACES} due places, "
+          f"{config.max_concurrent_requests} workers, latency x{LATENCY_SCALE}")
+    print("=" * 70)
+    
+    rng = random.Random(0)
+    now = datetime.utcnow()
+    places = []
+    for i in range(PLACES):
+        place = synthetic_place(i, rng)
+        place.status = PlaceStatus.OPEN
+        place.next_check_at = now - timedelta(days=rng.uniform(0, 30))
+        places.append(place)
+    
+    sheets = SheetsClient()
+    sheets.get_worksheet("Places")
+    with sheets.batch():
+        for place in places:
+            sheets.add_place(place)
+    
+    ideal = sum(site_latency(place.place_id) for place in places) / config.max_concurrent_requests
+    _, batched = quietly(batched_run(new_checker("bench-batched")))
+    _, sliding = quietly(new_checker("bench-sliding").run(dry_run=True))
+    print(f"  fixed batches     {batched:8.2f} s")
+    print(f"  sliding pool      {sliding:8.2f} s ({batched / sliding:.2f}x, ideal {ideal:.2f} s)")
+    
+    # Budget of about a third of the full run
+    checker = new_checker("bench-budget")
+    budget_minutes = sliding / 3 / 60
+    stats, elapsed = quietly(checker.run(dry_run=True, max_minutes=budget_minutes))
+    print(f"\n  with a {budget_minutes * 60:.2f} s budget: {stats['checked']} checked, "
+          f"{stats['deferred']} deferred, {stats['timed_out']} cut off, finished in {elapsed:.2f} s")
+    for tier, row in stats["tiers"].items():
+        print(f"    {tier:8s} queued {row['queued']:5d}  checked {row['checked']:5d}  deferred {row['deferred']:5d}")
+    
+    # Everything checked today: when does it come due again?
+    fixed = [now + timedelta(days=check_interval_days(place.risk_tier)) for place in places]
+    jittered = [next_check_time(place.risk_tier, now, rng) for place in places]
+    spread = [spread_check_time(place.place_id, place.risk_tier, now) for place in places]
+    print(f"\n  Busiest day after one full check (of {PLACES} places):")
+    print(f"    fixed interval    {daily_peak(fixed, now):6d} checks")
+    print(f"    jitter +/-{config.freshness_jitter:.0%}     {daily_peak(jittered, now):6d} checks")
+    print(f"    rebalance spread  {daily_peak(spread, now):6d} checks")
+    print(f"Work dir: {WORK_DIR}")
+
+
+if __name__ == "__main__":
+    main()
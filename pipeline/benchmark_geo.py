@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark GeoIndex radius / k-nearest queries over data/locations.json
+and check results against a brute-force haversine scan
+
+Usage: python benchmark_geo.py [queries]   (default: 2000)
+"""
+
+import sys
+import json
+import random
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from geo_index import GeoIndex, calculate_distance
+
+ROOT = Path(__file__).parent.parent
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    
+    with open(ROOT / "data" / "locations.json", encoding="utf-8") as f:
+        locations = json.load(f)["locations"]
+    points = {
+        loc["slug"]: (float(loc["lat"]), float(loc["lng"]))
+        for loc in locations if loc.get("slug") and loc.get("lat") and loc.get("lng")
+    }
+    
+    print("=" * 70)
+    print("📍 GeoIndex benchmark")
+    print("=" * 70)
+    
+    start = time.perf_counter()
+    index = GeoIndex()
+    for slug, (lat, lng) in points.items():
+        index.add(slug, lat, lng)
+    print(f"Indexed {len(index)} places in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(index.cells)} cells of {index.cell_m:.0f}m)")
+    
+    rng = random.Random(0)
+    queries = [(rng.uniform(22.2, 22.5), rng.uniform(113.9, 114.3)) for _ in range(count)]
+    
+    for label, run in (
+        ("radius 100m", lambda lat, lng: index.radius(lat, lng, 100)),
+        ("radius 500m", lambda lat, lng: index.radius(lat, lng, 500)),
+        ("nearest k=1", lambda lat, lng: index.nearest(lat, lng, k=1)),
+        ("nearest k=5", lambda lat, lng: index.nearest(lat, lng, k=5)),
+    ):
+        start = time.perf_counter()
+        for lat, lng in queries:
+            run(lat, lng)
+        per_query = (time.perf_counter() - start) / count
+        print(f"  {label:12s} {per_query * 1e6:8.1f} µs/query")
+    
+    # Brute-force scan for comparison / correctness
+    start = time.perf_counter()
+    mismatches = 0
+    for lat, lng in queries[:200]:
+        brute = sorted((calculate_distance(lat, lng, p_lat, p_lng), slug)
+                       for slug, (p_lat, p_lng) in points.items())
+        # Compare distances, several places share coordinates
+        found = [round(distance, 6) for _, distance in index.nearest(lat, lng, k=5)]
+        if found != [round(distance, 6) for distance, _ in brute[:5]]:
+            mismatches += 1
+    per_query = (time.perf_counter() - start) / 200
+    print(f"  {'brute force':12s} {per_query * 1e6:8.1f} µs/query, {mismatches} k=5 mismatches")
+
+
+if __name__ == "__main__":
+    main()
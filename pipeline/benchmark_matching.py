@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark fuzzy matching: dedup every auto_discovered_*.json batch against
+the published catalogue (data/locations.json)
+
+Usage: python benchmark_matching.py [--show]   (--show lists every match)
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from matching import PlaceMatcher, PlaceRecord
+
+ROOT = Path(__file__).parent.parent
+
+
+def main():
+    show = "--show" in sys.argv
+    
+    with open(ROOT / "data" / "locations.json", encoding="utf-8") as f:
+        catalogue = json.load(f)["locations"]
+    
+    print("=" * 70)
+    print("🔍 Fuzzy matching benchmark")
+    print("=" * 70)
+    
+    start = time.perf_counter()
+    matcher = PlaceMatcher()
+    for i, location in enumerate(catalogue):
+        matcher.add(PlaceRecord.from_dict(location, key=location.get("slug") or f"row-{i}"))
+    build_time = time.perf_counter() - start
+    print(f"Catalogue: {len(matcher)} places indexed in {build_time * 1000:.1f} ms")
+    
+    total_places = total_matches = total_possible = 0
+    total_time = 0.0
+    for batch_file in sorted(ROOT.glob("auto_discovered_*.json")):
+        with open(batch_file, encoding="utf-8") as f:
+            batch = json.load(f)
+        
+        start = time.perf_counter()
+        matches = [(place, matcher.match(PlaceRecord.from_dict(place, key=""))) for place in batch]
+        elapsed = time.perf_counter() - start
+        
+        found = [(place, match) for place, match in matches if match]
+        possible = sum(1 for _, match in found if match.review)
+        total_places += len(batch)
+        total_matches += len(found) - possible
+        total_possible += possible
+        total_time += elapsed
+        print(f"  {batch_file.name}: {len(batch):3d} places, {len(found) - possible:3d} duplicates, "
+              f"{possible:3d} possible, {elapsed * 1000:7.2f} ms")
+        
+        if show:
+            for place, match in found:
+                print(f"      {place['name']} -> {match.key} ({match.reason}, {match.score:.2f}"
+                      f"{', review' if match.review else ''})")
+    
+    print("-" * 70)
+    print(f"Total: {total_places} places, {total_matches} duplicates, {total_possible} possible, "
+          f"{total_time * 1000:.1f} ms matching (+{build_time * 1000:.1f} ms index build)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark sheet grid -> Place conversion: the row-wise path
+(get_all_records() dicts + _dict_to_place) against the columnar
+_values_to_places, and check both produce the same places
+
+Usage: python benchmark_place_parsing.py [rows ...]   (default: 1000 10000 50000)
+"""
+
+import sys
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from gspread.utils import numericise_all
+
+# Add pipeline to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.models import Place, PlaceStatus, RiskTier, ValidationStage
+from src.sheet_backends import LocalSheetsBackend
+from src.sheets_client import SheetsClient
+
+DISTRICTS = ["中西區", "灣仔", "東區", "油尖旺", "深水埗", "沙田", "大埔", "屯門", "元朗", "離島"]
+
+
+def synthetic_grid(sheets: SheetsClient, count: int) -> list:
+    """Header + rows as get_all_values() returns them (~1% invalid rows)"""
+    rng = random.Random(count)
+    base = datetime(2026, 1, 1)
+    values = [list(SheetsClient.COLUMNS)]
+    for i in range(count):
+        place = Place(
+            place_id=f"bench-{i:06d}",
+            slug=f"bench-place-{i}",
+            name=f"測試遊樂場{i}",
+            name_en=f"Bench Playhouse {i}",
+            region=rng.choice(["hk-island", "kowloon", "nt"]),
+            district=rng.choice(DISTRICTS),
+            address=f"測試街{i}號",
+            lat=round(rng.uniform(22.2, 22.5), 6),
+            lng=round(rng.uniform(113.9, 114.3), 6),
+            geocode_confidence=rng.choice(["manual", "rss_extracted", None]),
+            age_min=0,
+            age_max=rng.randint(3, 12),
+            price_tier=rng.choice(["free", "low", "medium", "high"]),
+            description="Synthetic place for benchmarking",
+            tips=rng.choice(["bring socks", None]),
+            facilities=rng.sample(["toilet", "cafe", "baby_room", "parking"], rng.randint(0, 3)),
+            website_url=f"https://example.com/place/{i % 500}",
+            status=rng.choice(list(PlaceStatus)),
+            validation_stage=rng.choice(list(ValidationStage)),
+            confidence=rng.randint(0, 100),
+            risk_tier=rng.choice(list(RiskTier)),
+            evidence_urls=[f"https://example.com/e/{i}"],
+            evidence_snippets=[f"snippet {i}", "open daily"],
+            updated_at=base + timedelta(days=i % 90),
+            next_check_at=base + timedelta(days=i % 30),
+            review_owner=rng.choice(["alex", None]),
+            review_due_at=rng.choice([base + timedelta(days=i % 14), None]),
+        )
+        row = [str(value) for value in sheets._place_to_row(place)]
+        if rng.random() < 0.01:
+            row[7] = "not a number"  # lat
+        values.append(row)
+    return values
+
+
+def row_wise(sheets: SheetsClient, values: list) -> list:
+    header = values[0]
+    places = []
+    for row in values[1:]:
+        try:
+            places.append(sheets._dict_to_place(dict(zip(header, numericise_all(row)))))
+        except Exception:
+            continue
+    return places
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    sheets = SheetsClient(LocalSheetsBackend(db_path=Path(tempfile.mkdtemp()) / "sheets.db", latency_ms=0))
+    
+    print("=" * 70)
+    print("⚡ Row -> Place conversion benchmark")
+    print("=" * 70)
+    
+    for count in sizes:
+        values = synthetic_grid(sheets, count)
+        
+        start = time.perf_counter()
+        expected = row_wise(sheets, values)
+        row_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        places = sheets._values_to_places(values)
+        columnar_time = time.perf_counter() - start
+        
+        same = len(places) == len(expected) and all(
+            place.model_dump() == other.model_dump() for place, other in zip(places, expected)
+        )
+        print(f"  {count:6d} rows: row-wise {row_time * 1000:8.1f} ms, "
+              f"columnar {columnar_time * 1000:8.1f} ms ({row_time / columnar_time:4.1f}x), "
+              f"{len(places)} places, identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
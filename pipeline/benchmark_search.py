@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the static search index
+Builds the index over data/locations.json (repeated `copies` times),
+round-trips it through JSON, and times queries made from real names,
+English words, districts and addresses. Each result set is checked
+against a scan that tokenizes every location, and Chinese queries also
+against plain substring matching (every substring hit must be found)
+
+Usage: python benchmark_search.py [copies]   (default 10, i.e. ~11k places)
+"""
+
+import sys
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+# Add pipeline/src to path (search_index has no package imports)
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from search_index import FIELDS, SearchIndex, query_tokens, tokenize
+
+LOCATIONS_PATH = Path(__file__).parent.parent / "data" / "locations.json"
+
+
+def sample_queries(locations, rng: random.Random, count: int = 300) -> list:
+    queries = ["公園", "博物館", "遊樂場", "親子", "燒烤", "圖書館", "海洋公園", "館", "park", "play", "museum", "tai"]
+    for location in rng.sample(locations, min(count, len(locations))):
+        name = location.get("name") or ""
+        if len(name) >= 2:
+            start = rng.randrange(len(name) - 1)
+            queries.append(name[start:start + rng.randint(2, 4)])
+        words = (location.get("nameEn") or "").split()
+        if words:
+            word = rng.choice(words)
+            queries.append(word[:rng.randint(2, max(2, len(word)))])
+        if location.get("district"):
+            queries.append(location["district"])
+        address = location.get("address") or ""
+        if len(address) >= 3:
+            queries.append(address[:3])
+    return [query for query in queries if query_tokens(query)]
+
+
+def scan(location_terms, query: str) -> set:
+    """Positions where every query token matches, by tokenizing each location"""
+    matched = set()
+    tokens = query_tokens(query)
+    for position, terms in enumerate(location_terms):
+        if all(
+            any(term.startswith(token) for term in terms) if prefix else token in terms
+            for token, prefix in tokens
+        ):
+            matched.add(position)
+    return matched
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(LOCATIONS_PATH, "r", encoding="utf-8") as f:
+        locations = json.load(f)["locations"] * copies
+    queries = sample_queries(locations, random.Random(0))
+    
+    print("=" * 70)
+    print(f"🔍 Search index benchmark: {len(locations)} places, {len(queries)} queries")
+    print("=" * 70)
+    
+    built = SearchIndex.build(locations)
+    text = json.dumps(built.to_json(), ensure_ascii=False, separators=(",", ":"))
+    start = time.perf_counter()
+    index = SearchIndex.from_json(json.loads(text))
+    load_time = time.perf_counter() - start
+    print(f"  build           {built.build_ms:8.1f} ms ({len(index.terms)} terms, "
+          f"{len(text.encode('utf-8')) / 1024:.0f} KB minified)")
+    print(f"  load            {load_time * 1000:8.1f} ms")
+    
+    for label in ("cold", "warm"):
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"  query ({label})    p50 {statistics.median(latencies):6.3f} ms, "
+              f"p99 {p99:6.3f} ms, max {latencies[-1]:6.3f} ms")
+    
+    # Correctness on the unique data (copies only repeat it)
+    originals = locations[:len(locations) // copies]
+    location_terms = [
+        set().union(*(tokenize(str(location.get(field) or "")) for field in FIELDS))
+        for location in originals
+    ]
+    small = SearchIndex.build(originals)
+    mismatched = missed = 0
+    for query in set(queries):
+        found = {position for position, _ in small.search(query, limit=None)}
+        if found != scan(location_terms, query):
+            mismatched += 1
+        if not query.isascii():
+            for position, location in enumerate(originals):
+                if position not in found and any(query in str(location.get(field) or "") for field in FIELDS):
+                    missed += 1
+    print(f"  vs scan: {mismatched} mismatched queries, {missed} substring hits missed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark SheetsClient reads / writes, freshness rescheduling and JSON
+export against the local Sheets stand-in (no network, no credentials)
+
+Usage: python benchmark_sheets.py [places] [latency_ms]   (default: 10000 150)
+Quotas are off so large runs don't stop at the per-minute limit
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+from pathlib import Path
+
+PLACES = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+LATENCY_MS = sys.argv[2] if len(sys.argv) > 2 else "150"
+
+WORK_DIR = Path(tempfile.mkdtemp(prefix="sheets-bench-"))
+os.environ.update({
+    "SHEETS_BACKEND": "local",
+    "SHEETS_LOCAL_PATH": str(WORK_DIR / "sheets.db"),
+    "SHEETS_LOCAL_LATENCY_MS": LATENCY_MS,
+    "SHEETS_LOCAL_READ_QUOTA": "0",
+    "SHEETS_LOCAL_WRITE_QUOTA": "0",
+    "SHEETS_READ_PER_MINUTE": "0",
+    "SHEETS_WRITE_PER_MINUTE": "0",
+    "SHEETS_REVISION_CHECK_SECONDS": "0",
+})
+
+# Add pipeline to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.export_json import JSONExporter
+from src.freshness_check import RiskBasedScheduler
+from src.models import Place, PlaceStatus, RiskTier
+from src.sheets_client import SheetsClient
+
+DISTRICTS = ["中西區", "灣仔", "東區", "油尖旺", "深水埗", "沙田", "大埔", "屯門", "元朗", "離島"]
+
+
+def synthetic_place(i: int, rng: random.Random) -> Place:
+    return Place(
+        place_id=f"bench-{i:06d}",
+        slug=f"bench-place-{i}",
+        name=f"測試遊樂場{i}",
+        name_en=f"Bench Playhouse {i}",
+        region=rng.choice(["hk-island", "kowloon", "nt"]),
+        district=rng.choice(DISTRICTS),
+        address=f"測試街{i}號",
+        lat=round(rng.uniform(22.2, 22.5), 6),
+        lng=round(rng.uniform(113.9, 114.3), 6),
+        category=rng.choice(["playhouse", "park", "museum"]),
+        age_min=0,
+        age_max=rng.randint(3, 12),
+        price_tier=rng.choice(["free", "low", "medium", "high"]),
+        description="Synthetic place for benchmarking",
+        status=rng.choice([PlaceStatus.OPEN, PlaceStatus.PENDING_REVIEW]),
+        confidence=rng.randint(0, 100),
+        risk_tier=rng.choice(list(RiskTier)),
+    )
+
+
+def timed(label: str, run):
+    start = time.perf_counter()
+    result = run()
+    print(f"  {label:28s} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    print("=" * 70)
+    print(f"📊 Sheets benchmark: {PLACES} places, {LATENCY_MS} ms simulated latency")
+    print("=" * 70)
+    
+    rng = random.Random(0)
+    places = [synthetic_place(i, rng) for i in range(PLACES)]
+    
+    sheets = SheetsClient()
+    sheets.get_worksheet("Places")
+    
+    def seed():
+        with sheets.batch():
+            for place in places:
+                sheets.add_place(place)
+    
+    timed("seed (batched appends)", seed)
+    timed("get_all_places (download)", sheets.get_all_places)
+    timed("get_all_places (cached)", sheets.get_all_places)
+    
+    scheduler = RiskBasedScheduler()
+    timed("rebalance_all_schedules", scheduler.rebalance_all_schedules)
+    
+    exporter = JSONExporter()
+    exporter.output_path = WORK_DIR / "locations.json"
+    timed("export", exporter.export)
+    
+    print("-" * 70)
+    print(f"Requests (seeding client): {dict(sheets.backend.request_counts)}")
+    print(f"Writes:   {sheets.write_stats}")
+    sheets.gateway.print_summary()
+    print(f"Work dir: {WORK_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,16 @@
 """
 Export places from Google Sheets to JSON (standalone)
 Updated for new schema with 03_places sheet
+
+Incremental: locations whose source rows are unchanged since the last run
+are reused, and locations.json is only rewritten (atomically) when the
+export changed. --full rebuilds everything, --compact writes minified JSON
 """
 
 import sys
 import os
 import json
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +19,14 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from export_manifest import ExportManifest, digest
+from export_payload import frontend_files_exist, print_report, write_frontend_files
+from json_stream import write_json_stream
+
+FULL = "--full" in sys.argv[1:]
+COMPACT = "--compact" in sys.argv[1:]
+
 print("=" * 70)
 print("📤 Exporting Places to JSON")
 print("=" * 70)
@@ -95,15 +108,33 @@ except Exception as e:
     print(f"⚠️ Could not load opening_hours_mapping: {e}")
     opening_hours_map = {}
 
-# Convert to frontend format
-locations = []
-for record in records:
+output_path = Path(__file__).parent.parent / "data" / "locations.json"
+
+
+def opening_hours_for(record):
+    """Opening hours mapping a place points at (None if unset / unknown)"""
+    oh_mapping_id = record.get('opening_hours_json_mapping')
+    if oh_mapping_id:
+        try:
+            return opening_hours_map.get(int(oh_mapping_id))
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+# Layout of build_location()'s records; bump it whenever the output changes,
+# so incremental exports rebuild records whose sheet rows didn't change
+RECORD_VERSION = 1
+
+
+def build_location(record):
+    """Frontend record for a place, or None if it isn't exported"""
     # Only export active places with location data
     status = record.get('status', '').lower()
     if status not in ['active', 'open', '']:
-        continue
+        return None
     if not record.get('lat') or not record.get('lng'):
-        continue
+        return None
     
     # Safely parse coordinates
     try:
@@ -116,7 +147,7 @@ for record in records:
         lng = None
     
     if lat is None or lng is None:
-        continue
+        return None
     
     # Lookup district and region
     district_id = record.get('district_id', '')
@@ -186,9 +217,61 @@ for record in records:
         except (ValueError, TypeError):
             pass
     
-    locations.append(location)
+    return location
+
+
+def location_key(record):
+    """Manifest key: place_id, or the slug for rows that don't have one yet"""
+    return str(record.get('place_id') or record.get('slug') or '')
 
-print(f"✓ {len(locations)} places ready for export")
+
+# Hashes from the last run (empty when locations.json was changed elsewhere)
+manifest = ExportManifest(
+    Path(__file__).parent / "cache" / "export_manifest_03_places.json",
+    output_path,
+    options={"source": "03_places", "compact": COMPACT, "record_version": RECORD_VERSION},
+)
+previous = {} if FULL else manifest.previous()
+old_locations = {}
+if previous:
+    with open(output_path, 'r', encoding='utf-8') as f:
+        old_locations = {
+            str(loc.get('id') or loc.get('slug') or ''): loc
+            for loc in json.load(f).get('locations', [])
+        }
+
+# Convert to frontend format (only places whose source rows changed)
+locations = []
+entries = []  # (key, source hash, record hash)
+rebuilt = 0
+# Keys on several rows can't be matched back to one of them, so never reuse those
+id_counts = Counter(location_key(record) for record in records)
+for record in records:
+    pid = location_key(record)
+    source = digest([
+        record,
+        districts_map.get(record.get('district_id', ''), {}),
+        links_map.get(record.get('place_id', ''), {}),
+        opening_hours_for(record),
+    ])
+    old = previous.get(pid)
+    if old and id_counts[pid] == 1 and old[0] == source and (not old[1] or pid in old_locations):
+        location = old_locations.get(pid) if old[1] else None
+    else:
+        location = build_location(record)
+        rebuilt += 1
+    
+    record_hash = digest(location) if location else None
+    entries.append((pid, source, record_hash))
+    if location:
+        locations.append(location)
+
+print(f"✓ {len(locations)} places ready for export ({rebuilt} rebuilt)")
+
+exported = [(pid, record_hash) for pid, _, record_hash in entries if record_hash]
+if previous and exported == manifest.records() and frontend_files_exist(output_path):
+    print(f"\n✅ No changes, {output_path} left as is")
+    sys.exit(0)
 
 # Build output
 output = {
@@ -201,14 +284,16 @@ output = {
     "locations": locations,
 }
 
-# Write JSON
-output_path = Path(__file__).parent.parent / "data" / "locations.json"
-output_path.parent.mkdir(exist_ok=True)
-
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(output, f, ensure_ascii=False, indent=2, default=str)
+# Stream JSON one location at a time (temp file + rename)
+output_sha256, _ = write_json_stream(
+    output_path, locations, metadata=output["metadata"], compact=COMPACT, compress=True,
+)
+manifest.save(entries, output_sha256)
+# Summary / district shards / .gz / .br files the frontend loads first
+payload = write_frontend_files(output_path, output)
 
 print(f"\n✅ Exported to: {output_path}")
+print_report(payload)
 print(f"\n📋 Sample data:")
 if locations:
     print(json.dumps(locations[0], ensure_ascii=False, indent=2))
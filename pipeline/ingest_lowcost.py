@@ -16,6 +16,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared matching engine (src/matching.py has no relative imports)
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from matching import PlaceMatcher, PlaceRecord
+
 # Check required packages
 try:
     import feedparser
@@ -116,7 +120,9 @@ except Exception as e:
             rows.append(row_dict)
         existing = rows
 
-existing_names = {(row.get('name', ''), row.get('district', '')) for row in existing}
+matcher = PlaceMatcher()
+for i, row in enumerate(existing):
+    matcher.add(PlaceRecord.from_dict(row, key=row.get('place_id') or f"row-{i}"))
 print(f"  現有: {len(existing)} 個地點")
 
 # Results
@@ -188,9 +194,9 @@ def extract_place_info(title, summary, url):
     
     return place
 
-def check_already_exists(name, district):
-    """Check if place already exists"""
-    return (name, district) in existing_names
+def check_already_exists(place):
+    """Check if place already exists (fuzzy: name, English name, address, district; match.review = only possibly)"""
+    return matcher.match(PlaceRecord.from_dict(place, key=""))
 
 async def process_rss_source(source):
     """Process RSS source"""
@@ -227,9 +233,14 @@ async def process_rss_source(source):
                 continue
             
             # Check duplicate
-            if check_already_exists(place['name'], place['district']):
-                print(f"  ⚠️  已存在: {place['name']}")
+            match = check_already_exists(place)
+            if match and not match.review:
+                print(f"  ⚠️  已存在: {place['name']} ({match.reason} {match.score:.2f})")
                 continue
+            if match:
+                # 附近有名相近嘅地點：唔自動跳過，標記俾人手審查
+                place['possible_duplicate'] = match.key
+                print(f"  ⚠️  可能重覆: {place['name']} ({match.key}, {match.distance_m:.0f}m)")
             
             # HTTP check (cheap validation)
             print(f"  🔍 檢查: {place['name']}")
@@ -238,6 +249,8 @@ async def process_rss_source(source):
                 place['http_ok'] = True
                 new_count += 1
                 found_places.append(place)
+                # Later articles about the same place count as duplicates too
+                matcher.add(PlaceRecord.from_dict(place, key=f"new-{len(found_places)}"))
                 print(f"  ✓ 有效: {place['name']}")
             else:
                 print(f"  ❌ 無法訪問: {place['name']}")
@@ -319,7 +332,7 @@ async def main():
                 '',  # facebook_url
                 '',  # instagram_url
                 '',  # google_maps_url
-                'PendingReview',  # status
+                'NeedsReview' if place.get('possible_duplicate') else 'PendingReview',  # status
                 'rss_extracted',  # validation_stage
                 50,  # confidence
                 'medium',  # risk_tier
@@ -333,7 +346,7 @@ async def main():
                 datetime.now().strftime('%Y-%m-%d'),  # checked_at
                 '',  # review_owner
                 '',  # review_due_at
-                '',  # resolution
+                f"可能重覆: {place['possible_duplicate']}" if place.get('possible_duplicate') else '',  # resolution
                 '',  # false_alarm_reason
             ]
             
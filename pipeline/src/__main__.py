@@ -14,8 +14,15 @@ from .models import Place, PlaceStatus, PipelineRun
 from .extract_places import PlaceExtractor, DuplicateDetector
 from .validate_places import PlaceValidator
 from .sheets_client import SheetsClient
+from .http_client import HttpClient
 from .logging_utils import setup_logging, AuditLogger, PipelineMetrics
 
+# Capacity of each queue between ingestion stages
+STAGE_QUEUE_SIZE = 100
+
+# Sentinel marking the end of a stage's output
+_DONE = object()
+
 
 async def ingest_sources(
     source_filter: str = None,
@@ -32,14 +39,62 @@ async def ingest_sources(
     logger.info(f"Starting ingestion run {run_id}")
     metrics.record_stage_start("ingestion")
     
+    # One HTTP client for the whole run so connections stay warm
+    async with HttpClient() as client:
+        await _run_ingestion(client, logger, audit, metrics, source_filter, dry_run)
+        
+        http_stats = client.get_stats()
+        metrics.http_stats = http_stats
+        logger.info(
+            f"HTTP: {http_stats['requests']} requests over "
+            f"{http_stats['connections_opened']} connections "
+            f"(reuse ratio {http_stats['connection_reuse_ratio']})"
+        )
+    
+    metrics.record_stage_end("ingestion")
+    metrics.completed_at = datetime.utcnow()
+    metrics.save()
+    
+    logger.info(f"Ingestion complete. Added {metrics.places_added} new places.")
+    
+    return PipelineRun(
+        run_id=run_id,
+        completed_at=datetime.utcnow(),
+        stage="completed",
+        sources_checked=metrics.sources_checked,
+        places_extracted=metrics.places_extracted,
+        places_validated=metrics.places_validated,
+        places_added=metrics.places_added,
+    )
+
+
+async def _run_ingestion(
+    client: HttpClient,
+    logger,
+    audit: AuditLogger,
+    metrics: PipelineMetrics,
+    source_filter: str = None,
+    dry_run: bool = False
+):
+    """
+    Extract, dedup, validate and store places from every enabled source
+    
+    Runs as a streaming pipeline over bounded queues:
+        
+        sources (concurrent) -> dedup (1 worker) -> validation (N workers) -> sheet writer (1 worker)
+    
+    Full queues apply backpressure to the stage before them, so total run
+    time approaches that of the slowest source rather than the sum of all.
+    """
     # Initialize components
-    extractor = PlaceExtractor()
-    validator = PlaceValidator()
+    extractor = PlaceExtractor(client)
+    validator = PlaceValidator(client)
     sheets = SheetsClient()
     dedup = DuplicateDetector()
     
     # Get existing places for deduplication
     existing_places = sheets.get_all_places()
+    dedup.build_index(existing_places)
     logger.info(f"Loaded {len(existing_places)} existing places")
     
     # Get sources to process
@@ -50,72 +105,155 @@ async def ingest_sources(
     logger.info(f"Processing {len(sources)} sources")
     metrics.sources_checked = len(sources)
     
-    # Process each source
-    for source in sources:
+    num_validators = config.max_concurrent_requests
+    extract_queue: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+    validate_queue: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+    
+    async def extract_source(source: SourceConfig):
+        """Stage 1: extract candidates from one source"""
         logger.info(f"Processing source: {source.name} ({source.type})")
-        
         try:
-            # Extract places
             extracts = await extractor.extract_from_source(source)
-            logger.info(f"  Extracted {len(extracts)} potential places")
-            
+            logger.info(f"  {source.name}: extracted {len(extracts)} potential places")
             for extract in extracts:
-                metrics.places_extracted += 1
-                
-                # Check for duplicates
-                duplicate_id = dedup.is_duplicate(extract, existing_places)
-                
-                if duplicate_id:
-                    logger.info(f"  Skipping duplicate: {extract.name}")
-                    continue
-                
+                await extract_queue.put(extract)
+        except Exception as e:
+            logger.error(f"Error processing source {source.name}: {e}")
+            metrics.add_error(str(e), {"source": source.name})
+    
+    async def run_extractors():
+        await asyncio.gather(*[extract_source(source) for source in sources])
+        await extract_queue.put(_DONE)
+    
+    async def dedup_worker():
+        """Stage 2: drop duplicates (single worker, so seen-state stays consistent)"""
+        while True:
+            extract = await extract_queue.get()
+            if extract is _DONE:
+                break
+            
+            metrics.places_extracted += 1
+            
+            # Check for duplicates
+            match = dedup.check(extract, existing_places)
+            
+            if match and not match.review:
+                logger.info(f"  Skipping duplicate: {extract.name}")
+                continue
+            
+            # Mark as seen and index it now, so a repeat (or the same venue from
+            # another source) still in flight isn't validated twice
+            dedup.add_seen(extract)
+            await validate_queue.put((extract, match))
+        
+        for _ in range(num_validators):
+            await validate_queue.put(_DONE)
+    
+    async def validation_worker():
+        """Stage 3: validate new places"""
+        while True:
+            item = await validate_queue.get()
+            if item is _DONE:
+                break
+            
+            extract, possible_duplicate = item
+            try:
                 # Validate new place
                 logger.info(f"  Validating: {extract.name}")
                 place, validation = await validator.validate_new_place(extract)
-                
-                metrics.places_validated += 1
-                
-                # Log extraction
-                audit.log_extraction(
+            except Exception as e:
+                logger.error(f"Error validating {extract.name}: {e}")
+                metrics.add_error(str(e), {"source": extract.source_name})
+                # A later extract of the same venue may still be validated
+                dedup.release(extract)
+                continue
+            
+            metrics.places_validated += 1
+            
+            # Nearby place with a partly similar name: keep it, but for a person to check
+            if possible_duplicate:
+                logger.info(f"  Possible duplicate of {possible_duplicate.key}: {extract.name} "
+                            f"({possible_duplicate.distance_m:.0f} m), marked for review")
+                audit.log_status_change(
                     place_id=place.place_id,
-                    source_url=str(extract.source_url),
-                    extracted_fields={
-                        "name": extract.name,
-                        "district": extract.district,
-                        "address": extract.address,
-                    }
+                    old_status=place.status.value,
+                    new_status=PlaceStatus.NEEDS_REVIEW.value,
+                    reason=f"possible duplicate of {possible_duplicate.key}",
+                    evidence_urls=[str(extract.source_url)],
                 )
-                
-                # Add to sheets (unless dry run)
-                if not dry_run:
-                    sheets.add_place(place)
-                    metrics.places_added += 1
-                    logger.info(f"  ✓ Added: {place.name} (status: {place.status.value})")
-                else:
-                    logger.info(f"  [DRY RUN] Would add: {place.name}")
-                
-                # Mark as seen
-                dedup.add_seen(extract, place.place_id)
-                
-        except Exception as e:
-            logger.error(f"Error processing source {source.name}: {e}")
-            metrics.add_error(str(e), {"source": source.name})
+                place.status = PlaceStatus.NEEDS_REVIEW
+            
+            # Log extraction
+            audit.log_extraction(
+                place_id=place.place_id,
+                source_url=str(extract.source_url),
+                extracted_fields={
+                    "name": extract.name,
+                    "district": extract.district,
+                    "address": extract.address,
+                }
+            )
+            
+            await write_queue.put((extract, place))
     
-    metrics.record_stage_end("ingestion")
-    metrics.completed_at = datetime.utcnow()
-    metrics.save()
+    async def run_validators():
+        await asyncio.gather(*[validation_worker() for _ in range(num_validators)])
+        await write_queue.put(_DONE)
     
-    logger.info(f"Ingestion complete. Added {metrics.places_added} new places.")
+    # Places handed to sheets; counted as added once their rows are written
+    buffered: List[Place] = []
     
-    return PipelineRun(
-        run_id=run_id,
-        completed_at=datetime.utcnow(),
-        stage="completed",
-        sources_checked=metrics.sources_checked,
-        places_extracted=metrics.places_extracted,
-        places_validated=metrics.places_validated,
-        places_added=metrics.places_added,
-    )
+    async def sheet_writer():
+        """Stage 4: write to sheets (single worker, buffered until the run ends)"""
+        while True:
+            item = await write_queue.get()
+            if item is _DONE:
+                break
+            
+            extract, place = item
+            
+            # Add to sheets (unless dry run)
+            if not dry_run:
+                try:
+                    await asyncio.to_thread(sheets.add_place, place)
+                except Exception as e:
+                    logger.error(f"Error adding {place.name}: {e}")
+                    metrics.add_error(str(e), {"place_id": place.place_id})
+                    dedup.release(extract)
+                    continue
+                buffered.append(place)
+            else:
+                logger.info(f"  [DRY RUN] Would add: {place.name}")
+            
+            # Mark as seen
+            dedup.add_seen(extract, place.place_id)
+    
+    # sheet_writer only buffers rows; they are appended in bulk requests below
+    appended_at_start = sheets.write_stats["rows_appended"]
+    sheets.buffering = True
+    try:
+        await asyncio.gather(
+            run_extractors(),
+            dedup_worker(),
+            run_validators(),
+            sheet_writer(),
+        )
+    finally:
+        sheets.buffering = False
+    
+    try:
+        written = await asyncio.to_thread(sheets.flush)
+        logger.info(f"Sheets: wrote {written} rows "
+                    f"({sheets.write_stats['write_requests']} write requests)")
+        for place in buffered:
+            logger.info(f"  ✓ Added: {place.name} (status: {place.status.value})")
+    except Exception as e:
+        logger.error(f"Error writing buffered rows to sheets: {e} "
+                     f"({sheets.pending_writes()} places not added)")
+        metrics.add_error(str(e), {"stage": "sheet_flush"})
+    # Rows that actually reached the sheet (some may have gone out in auto-flushes)
+    metrics.places_added += sheets.write_stats["rows_appended"] - appended_at_start
 
 
 def main():
@@ -0,0 +1,38 @@
+"""
+Text compression for SQLite blobs (cached response bodies, sheet snapshots)
+zstd when the zstandard package is installed, zlib otherwise; no side
+effects on import
+"""
+
+import zlib
+from typing import Tuple
+
+try:
+    import zstandard
+except ImportError:  # zlib is used for body compression instead
+    zstandard = None
+
+
+# Codec new bodies are written with
+BODY_CODEC = "zstd" if zstandard is not None else "zlib"
+
+
+def compress_body(text: str) -> Tuple[str, bytes]:
+    """Compress a response body, returning (codec, data)"""
+    raw = text.encode("utf-8")
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=6).compress(raw)
+    return "zlib", zlib.compress(raw, 6)
+
+
+def decompress_body(codec: str, data: bytes) -> str:
+    """Inverse of compress_body"""
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstandard is required to read zstd-compressed bodies")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "zlib":
+        raw = zlib.decompress(data)
+    else:
+        raise ValueError(f"Unsupported body codec: {codec}")
+    return raw.decode("utf-8")
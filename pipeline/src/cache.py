@@ -3,27 +3,225 @@ Cache management for HTTP responses and content hashes
 Uses SQLite for persistent cache with TTL
 """
 
+import asyncio
+import atexit
+import queue
 import sqlite3
 import hashlib
 import json
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable, List, Tuple
 from contextlib import contextmanager
 
+from .body_codec import BODY_CODEC, compress_body, decompress_body
 from .config import config
 
 
+# Statements are kept as module constants so sqlite3's per-connection
+# statement cache can reuse the prepared form on every call
+_SQL_GET = """
+    SELECT value, content_hash, created_at, expires_at
+    FROM cache
+    WHERE key = ? AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+"""
+_SQL_GET_MANY = """
+    SELECT key, value, content_hash, created_at, expires_at
+    FROM cache
+    WHERE key IN ({placeholders})
+    AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+"""
+_SQL_SET = """
+    INSERT OR REPLACE INTO cache (key, value, content_hash, expires_at, accessed_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+_SQL_TOUCH = "UPDATE cache SET accessed_at = ? WHERE key = ?"
+_SQL_GET_HASH = "SELECT content_hash FROM cache WHERE key = ?"
+_SQL_HAS_BODY = "SELECT 1 FROM blobs WHERE hash = ?"
+_SQL_GET_BODY = "SELECT codec, data FROM blobs WHERE hash = ?"
+_SQL_SET_BODY = """
+    INSERT OR IGNORE INTO blobs (hash, codec, data, raw_size, stored_size)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# SQLite's default limit on host parameters is 999
+_MAX_BATCH_PARAMS = 500
+
+# Access timestamps are buffered and written in batches of this size
+_TOUCH_FLUSH_SIZE = 512
+
+# Bodies younger than this are never garbage collected, so a body queued
+# just before its URL entry can't be dropped in between
+_BODY_GC_GRACE = "-10 minutes"
+
+# Sentinel telling the AsyncCache writer thread to exit
+_STOP = object()
+# Sentinel asking the writer thread to write buffered access times
+_FLUSH_TOUCHES = object()
+
+# Queued body write for the AsyncCache writer thread
+_BodyWrite = namedtuple("_BodyWrite", ["key", "body_hash", "text"])
+
+# Bumped whenever _migrate learns a new step
+SCHEMA_VERSION = 2
+
+
+def _body_key(body_hash: str) -> str:
+    """Memory-tier key for a response body"""
+    return f"blob:{body_hash}"
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a TIMESTAMP column value (either ISO or CURRENT_TIMESTAMP format)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class MemoryCache:
+    """
+    In-process LRU tier kept in front of the SQLite cache
+    Bounded by entry count and by total serialised size; entries past their
+    expires_at are dropped when read
+    """
+    
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int, Optional[datetime]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry, refreshing its LRU position"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            
+            entry, _, expires_at = item
+            if expires_at is not None and expires_at <= datetime.utcnow():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key: str, entry: Dict[str, Any], size: int):
+        """Add or replace an entry, evicting least recently used ones to fit"""
+        with self._lock:
+            self._remove(key)
+            
+            # Never let a single huge page flush the whole tier
+            if size > self.max_bytes or self.max_entries <= 0:
+                return
+            
+            self._entries[key] = (entry, size, _parse_timestamp(entry.get("expires_at")))
+            self._bytes += size
+            
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+    
+    def discard(self, key: str):
+        """Remove an entry if present"""
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def _remove(self, key: str):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get tier statistics"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
 class Cache:
-    """SQLite-based cache with TTL support"""
+    """
+    SQLite-based cache with TTL support
+    
+    Connections are pooled per thread and stay open for the lifetime of the
+    cache. The database runs in WAL mode with synchronous=NORMAL, so readers
+    don't block the writer and commits don't fsync on every write.
+    
+    Reads go through an in-process LRU tier (`memory`) first, so keys read
+    repeatedly within a run are only parsed from SQLite once.
+    
+    The database is kept within a size budget (CACHE_MAX_MB / CACHE_MAX_ROWS):
+    every CACHE_MAINTENANCE_MINUTES a write triggers `prune()`, which drops
+    expired entries, evicts least recently accessed ones until the budget is
+    met, and returns freed pages with an incremental vacuum.
+    """
     
     def __init__(self, db_name: str = "pipeline_cache.db"):
         self.db_path = config.cache_dir / db_name
+        self._local = threading.local()
+        self._pool: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
         self._init_db()
+        
+        self.memory = MemoryCache(
+            max_entries=config.cache_memory_max_entries,
+            max_bytes=config.cache_memory_max_mb * 1024 * 1024,
+        )
+        
+        # SQLite tier counters (memory tier keeps its own)
+        self.db_hits = 0
+        self.db_misses = 0
+        
+        # Buffered last-access times (key -> unix time), see _touch
+        self._touched: Dict[str, float] = {}
+        self._touch_lock = threading.Lock()
+        
+        # Maintenance runs on the first write of a process, then periodically
+        self._maintenance_lock = threading.Lock()
+        self._last_maintenance = 0.0
     
     def _init_db(self):
         """Initialize database schema"""
         with self._get_connection() as conn:
+            # Only takes effect on a brand-new file; _migrate converts old ones
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL is persistent - it only needs to be set once per database file
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache (
                     key TEXT PRIMARY KEY,
@@ -40,38 +238,238 @@ class Cache:
             """)
             
             conn.commit()
+            
+            self._migrate(conn)
+    
+    def _migrate(self, conn: sqlite3.Connection):
+        """Bring an existing database up to SCHEMA_VERSION"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        if version < 1:
+            # v1: response bodies move out of cache.value into a compressed,
+            # content-addressed blob table shared by every URL that serves them
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS blobs (
+                        hash TEXT PRIMARY KEY,
+                        codec TEXT NOT NULL,
+                        data BLOB NOT NULL,
+                        raw_size INTEGER NOT NULL,
+                        stored_size INTEGER NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                rows = conn.execute(
+                    "SELECT key, value FROM cache WHERE key LIKE 'http:get:%'"
+                ).fetchall()
+                for row in rows:
+                    value = json.loads(row["value"])
+                    if not isinstance(value, dict) or "text" not in value:
+                        continue
+                    
+                    text = value.pop("text")
+                    body_hash = compute_content_hash(text)
+                    self._insert_body(conn, body_hash, text)
+                    value["body_hash"] = body_hash
+                    conn.execute(
+                        "UPDATE cache SET value = ?, content_hash = ? WHERE key = ?",
+                        (json.dumps(value), body_hash, row["key"])
+                    )
+                
+                conn.execute("PRAGMA user_version = 1")
+            
+            if rows:
+                print(f"Cache migrated {len(rows)} responses to blob storage")
+        
+        if version < 2:
+            # v2: last-access tracking for LRU eviction
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(cache)")}
+            with conn:
+                if "accessed_at" not in columns:
+                    conn.execute("ALTER TABLE cache ADD COLUMN accessed_at TIMESTAMP")
+                    conn.execute("UPDATE cache SET accessed_at = created_at")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_accessed ON cache(accessed_at)"
+                )
+                conn.execute("PRAGMA user_version = 2")
+            
+            # auto_vacuum can only be switched on by rebuilding the file
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new pooled connection for the current thread"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=128,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        
+        with self._pool_lock:
+            self._pool.append(conn)
+        return conn
     
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper row factory"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get this thread's pooled database connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        yield conn
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._pool_lock:
+            for conn in self._pool:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._pool = []
+        self._local = threading.local()
+    
+    def _row_to_entry(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a cache row to the public entry format"""
+        return {
+            "value": json.loads(row["value"]),
+            "content_hash": row["content_hash"],
+            "created_at": row["created_at"],
+            "expires_at": row["expires_at"],
+        }
+    
+    def _build_row(
+        self,
+        key: str,
+        value: Any,
+        content_hash: Optional[str] = None,
+        ttl_hours: Optional[int] = None
+    ) -> Tuple[str, str, Optional[str], str]:
+        """Serialise an entry into the tuple written by _write_rows"""
+        ttl_hours = ttl_hours or config.cache_ttl_hours
+        expires_at = datetime.utcnow() + timedelta(hours=ttl_hours)
+        # Same format as CURRENT_TIMESTAMP so expiry compares correctly
+        return (key, json.dumps(value), content_hash, expires_at.isoformat(sep=" "))
+    
+    def _write_rows(self, rows: List[Tuple[str, str, Optional[str], str]]):
+        """Write pre-serialised rows in a single transaction"""
+        if not rows:
+            return
+        
+        with self._get_connection() as conn:
+            with conn:
+                conn.executemany(_SQL_SET, rows)
+    
+    def _insert_body(self, conn: sqlite3.Connection, body_hash: str, text: str):
+        """Compress and insert a body unless it is already stored"""
+        if conn.execute(_SQL_HAS_BODY, (body_hash,)).fetchone():
+            return
+        codec, data = compress_body(text)
+        conn.execute(
+            _SQL_SET_BODY,
+            (body_hash, codec, data, len(text.encode("utf-8")), len(data))
+        )
+    
+    def _store(
+        self,
+        items: List[Tuple[str, Any, Optional[str], Optional[int]]],
+        bodies: Optional[Dict[str, str]] = None
+    ):
+        """
+        Write (key, value, content_hash, ttl_hours) items and any
+        body_hash -> text bodies in one transaction, and remember them in
+        the memory tier
+        """
+        bodies = bodies or {}
+        rows = [self._build_row(*item) for item in items]
+        
+        if bodies:
+            with self._get_connection() as conn:
+                with conn:
+                    for body_hash, text in bodies.items():
+                        self._insert_body(conn, body_hash, text)
+                    conn.executemany(_SQL_SET, rows)
+        else:
+            self._write_rows(rows)
+        
+        for body_hash, text in bodies.items():
+            self.memory.put(_body_key(body_hash), {
+                "value": text,
+                "content_hash": body_hash,
+                "created_at": None,
+                "expires_at": None,
+            }, len(text))
+        
+        self._maybe_maintain()
+        
+        created_at = datetime.utcnow().isoformat(sep=" ", timespec="seconds")
+        for (key, value, content_hash, _), row in zip(items, rows):
+            self.memory.put(key, {
+                "value": value,
+                "content_hash": content_hash,
+                "created_at": created_at,
+                "expires_at": row[3],
+            }, len(row[1]))
+    
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry from SQLite and promote it to the memory tier"""
+        with self._get_connection() as conn:
+            row = conn.execute(_SQL_GET, (key,)).fetchone()
+        
+        if row is None:
+            self.db_misses += 1
+            return None
+        
+        self.db_hits += 1
+        self._touch(key)
+        entry = self._row_to_entry(row)
+        self.memory.put(key, entry, len(row["value"]))
+        return entry
     
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get value from cache if not expired"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            self._touch(key)
+            return entry
+        return self._load(key)
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several values at once
+        Returns a dict of key -> entry containing only the keys that were found
+        """
+        results = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self.memory.get(key)
+            if entry is not None:
+                results[key] = entry
+            else:
+                missing.append(key)
+        
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT value, content_hash, created_at, expires_at
-                FROM cache
-                WHERE key = ? AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
-                """,
-                (key,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                return {
-                    "value": json.loads(row["value"]),
-                    "content_hash": row["content_hash"],
-                    "created_at": row["created_at"],
-                    "expires_at": row["expires_at"],
-                }
-        return None
+            for i in range(0, len(missing), _MAX_BATCH_PARAMS):
+                chunk = missing[i:i + _MAX_BATCH_PARAMS]
+                sql = _SQL_GET_MANY.format(placeholders=",".join("?" * len(chunk)))
+                for row in conn.execute(sql, chunk):
+                    entry = self._row_to_entry(row)
+                    self.memory.put(row["key"], entry, len(row["value"]))
+                    results[row["key"]] = entry
+        
+        for key in results:
+            self._touch(key)
+        
+        found = sum(1 for key in missing if key in results)
+        self.db_hits += found
+        self.db_misses += len(missing) - found
+        return results
     
     def set(
         self,
@@ -81,27 +479,63 @@ class Cache:
         ttl_hours: Optional[int] = None
     ):
         """Set value in cache with optional TTL"""
-        ttl_hours = ttl_hours or config.cache_ttl_hours
-        expires_at = datetime.utcnow() + timedelta(hours=ttl_hours)
+        self._store([(key, value, content_hash, ttl_hours)])
+    
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        content_hashes: Optional[Dict[str, str]] = None,
+        ttl_hours: Optional[int] = None
+    ):
+        """Set several values in a single transaction"""
+        content_hashes = content_hashes or {}
+        self._store([
+            (key, value, content_hashes.get(key), ttl_hours)
+            for key, value in items.items()
+        ])
+    
+    def put_body(self, text: str) -> str:
+        """
+        Store a response body once, compressed and keyed by its content hash
+        Returns the hash to reference from cache values
+        """
+        body_hash = compute_content_hash(text)
+        self._store([], {body_hash: text})
+        return body_hash
+    
+    def get_body(self, body_hash: str) -> Optional[str]:
+        """Get a stored response body by its content hash"""
+        entry = self.memory.get(_body_key(body_hash))
+        if entry is not None:
+            return entry["value"]
         
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO cache (key, value, content_hash, expires_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (key, json.dumps(value), content_hash, expires_at.isoformat())
-            )
-            conn.commit()
+            row = conn.execute(_SQL_GET_BODY, (body_hash,)).fetchone()
+        if row is None:
+            return None
+        
+        try:
+            text = decompress_body(row["codec"], row["data"])
+        except (ValueError, zlib.error) as e:
+            print(f"Cache body {body_hash[:12]} unreadable: {e}")
+            return None
+        
+        self.memory.put(_body_key(body_hash), {
+            "value": text,
+            "content_hash": body_hash,
+            "created_at": None,
+            "expires_at": None,
+        }, len(text))
+        return text
     
     def get_content_hash(self, key: str) -> Optional[str]:
         """Get just the content hash for a key"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry["content_hash"]
+        
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT content_hash FROM cache WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_HASH, (key,)).fetchone()
             return row["content_hash"] if row else None
     
     def has_hash_changed(self, key: str, new_hash: str) -> bool:
@@ -111,35 +545,435 @@ class Cache:
             return True  # No previous hash = changed
         return old_hash != new_hash
     
+    def _touch(self, key: str):
+        """
+        Record an access for LRU eviction
+        Timestamps are buffered and written in batches to keep reads cheap
+        """
+        if self._buffer_touch(key):
+            self._flush_touches()
+    
+    def _buffer_touch(self, key: str) -> bool:
+        """Buffer an access time; returns True once the buffer should be written"""
+        with self._touch_lock:
+            self._touched[key] = time.time()
+            return len(self._touched) >= _TOUCH_FLUSH_SIZE
+    
+    def _flush_touches(self):
+        """Write buffered access timestamps"""
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        if not touched:
+            return
+        
+        rows = [
+            (datetime.utcfromtimestamp(ts).isoformat(sep=" ", timespec="seconds"), key)
+            for key, ts in touched.items()
+        ]
+        with self._get_connection() as conn:
+            with conn:
+                conn.executemany(_SQL_TOUCH, rows)
+    
+    def _delete_orphan_bodies(self, conn: sqlite3.Connection) -> int:
+        """Drop bodies no longer referenced by any entry"""
+        cursor = conn.execute(f"""
+            DELETE FROM blobs
+            WHERE created_at < datetime('now', '{_BODY_GC_GRACE}')
+            AND hash NOT IN (
+                SELECT content_hash FROM cache WHERE content_hash IS NOT NULL
+            )
+        """)
+        return cursor.rowcount
+    
+    def _data_bytes(self, conn: sqlite3.Connection) -> int:
+        """Bytes held by entry values and stored bodies"""
+        return conn.execute("""
+            SELECT (SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache)
+                 + (SELECT COALESCE(SUM(stored_size), 0) FROM blobs)
+        """).fetchone()[0]
+    
     def cleanup(self):
         """Remove expired entries"""
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM cache WHERE expires_at < CURRENT_TIMESTAMP"
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM cache WHERE expires_at < CURRENT_TIMESTAMP"
+                )
+                self._delete_orphan_bodies(conn)
+            return cursor.rowcount
+    
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        max_rows: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Enforce the size budget
+        Removes expired entries, then evicts least recently accessed entries
+        until both the row and byte budgets are met
+        """
+        if max_bytes is None:
+            max_bytes = config.cache_max_mb * 1024 * 1024
+        if max_rows is None:
+            max_rows = config.cache_max_rows
+        
+        self._flush_touches()
+        result = {"expired": self.cleanup(), "evicted": 0, "bodies_removed": 0}
+        
+        with self._get_connection() as conn:
+            with conn:
+                rows = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+                if rows > max_rows:
+                    result["evicted"] += self._evict_lru(conn, rows - max_rows)
+                    rows = max_rows
+                
+                # Evict in 10% slices until the byte budget is met
+                while rows > 0 and self._data_bytes(conn) > max_bytes:
+                    evicted = self._evict_lru(conn, max(1, rows // 10))
+                    result["bodies_removed"] += self._delete_orphan_bodies(conn)
+                    result["evicted"] += evicted
+                    rows -= evicted
+                    if not evicted:
+                        break
+                
+                result["bodies_removed"] += self._delete_orphan_bodies(conn)
+        
+        result["bytes_freed"] = self.vacuum()
+        return result
+    
+    def _evict_lru(self, conn: sqlite3.Connection, count: int) -> int:
+        """Delete the `count` least recently accessed entries"""
+        cursor = conn.execute("""
+            DELETE FROM cache WHERE key IN (
+                SELECT key FROM cache ORDER BY accessed_at LIMIT ?
             )
+        """, (count,))
+        return cursor.rowcount
+    
+    def vacuum(self, full: bool = False) -> int:
+        """
+        Return free pages to the filesystem
+        Incremental by default; `full=True` rebuilds the whole file
+        Returns bytes freed
+        """
+        with self._get_connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            before = conn.execute("PRAGMA page_count").fetchone()[0]
+            
             conn.commit()
-            return cursor.rowcount
+            if full:
+                conn.execute("VACUUM")
+            else:
+                # executescript steps the pragma to completion; a plain
+                # execute() only frees a single page
+                conn.executescript("PRAGMA incremental_vacuum;")
+            
+            after = conn.execute("PRAGMA page_count").fetchone()[0]
+            return (before - after) * page_size
+    
+    def _maybe_maintain(self):
+        """Run prune() if the maintenance interval has elapsed"""
+        now = time.monotonic()
+        if now - self._last_maintenance < config.cache_maintenance_minutes * 60:
+            return
+        if not self._maintenance_lock.acquire(blocking=False):
+            return  # Another thread is already on it
+        
+        try:
+            self._last_maintenance = now
+            self.prune()
+        except sqlite3.Error as e:
+            print(f"Cache maintenance failed: {e}")
+        finally:
+            self._maintenance_lock.release()
     
     def clear(self):
         """Clear all cache entries"""
+        self.memory.clear()
         with self._get_connection() as conn:
-            conn.execute("DELETE FROM cache")
-            conn.commit()
+            with conn:
+                conn.execute("DELETE FROM cache")
+                conn.execute("DELETE FROM blobs")
     
-    def get_stats(self) -> Dict[str, int]:
-        """Get cache statistics"""
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including hit/miss counters per tier"""
         with self._get_connection() as conn:
             total = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
             expired = conn.execute(
                 "SELECT COUNT(*) FROM cache WHERE expires_at < CURRENT_TIMESTAMP"
             ).fetchone()[0]
+            value_bytes = conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache"
+            ).fetchone()[0]
+            blob_count, raw_bytes, stored_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
             return {
                 "total_entries": total,
                 "expired_entries": expired,
                 "valid_entries": total - expired,
+                "pooled_connections": len(self._pool),
+                "size": {
+                    "db_file_bytes": page_count * page_size,
+                    "free_bytes": freelist * page_size,
+                    "max_bytes": config.cache_max_mb * 1024 * 1024,
+                    "max_rows": config.cache_max_rows,
+                    "value_bytes": value_bytes,
+                    "body_count": blob_count,
+                    "body_raw_bytes": raw_bytes,
+                    "body_stored_bytes": stored_bytes,
+                    "body_compression_ratio": (
+                        round(raw_bytes / stored_bytes, 2) if stored_bytes else None
+                    ),
+                    "body_codec": BODY_CODEC,
+                },
+                "tiers": {
+                    "memory": self.memory.get_stats(),
+                    "sqlite": {
+                        "hits": self.db_hits,
+                        "misses": self.db_misses,
+                    },
+                },
             }
 
 
+class AsyncCache:
+    """
+    Awaitable facade over Cache for use inside the event loop
+    
+    Reads run on the default executor (each worker thread gets its own pooled
+    connection). Writes are handed to a dedicated writer thread through a
+    queue; the writer serialises values off the event loop and coalesces
+    everything that arrives within `flush_interval` into one group commit.
+    Entries waiting to be written are served from memory, so a `get` right
+    after a `set` always sees the new value.
+    """
+    
+    def __init__(
+        self,
+        backend: Cache,
+        max_batch: int = 200,
+        flush_interval: float = 0.05
+    ):
+        self.backend = backend
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: Dict[str, Tuple[tuple, Dict[str, Any]]] = {}
+        self._pending_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Set while a _FLUSH_TOUCHES request waits in the queue
+        self._touch_flush_queued = threading.Event()
+    
+    def _ensure_writer(self):
+        """Start the writer thread on first use"""
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="cache-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+    
+    def _writer_loop(self):
+        """Drain the write queue, committing coalesced batches"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            
+            batch: Dict[str, tuple] = {}
+            bodies: Dict[str, str] = {}
+            waiters: List[threading.Event] = []
+            stop = False
+            flush_touches = False
+            deadline = time.monotonic() + self.flush_interval
+            
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif item is _STOP:
+                    stop = True
+                    break
+                elif item is _FLUSH_TOUCHES:
+                    flush_touches = True
+                elif isinstance(item, _BodyWrite):
+                    bodies[item.body_hash] = item.text
+                    batch[item.key] = item
+                else:
+                    # Last write for a key wins within a batch
+                    batch[item[0]] = item
+                
+                if waiters or len(batch) >= self.max_batch:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            
+            self._commit(list(batch.values()), bodies)
+            if flush_touches:
+                self._flush_touches()
+            for event in waiters:
+                event.set()
+            if stop:
+                return
+    
+    def _commit(self, items: List[tuple], bodies: Dict[str, str]):
+        """Serialise and write a batch, then release it from the pending map"""
+        if not items:
+            return
+        
+        try:
+            self.backend._store(
+                [item for item in items if not isinstance(item, _BodyWrite)],
+                bodies
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Cache write failed ({len(items)} entries): {e}")
+        finally:
+            with self._pending_lock:
+                for item in items:
+                    pending = self._pending.get(item[0])
+                    if pending is not None and pending[0] is item:
+                        del self._pending[item[0]]
+    
+    def _flush_touches(self):
+        """Write buffered access times (writer thread)"""
+        self._touch_flush_queued.clear()
+        try:
+            self.backend._flush_touches()
+        except sqlite3.Error as e:
+            print(f"Cache access-time write failed: {e}")
+    
+    def _get_pending(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a queued-but-uncommitted entry, if any"""
+        with self._pending_lock:
+            pending = self._pending.get(key)
+        return pending[1] if pending else None
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get value from cache if not expired"""
+        pending = self._get_pending(key)
+        if pending is not None:
+            return pending
+        
+        # Memory tier hits are cheap enough to serve without a thread hop;
+        # a full access-time buffer is written by the writer thread, not here
+        entry = self.backend.memory.get(key)
+        if entry is not None:
+            if self.backend._buffer_touch(key) and not self._touch_flush_queued.is_set():
+                self._touch_flush_queued.set()
+                self._ensure_writer()
+                self._queue.put(_FLUSH_TOUCHES)
+            return entry
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.backend._load, key)
+    
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        content_hash: Optional[str] = None,
+        ttl_hours: Optional[int] = None
+    ):
+        """Queue a value for writing; returns without waiting for the commit"""
+        item = (key, value, content_hash, ttl_hours)
+        entry = {
+            "value": value,
+            "content_hash": content_hash,
+            "created_at": None,
+            "expires_at": None,
+        }
+        with self._pending_lock:
+            self._pending[key] = (item, entry)
+        
+        self._ensure_writer()
+        self._queue.put(item)
+    
+    async def put_body(self, text: str, body_hash: Optional[str] = None) -> str:
+        """
+        Queue a response body for compressed, content-addressed storage
+        Returns its hash immediately; pass `body_hash` if already computed
+        """
+        body_hash = body_hash or compute_content_hash(text)
+        item = _BodyWrite(_body_key(body_hash), body_hash, text)
+        entry = {
+            "value": text,
+            "content_hash": body_hash,
+            "created_at": None,
+            "expires_at": None,
+        }
+        with self._pending_lock:
+            self._pending[item.key] = (item, entry)
+        
+        self._ensure_writer()
+        self._queue.put(item)
+        return body_hash
+    
+    async def get_body(self, body_hash: str) -> Optional[str]:
+        """Get a stored response body by its content hash"""
+        pending = self._get_pending(_body_key(body_hash))
+        if pending is not None:
+            return pending["value"]
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.backend.get_body, body_hash)
+    
+    async def get_content_hash(self, key: str) -> Optional[str]:
+        """Get just the content hash for a key"""
+        pending = self._get_pending(key)
+        if pending is not None:
+            return pending["content_hash"]
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.backend.get_content_hash, key)
+    
+    async def has_hash_changed(self, key: str, new_hash: str) -> bool:
+        """Check if content hash has changed"""
+        old_hash = await self.get_content_hash(key)
+        if old_hash is None:
+            return True  # No previous hash = changed
+        return old_hash != new_hash
+    
+    def flush_sync(self, timeout: Optional[float] = None):
+        """Block until everything queued so far has been committed"""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        event = threading.Event()
+        self._queue.put(event)
+        event.wait(timeout)
+    
+    async def flush(self):
+        """Wait until everything queued so far has been committed"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.flush_sync)
+    
+    def close(self):
+        """Flush pending writes and stop the writer thread"""
+        with self._writer_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join()
+        
+        try:
+            self.backend._flush_touches()
+        except sqlite3.Error:
+            pass
+
+
 def compute_content_hash(content: str, algorithm: str = "sha256") -> str:
     """Compute hash of content for change detection"""
     if algorithm == "sha256":
@@ -164,5 +998,9 @@ def compute_partial_hash(content: str, selectors: list = None) -> str:
     return compute_content_hash(content)
 
 
-# Global cache instance
+# Global cache instances
 cache = Cache()
+async_cache = AsyncCache(cache)
+
+# Don't lose queued writes when the process exits
+atexit.register(async_cache.close)
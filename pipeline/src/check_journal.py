@@ -0,0 +1,91 @@
+"""
+Checkpoint journal for freshness runs
+One append-only JSONL file per run_id (logs/checkpoint_<run_id>.jsonl):
+- "start": a run (or a resume of it) began
+- "checked": a place's check finished, with the updated place when its
+  sheet row is due to be written
+- "complete": the run's buffered sheet writes were flushed
+
+`check --resume <run_id>` skips every place already checked and writes
+the rows checked since the last "complete" in one bulk batch
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from .config import config
+from .models import Place
+
+
+class CheckJournal:
+    """Append-only record of one freshness run"""
+    
+    def __init__(self, run_id: str, logs_dir: Optional[Path] = None):
+        self.run_id = run_id
+        self.path = (logs_dir or config.logs_dir) / f"checkpoint_{run_id}.jsonl"
+    
+    def exists(self) -> bool:
+        return self.path.exists()
+    
+    def _append(self, entry: Dict[str, Any]):
+        entry = dict(entry, timestamp=datetime.utcnow().isoformat(), run_id=self.run_id)
+        # Written immediately, so a killed run loses at most the check in flight
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+    
+    def log_start(self, due: int, dry_run: bool = False, resumed: bool = False):
+        self._append({"type": "start", "due": due, "dry_run": dry_run, "resumed": resumed})
+    
+    def log_checked(self, place: Place, outcome: str, write: bool):
+        """A finished check; `write` = the place's sheet row is pending"""
+        entry = {"type": "checked", "place_id": place.place_id, "outcome": outcome, "write": write}
+        if write:
+            entry["place"] = place.model_dump(mode="json")
+        self._append(entry)
+    
+    def log_complete(self, stats: Dict[str, Any]):
+        self._append({"type": "complete", "stats": {
+            key: value for key, value in stats.items() if not isinstance(value, dict)
+        }})
+    
+    def entries(self) -> List[Dict[str, Any]]:
+        """Every readable entry (a line cut off by a crash is skipped)"""
+        if not self.path.exists():
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        return entries
+    
+    def completed(self) -> Dict[str, str]:
+        """place_id -> outcome of every place already checked in this run (errors are retried)"""
+        return {
+            entry["place_id"]: entry["outcome"]
+            for entry in self.entries()
+            if entry.get("type") == "checked" and entry.get("outcome") != "errors"
+        }
+    
+    def pending_writes(self) -> List[Place]:
+        """Places checked since the last flushed batch, latest version of each"""
+        pending: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries():
+            if entry.get("type") == "complete":
+                pending.clear()
+            elif entry.get("type") == "checked" and entry.get("write"):
+                pending[entry["place_id"]] = entry["place"]
+        
+        places = []
+        for place_id, data in pending.items():
+            try:
+                places.append(Place.model_validate(data))
+            except ValidationError as e:
+                print(f"  ⚠️ Skipping unreadable checkpoint for {place_id}: {e}")
+        return places
@@ -0,0 +1,116 @@
+"""
+Scheduling for freshness checks
+- next_check_time(): the tier's interval, +/- FRESHNESS_JITTER of it, so
+  places checked on the same day don't all come due again on the same day
+- spread_check_time(): a stable point inside the next interval, for
+  rescheduling every place at once without creating a spike
+- CheckQueue: due places ordered by risk tier and how overdue they are
+- RunBudget: per-run wall-clock / HTTP request limits
+"""
+
+import hashlib
+import heapq
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from .config import config
+from .models import Place, RiskTier
+
+# Queue weight per tier: a high-risk place that just came due goes before a
+# low-risk one, until the low-risk one is a couple of intervals overdue
+TIER_WEIGHTS = {
+    RiskTier.HIGH: 3,
+    RiskTier.MEDIUM: 2,
+    RiskTier.LOW: 1,
+}
+
+
+def check_interval_days(risk_tier: RiskTier) -> int:
+    """Days between checks for a risk tier"""
+    if risk_tier == RiskTier.HIGH:
+        return config.risk_tier_high_days
+    elif risk_tier == RiskTier.MEDIUM:
+        return config.risk_tier_medium_days
+    return config.risk_tier_low_days
+
+
+def next_check_time(
+    risk_tier: RiskTier,
+    now: Optional[datetime] = None,
+    rng: Optional[random.Random] = None,
+) -> datetime:
+    """now + the tier's interval, jittered by +/- FRESHNESS_JITTER of it"""
+    now = now or datetime.utcnow()
+    jitter = (rng or random).uniform(-config.freshness_jitter, config.freshness_jitter)
+    return now + timedelta(days=check_interval_days(risk_tier) * (1 + jitter))
+
+
+def spread_check_time(place_id: str, risk_tier: RiskTier, now: Optional[datetime] = None) -> datetime:
+    """
+    A point inside the next interval derived from place_id, so rescheduling
+    everything at once spreads the checks evenly (and re-running it doesn't
+    move them again)
+    """
+    now = now or datetime.utcnow()
+    fraction = int(hashlib.sha1(place_id.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+    return now + timedelta(days=check_interval_days(risk_tier) * fraction)
+
+
+def check_priority(place: Place, now: datetime) -> float:
+    """Tier weight x (1 + intervals overdue); higher goes first"""
+    interval = timedelta(days=max(check_interval_days(place.risk_tier), 1))
+    overdue = now - place.next_check_at if place.next_check_at else interval
+    return TIER_WEIGHTS.get(place.risk_tier, 1) * (1 + max(overdue, timedelta(0)) / interval)
+
+
+class CheckQueue:
+    """Due places, highest priority first (ties keep sheet order)"""
+    
+    def __init__(self, places: List[Place], now: Optional[datetime] = None):
+        now = now or datetime.utcnow()
+        self._heap = [(-check_priority(place, now), i, place) for i, place in enumerate(places)]
+        heapq.heapify(self._heap)
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def pop(self) -> Optional[Place]:
+        return heapq.heappop(self._heap)[2] if self._heap else None
+    
+    def remaining(self) -> List[Place]:
+        """Places not popped yet, in queue order"""
+        return [place for _, _, place in sorted(self._heap)]
+
+
+class RunBudget:
+    """
+    Limits for one run: stop starting checks after max_seconds, or once
+    max_requests HTTP requests were made (0 = no limit)
+    """
+    
+    def __init__(self, max_seconds: float = 0, max_requests: int = 0, requests_made: Optional[Callable[[], int]] = None):
+        self.started = time.monotonic()
+        self.deadline = self.started + max_seconds if max_seconds else None
+        self.max_requests = max_requests
+        self.requests_made = requests_made or (lambda: 0)
+        self.requests_at_start = self.requests_made()
+    
+    @property
+    def requests_used(self) -> int:
+        return self.requests_made() - self.requests_at_start
+    
+    def remaining_seconds(self) -> Optional[float]:
+        """Seconds left before the deadline (None = no time limit)"""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+    
+    def exhausted(self) -> Optional[str]:
+        """Which limit was reached ("time" / "requests"), or None"""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "time"
+        if self.max_requests and self.requests_used >= self.max_requests:
+            return "requests"
+        return None
@@ -7,16 +7,14 @@ Commands:
   check       Run freshness check on existing places
   export      Export clean data to JSON
   validate    Validate a specific place
+  cache       Inspect and maintain the HTTP cache
+  search      Search exported places via the static search index
 """
 
 import sys
+import json
 import argparse
 
-# Import command modules
-from .ingest_sources import main as ingest_main
-from .freshness_check import main as check_main
-from .export_json import main as export_main
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -26,7 +24,10 @@ def main():
 Examples:
   python -m pipeline ingest --dry-run
   python -m pipeline check --dry-run
+  python -m pipeline check --resume 1a2b3c4d
   python -m pipeline export --compare
+  python -m pipeline cache stats
+  python -m pipeline search 親子 公園
         """
     )
     
@@ -61,6 +62,21 @@ Examples:
         "--export-flagged",
         help="Export flagged places to CSV file"
     )
+    check_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continue an interrupted run from its checkpoint journal"
+    )
+    check_parser.add_argument(
+        "--max-minutes",
+        type=float,
+        help="Stop starting checks after this long"
+    )
+    check_parser.add_argument(
+        "--max-requests",
+        type=int,
+        help="Stop starting checks after this many HTTP requests"
+    )
     
     # Export command
     export_parser = subparsers.add_parser(
@@ -98,6 +114,59 @@ Examples:
         action="store_true",
         help="Compare with existing file"
     )
+    export_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild every record instead of an incremental export"
+    )
+    export_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write minified JSON instead of indent=2"
+    )
+    
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Inspect and maintain the HTTP cache"
+    )
+    cache_parser.add_argument(
+        "action",
+        choices=["stats", "prune", "vacuum"],
+        help="stats: show sizes and hit rates; prune: enforce size budget; vacuum: reclaim free pages"
+    )
+    cache_parser.add_argument(
+        "--max-mb",
+        type=int,
+        help="Byte budget for prune (default CACHE_MAX_MB)"
+    )
+    cache_parser.add_argument(
+        "--max-rows",
+        type=int,
+        help="Row budget for prune (default CACHE_MAX_ROWS)"
+    )
+    cache_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild the whole file instead of an incremental vacuum"
+    )
+    
+    # Search command
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search exported places (uses the index written by export)"
+    )
+    search_parser.add_argument(
+        "query",
+        nargs="+",
+        help="Chinese text and/or English word prefixes"
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum results (0 = all)"
+    )
     
     args = parser.parse_args()
     
@@ -105,19 +174,77 @@ Examples:
         parser.print_help()
         sys.exit(1)
     
-    # Route to appropriate command
+    # Route to appropriate command (modules are imported lazily so that
+    # e.g. `cache stats` doesn't need Sheets credentials)
     if args.command == "ingest":
+        from .__main__ import main as ingest_main
         sys.argv = [sys.argv[0]] + sys.argv[2:]  # Remove 'ingest' from args
         ingest_main()
     elif args.command == "check":
-        # TODO: Implement check_main
-        print("Freshness check not yet implemented")
+        from .freshness_check import main as check_main
+        sys.argv = [sys.argv[0]] + sys.argv[2:]  # Remove 'check' from args
+        check_main()
     elif args.command == "export":
+        from .export_json import main as export_main
         sys.argv = [sys.argv[0]] + sys.argv[2:]  # Remove 'export' from args
         export_main()
+    elif args.command == "cache":
+        cache_command(args)
+    elif args.command == "search":
+        search_command(args)
     else:
         parser.print_help()
 
 
+def cache_command(args):
+    """Run a cache subcommand"""
+    from .cache import cache
+    
+    if args.action == "stats":
+        print(json.dumps(cache.get_stats(), indent=2))
+    elif args.action == "prune":
+        result = cache.prune(
+            max_bytes=args.max_mb * 1024 * 1024 if args.max_mb else None,
+            max_rows=args.max_rows,
+        )
+        print(f"Expired removed: {result['expired']}")
+        print(f"Evicted (LRU): {result['evicted']}")
+        print(f"Bodies removed: {result['bodies_removed']}")
+        print(f"Bytes freed: {result['bytes_freed']}")
+    elif args.action == "vacuum":
+        freed = cache.vacuum(full=args.full)
+        print(f"Bytes freed: {freed}")
+
+
+def search_command(args):
+    """Query the exported search index"""
+    import time
+    from pathlib import Path
+    from .config import config
+    from .export_payload import search_path
+    from .search_index import SearchIndex
+    
+    output_path = Path(config.export.output_path)
+    index_path = search_path(output_path)
+    if not index_path.exists():
+        print(f"No search index at {index_path} - run `python -m pipeline export` first")
+        sys.exit(1)
+    
+    index = SearchIndex.load(index_path)
+    with open(output_path, 'r', encoding='utf-8') as f:
+        locations = json.load(f).get("locations", [])
+    
+    query = " ".join(args.query)
+    start = time.perf_counter()
+    results = index.search(query, limit=args.limit or None)
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    for position, score in results:
+        location = locations[position]
+        name_en = f" ({location['nameEn']})" if location.get("nameEn") else ""
+        print(f"{score:3d}  {location.get('name', '')}{name_en} - {location.get('district', '')}")
+    print(f"\n{len(results)} results for \"{query}\" in {elapsed:.3f} ms")
+
+
 if __name__ == "__main__":
     main()
@@ -43,6 +43,35 @@ class ValidationConfig:
     llm_temperature: float = 0.1
 
 
+@dataclass
+class HostLimit:
+    """Rate and concurrency limit for one host"""
+    requests_per_minute: int = 30
+    max_concurrent: int = 2
+
+
+@dataclass
+class HttpConfig:
+    """Configuration for the HTTP client"""
+    # Defaults applied to every host without its own entry in `hosts`
+    default_limit: HostLimit = None
+    hosts: Dict[str, HostLimit] = None
+    
+    # Connection pool
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    
+    def limit_for(self, host: str) -> HostLimit:
+        """Get the limit for a host (entries also match subdomains)"""
+        host = host.lower()
+        for name, limit in (self.hosts or {}).items():
+            if host == name or host.endswith("." + name):
+                return limit
+        return self.default_limit
+
+
 @dataclass
 class ExportConfig:
     """Configuration for export"""
@@ -51,6 +80,7 @@ class ExportConfig:
     git_auto_commit: bool = False
     git_commit_message: str = "Update locations.json {date}"
     output_fields: List[str] = None
+    compact: bool = False  # minified locations.json instead of indent=2
 
 
 class Config:
@@ -80,14 +110,36 @@ class Config:
         # Pipeline settings
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.cache_ttl_hours = int(os.getenv("CACHE_TTL_HOURS", "24"))
+        self.cache_memory_max_entries = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "2048"))
+        self.cache_memory_max_mb = int(os.getenv("CACHE_MEMORY_MAX_MB", "64"))
+        self.cache_max_mb = int(os.getenv("CACHE_MAX_MB", "512"))
+        self.cache_max_rows = int(os.getenv("CACHE_MAX_ROWS", "50000"))
+        self.cache_maintenance_minutes = int(os.getenv("CACHE_MAINTENANCE_MINUTES", "10"))
         self.max_concurrent_requests = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
         self.request_timeout = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "10"))
         self.rate_limit_per_minute = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "30"))
+        self.http_validator_ttl_days = int(os.getenv("HTTP_VALIDATOR_TTL_DAYS", "90"))
+        self.http = self._load_http()
+        self.sheets_snapshot_enabled = os.getenv("SHEETS_SNAPSHOT", "true").lower() == "true"
+        self.sheets_revision_check_seconds = int(os.getenv("SHEETS_REVISION_CHECK_SECONDS", "60"))
+        
+        # Sheets storage backend: google, or local (SQLite stand-in for offline runs / load tests)
+        self.sheets_backend = os.getenv("SHEETS_BACKEND", "google")
+        self.sheets_local_path = Path(os.getenv("SHEETS_LOCAL_PATH", str(self.cache_dir / "local_sheets.db")))
+        self.sheets_local_latency_ms = int(os.getenv("SHEETS_LOCAL_LATENCY_MS", "150"))
+        # Requests per minute like the real per-user quota, 0 = unlimited
+        self.sheets_local_read_quota = int(os.getenv("SHEETS_LOCAL_READ_QUOTA", "60"))
+        self.sheets_local_write_quota = int(os.getenv("SHEETS_LOCAL_WRITE_QUOTA", "60"))
         
         # Freshness check intervals
         self.risk_tier_high_days = int(os.getenv("RISK_TIER_HIGH_DAYS", "7"))
         self.risk_tier_medium_days = int(os.getenv("RISK_TIER_MEDIUM_DAYS", "14"))
         self.risk_tier_low_days = int(os.getenv("RISK_TIER_LOW_DAYS", "60"))
+        # +/- fraction of the interval added to next_check_at, to flatten daily load
+        self.freshness_jitter = float(os.getenv("FRESHNESS_JITTER", "0.2"))
+        # Per-run budget: stop starting checks after this long / this many HTTP requests (0 = no limit)
+        self.freshness_max_minutes = float(os.getenv("FRESHNESS_MAX_MINUTES", "0"))
+        self.freshness_max_requests = int(os.getenv("FRESHNESS_MAX_REQUESTS", "0"))
     
     def _load_sources(self) -> List[SourceConfig]:
         """Load sources from YAML"""
@@ -153,6 +205,41 @@ class Config:
             git_auto_commit=exp.get('git_auto_commit', False),
             git_commit_message=exp.get('git_commit_message', 'Update locations.json {date}'),
             output_fields=exp.get('output_fields'),
+            compact=exp.get('compact', False),
+        )
+    
+    def _load_http(self) -> HttpConfig:
+        """Load HTTP client limits from YAML"""
+        # RATE_LIMIT_REQUESTS_PER_MINUTE is the per-host default unless the
+        # YAML overrides it
+        default = HostLimit(requests_per_minute=self.rate_limit_per_minute)
+        
+        sources_file = self.config_dir / "sources.yaml"
+        if not sources_file.exists():
+            return HttpConfig(default_limit=default, hosts={})
+        
+        with open(sources_file, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        
+        http = data.get('http', {})
+        default = HostLimit(
+            requests_per_minute=http.get('requests_per_minute', default.requests_per_minute),
+            max_concurrent=http.get('max_concurrent_per_host', default.max_concurrent),
+        )
+        hosts = {
+            name.lower(): HostLimit(
+                requests_per_minute=limits.get('requests_per_minute', default.requests_per_minute),
+                max_concurrent=limits.get('max_concurrent', default.max_concurrent),
+            )
+            for name, limits in (http.get('hosts') or {}).items()
+        }
+        return HttpConfig(
+            default_limit=default,
+            hosts=hosts,
+            max_connections=http.get('max_connections', 20),
+            max_keepalive_connections=http.get('max_keepalive_connections', 10),
+            keepalive_expiry=http.get('keepalive_expiry', 30.0),
+            http2=http.get('http2', True),
         )
     
     def get_enabled_sources(self) -> List[SourceConfig]:
@@ -0,0 +1,64 @@
+"""
+Index over existing places for duplicate detection
+Built once per run so each lookup only touches a handful of candidates
+"""
+
+from typing import Any, List, Optional
+
+from .matching import (
+    PlaceMatcher, PlaceRecord, Match,
+    normalize_name, name_grams, gram_similarity,
+)
+
+
+def place_record(place: Any, key: Optional[str] = None) -> PlaceRecord:
+    """Matching view of a Place / PlaceExtract (or anything with the same fields)"""
+    return PlaceRecord(
+        key=key if key is not None else getattr(place, "place_id", "") or "",
+        name=place.name or "",
+        name_en=getattr(place, "name_en", None) or "",
+        district=getattr(place, "district", None) or "",
+        address=getattr(place, "address", None) or "",
+        lat=getattr(place, "lat", None),
+        lng=getattr(place, "lng", None),
+    )
+
+
+class DedupIndex(PlaceMatcher):
+    """
+    PlaceMatcher keyed by place_id over Place models
+    - exact normalized name (Chinese or English) anywhere
+    - similar name in the same district, near the same coordinates or address
+    - nearby with a partly similar name only as a possible duplicate (review=True)
+    """
+    
+    def __init__(self, similarity_threshold: float = 0.8, ngram_size: int = 2, **kwargs):
+        super().__init__(name_threshold=similarity_threshold, ngram_size=ngram_size, **kwargs)
+        self.similarity_threshold = similarity_threshold
+    
+    @classmethod
+    def build(cls, places: List[Any], **kwargs) -> "DedupIndex":
+        """Build an index over existing places"""
+        index = cls(**kwargs)
+        for place in places:
+            index.add_place(place)
+        return index
+    
+    def add_place(self, place: Any):
+        """Add a place to the index"""
+        self.add(place_record(place))
+    
+    def find_match(self, place: Any) -> Optional[Match]:
+        """Best match for a place-like object, with the reason it matched"""
+        return self.match(place_record(place, key=""))
+    
+    def find_duplicate(self, name: str, district: Optional[str], **fields) -> Optional[str]:
+        """
+        Find an existing place this name duplicates
+        Extra fields (name_en, address, lat, lng) widen the checks when known
+        """
+        record = PlaceRecord(key="", name=name, district=district or "", **{
+            field: value for field, value in fields.items() if value is not None
+        })
+        found = self.match(record)
+        return found.key if found and not found.review else None
@@ -4,12 +4,16 @@ Export clean data from Sheets to JSON for frontend
 
 import json
 import subprocess
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
 from .config import config
-from .models import Place, PlaceStatus
+from .export_manifest import ExportManifest, digest, digest_row
+from .export_payload import frontend_files_exist, payload_paths, print_report, write_frontend_files
+from .json_stream import write_json_stream
+from .models import FRONTEND_RECORD_VERSION, Place, PlaceStatus
 from .sheets_client import SheetsClient
 
 
@@ -48,15 +52,31 @@ class JSONExporter:
         "instagram_url": "instagram",
     }
     
-    def __init__(self):
+    # Filter actually applied to exports: all non-closed places
+    EXPORT_FILTER = {"only_verified": False, "min_confidence": 0}
+    
+    def __init__(self, compact: Optional[bool] = None):
         self.sheets = SheetsClient()
         self.output_path = Path(config.export.output_path)
+        self.compact = config.export.compact if compact is None else compact
+    
+    def _manifest(self) -> ExportManifest:
+        """Content-hash manifest of the last export to output_path"""
+        key = digest(str(self.output_path.resolve()))[:8]
+        return ExportManifest(
+            config.cache_dir / f"export_manifest_{self.output_path.stem}_{key}.json",
+            self.output_path,
+            # A format switch or new record layout has to rewrite the file
+            # even if no record changed
+            options=dict(self.EXPORT_FILTER, compact=self.compact, record_version=FRONTEND_RECORD_VERSION),
+        )
     
     def export(
         self,
         dry_run: bool = False,
         only_verified: bool = True,
-        min_confidence: int = 50
+        min_confidence: int = 50,
+        incremental: bool = True,
     ) -> Dict[str, Any]:
         """
         Export places to JSON
@@ -65,23 +85,26 @@ class JSONExporter:
             dry_run: Only print what would be exported
             only_verified: Only export verified places
             min_confidence: Minimum confidence score
+            incremental: Reuse records of unchanged rows and skip the write
+                when nothing changed (False rebuilds everything)
         """
         print(f"Starting export...")
         
-        # Get all places
-        all_places = self.sheets.get_all_places()
-        print(f"Total places in Sheets: {len(all_places)}")
+        # Get all rows
+        values = self.sheets.get_all_values()
+        total = max(len(values) - 1, 0)
+        print(f"Total places in Sheets: {total}")
         
-        # Filter places (include all non-closed places)
-        filtered = self._filter_places(
-            all_places,
-            only_verified=False,
-            min_confidence=0
-        )
-        print(f"Places after filtering: {len(filtered)}")
+        manifest = self._manifest()
+        previous = manifest.previous() if incremental else {}
+        old_records = self._load_locations() if previous else {}
         
-        # Convert to frontend format
-        export_data = self._convert_to_frontend_format(filtered)
+        # Filter places (include all non-closed places) and convert the
+        # rows that changed to frontend format
+        entries, rebuilt = self._build_locations(values, previous, old_records, **self.EXPORT_FILTER)
+        export_data = [record for _, _, record_hash, record in entries if record_hash]
+        records = [(place_id, record_hash) for place_id, _, record_hash, _ in entries if record_hash]
+        print(f"Places after filtering: {len(export_data)} ({rebuilt} rows rebuilt)")
         
         # Add metadata
         output = {
@@ -100,17 +123,102 @@ class JSONExporter:
             print(f"  Sample: {export_data[0]['name'] if export_data else 'None'}")
             return {"exported": 0, "dry_run": True}
         
-        # Write JSON file
-        self._write_json(output)
-        
-        print(f"\n✓ Exported {len(export_data)} places to {self.output_path}")
-        
-        return {
+        result = {
             "exported": len(export_data),
-            "total": len(all_places),
-            "filtered_out": len(all_places) - len(filtered),
+            "total": total,
+            "filtered_out": total - len(export_data),
+            "rebuilt": rebuilt,
             "output_path": str(self.output_path),
         }
+        
+        if previous and records == manifest.records() and frontend_files_exist(self.output_path):
+            print(f"\n✓ No changes, {self.output_path} left as is")
+            return dict(result, written=False)
+        
+        # Write JSON file, then the summary / district shards / .gz / .br
+        # files the frontend loads first
+        output_sha256 = self._write_json(output["metadata"], export_data)
+        manifest.save(((place_id, source, record_hash) for place_id, source, record_hash, _ in entries), output_sha256)
+        payload = write_frontend_files(self.output_path, output)
+        
+        print(f"\n✓ Exported {len(export_data)} places to {self.output_path}")
+        print_report(payload)
+        
+        return dict(result, written=True, payload=payload)
+    
+    def _build_locations(
+        self,
+        values: List[list],
+        previous: Dict[str, Tuple[str, Optional[str]]],
+        old_records: Optional[Dict[str, Dict[str, Any]]] = None,
+        only_verified: bool = True,
+        min_confidence: int = 50
+    ) -> Tuple[List[list], int]:
+        """
+        [place_id, source hash, record hash, record] per sheet row, in sheet
+        order, and how many rows were rebuilt
+        Rows whose source hash matches `previous` keep their old record
+        (from old_records, or None when only hashes are needed); the rest
+        are parsed, filtered and converted again. Rows that are filtered out
+        or don't parse have no record hash
+        """
+        if len(values) < 2:
+            return [], 0
+        
+        header, rows = values[0], values[1:]
+        id_col = header.index("place_id") if "place_id" in header else None
+        
+        entries = []
+        changed = []  # entry positions to rebuild
+        id_counts = Counter()
+        for row in rows:
+            place_id = str(row[id_col]) if id_col is not None and id_col < len(row) else ""
+            id_counts[place_id] += 1
+            source = digest_row(row)
+            old = previous.get(place_id)
+            if old and old[0] == source:
+                if not old[1]:
+                    entries.append([place_id, source, None, None])
+                    continue
+                if old_records is None:
+                    entries.append([place_id, source, old[1], None])
+                    continue
+                if place_id in old_records:
+                    entries.append([place_id, source, old[1], old_records[place_id]])
+                    continue
+            entries.append([place_id, source, None, None])
+            changed.append(len(entries) - 1)
+        
+        if changed:
+            places = self.sheets.rows_to_places(header, [rows[pos] for pos in changed])
+            kept = {
+                id(place)
+                for place in self._filter_places(
+                    [place for place in places if place is not None],
+                    only_verified=only_verified,
+                    min_confidence=min_confidence,
+                )
+            }
+            for pos, place in zip(changed, places):
+                if place is not None and id(place) in kept:
+                    record = place.to_frontend_dict()
+                    entries[pos][2:] = [digest(record), record]
+        
+        # An id on several rows can't be matched back to one of them
+        for entry in entries:
+            if id_counts[entry[0]] > 1:
+                entry[1] = ""
+        
+        return entries, len(changed)
+    
+    def _load_locations(self) -> Dict[str, Dict[str, Any]]:
+        """Records in the current output file, by id"""
+        try:
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {p["id"]: p for p in existing.get("locations", [])}
     
     def _filter_places(
         self,
@@ -153,43 +261,55 @@ class JSONExporter:
         
         return result
     
-    def _write_json(self, data: Dict[str, Any]):
-        """Write data to JSON file"""
-        # Ensure output directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write with proper formatting
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(
-                data,
-                f,
-                ensure_ascii=False,
-                indent=2,
-                default=str
-            )
+    def _write_json(self, metadata: Dict[str, Any], locations: Iterable[Dict[str, Any]]) -> str:
+        """Stream locations to the JSON file atomically; returns the file's sha256"""
+        # One record serialised (and gzip / brotli compressed) at a time, temp
+        # file + rename, creating the output directory if needed
+        output_sha256, _ = write_json_stream(
+            self.output_path,
+            locations,
+            metadata=metadata,
+            compact=self.compact,
+            compress=True,
+        )
+        return output_sha256
     
     def git_commit_and_push(self, auto_push: bool = False) -> bool:
         """
         Commit and push changes to git
         """
+        repo = self.output_path.resolve().parent.parent
         try:
+            # The full export, summary, facets, search index, district shards
+            # and their .gz / .br siblings; deleted files only if git tracks them
+            paths = [path.resolve() for path in payload_paths(self.output_path)]
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--", *map(str, paths)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=repo
+            )
+            tracked = {repo / name for name in result.stdout.split("\0") if name}
+            pathspecs = sorted(map(str, {path for path in paths if path.exists()} | tracked))
+            
             # Check if there are changes
             result = subprocess.run(
-                ["git", "status", "--porcelain", str(self.output_path)],
+                ["git", "status", "--porcelain", "--", *pathspecs],
                 capture_output=True,
                 text=True,
-                cwd=self.output_path.parent.parent  # Repo root
+                cwd=repo  # Repo root
             )
             
             if not result.stdout.strip():
                 print("No changes to commit")
                 return True
             
-            # Add file
+            # Add files, including removed shards
             subprocess.run(
-                ["git", "add", str(self.output_path)],
+                ["git", "add", "-A", "--", *pathspecs],
                 check=True,
-                cwd=self.output_path.parent.parent
+                cwd=repo
             )
             
             # Commit
@@ -199,7 +319,7 @@ class JSONExporter:
             subprocess.run(
                 ["git", "commit", "-m", commit_msg],
                 check=True,
-                cwd=self.output_path.parent.parent
+                cwd=repo
             )
             
             print(f"Committed: {commit_msg}")
@@ -209,12 +329,12 @@ class JSONExporter:
                 subprocess.run(
                     ["git", "push"],
                     check=True,
-                    cwd=self.output_path.parent.parent
+                    cwd=repo
                 )
                 print("Pushed to remote")
             
             return True
-            
+        
         except subprocess.CalledProcessError as e:
             print(f"Git error: {e}")
             return False
@@ -227,9 +347,18 @@ class JSONExporter:
         Compare current export with existing file
         Returns diff statistics
         """
+        # The manifest has a hash per exported record, so only rows that
+        # changed since the last export are converted and nothing is reloaded
+        manifest = self._manifest()
+        if manifest.valid:
+            entries, _ = self._build_locations(self.sheets.get_all_values(), manifest.rows, **self.EXPORT_FILTER)
+            return manifest.diff([
+                (place_id, record_hash) for place_id, _, record_hash, _ in entries if record_hash
+            ])
+        
         # Get current data from Sheets
         all_places = self.sheets.get_all_places()
-        filtered = self._filter_places(all_places)
+        filtered = self._filter_places(all_places, **self.EXPORT_FILTER)
         new_data = self._convert_to_frontend_format(filtered)
         
         # Load existing file
@@ -274,8 +403,8 @@ class JSONExporter:
         }
 
 
-# Simple CLI for export
-if __name__ == "__main__":
+def main():
+    """Simple CLI for export"""
     import argparse
     
     parser = argparse.ArgumentParser(description="Export places to JSON")
@@ -285,10 +414,12 @@ if __name__ == "__main__":
     parser.add_argument("--git-commit", action="store_true", help="Commit changes to git")
     parser.add_argument("--git-push", action="store_true", help="Push changes to remote")
     parser.add_argument("--compare", action="store_true", help="Compare with existing file")
+    parser.add_argument("--full", action="store_true", help="Rebuild every record instead of an incremental export")
+    parser.add_argument("--compact", action="store_true", help="Write minified JSON instead of indent=2")
     
     args = parser.parse_args()
     
-    exporter = JSONExporter()
+    exporter = JSONExporter(compact=args.compact or None)
     
     if args.compare:
         diff = exporter.compare_with_current()
@@ -303,7 +434,12 @@ if __name__ == "__main__":
             dry_run=args.dry_run,
             only_verified=not args.include_pending,
             min_confidence=args.min_confidence,
+            incremental=not args.full,
         )
         
         if args.git_commit and not args.dry_run:
             exporter.git_commit_and_push(auto_push=args.git_push)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Content-hash manifest for incremental JSON exports
+- Per location: a hash of the source row(s) it was built from and a hash
+  of the exported record, so unchanged rows are reused instead of rebuilt
+- A hash of the output file, so a file edited or replaced by something
+  else (e.g. the other exporter) triggers a full rebuild
+- Atomic writes (temp file + rename), so readers never see half a file
+
+No relative imports, so standalone scripts can use it via sys.path
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+MANIFEST_VERSION = 1
+
+
+def digest(value: Any) -> str:
+    """Stable hash of a JSON-serialisable value"""
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def digest_row(row: List[Any]) -> str:
+    """Hash of a get_all_values() row (cheaper than digest() for flat rows)"""
+    return hashlib.sha1("\x1f".join(map(str, row)).encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_atomic(path: Path, text: Union[str, bytes]) -> str:
+    """Write text via a temp file in the same directory + rename; returns its sha256"""
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExportManifest:
+    """
+    What the last export wrote: location id -> (source hash, record hash),
+    in output order; the record hash is None for rows that were filtered out
+    """
+    
+    def __init__(self, path: Path, output_path: Path, options: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.output_path = output_path
+        self.options = options or {}
+        self.rows: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.output_sha256: Optional[str] = None
+        self.stored_options: Optional[Dict[str, Any]] = None
+        self._load()
+    
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable export manifest {self.path}: {e}")
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self.rows = {pid: tuple(hashes) for pid, hashes in data.get("rows", {}).items()}
+        self.output_sha256 = data.get("output_sha256")
+        self.stored_options = data.get("options")
+    
+    @property
+    def valid(self) -> bool:
+        """Manifest describes the current output file, built with the same options"""
+        return (
+            bool(self.output_sha256)
+            and self.stored_options == self.options
+            and file_sha256(self.output_path) == self.output_sha256
+        )
+    
+    def previous(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Hashes to reuse rows against ({} forces a full rebuild)"""
+        return self.rows if self.valid else {}
+    
+    def records(self) -> List[Tuple[str, str]]:
+        """(id, record hash) of exported locations, in output order"""
+        return [(pid, record) for pid, (_, record) in self.rows.items() if record]
+    
+    def save(self, rows: Iterable[Tuple[str, str, Optional[str]]], output_sha256: str):
+        """Store (id, source hash, record hash) rows for the file just written"""
+        self.rows = {pid: (source, record) for pid, source, record in rows}
+        self.output_sha256 = output_sha256
+        self.stored_options = self.options
+        write_atomic(self.path, json.dumps({
+            "version": MANIFEST_VERSION,
+            "options": self.options,
+            "output_sha256": output_sha256,
+            "rows": self.rows,
+        }, ensure_ascii=False))
+    
+    def diff(self, records: List[Tuple[str, str]]) -> Dict[str, int]:
+        """Added / removed / modified / unchanged counts against the manifest"""
+        old = dict(self.records())
+        new = dict(records)
+        common = old.keys() & new.keys()
+        modified = sum(1 for pid in common if old[pid] != new[pid])
+        return {
+            "current_count": len(old),
+            "new_count": len(new),
+            "added": len(new.keys() - old.keys()),
+            "removed": len(old.keys() - new.keys()),
+            "modified": modified,
+            "unchanged": len(common) - modified,
+        }
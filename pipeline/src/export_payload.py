@@ -0,0 +1,240 @@
+"""
+Frontend payload files written next to locations.json
+- <stem>-summary.json: minified, only the fields the map and list need to
+  paint, plus which district shard holds each location's details
+- <stem>-districts/<hash>.json: the remaining fields, one minified shard
+  per district, fetched on demand
+- <stem>-facets.json: position lists and counts per filter value, so the
+  dropdown filters intersect short lists instead of scanning
+- <stem>-search.json: static inverted index for text search (search_index)
+- .gz / .br siblings of every file (brotli only if the package is installed);
+  locations.json's are streamed by write_json_stream(compress=True)
+- Size / parse-time report, to catch payload regressions (sizes only for
+  locations.json, which is never read back into memory)
+
+Files are only rewritten when their content changes, and shards for
+districts that disappeared are removed
+
+Falls back to a plain sibling import, so standalone scripts can use it via
+sys.path like export_manifest
+"""
+
+import gzip
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+try:
+    from .export_manifest import write_atomic
+    from .facet_index import FACETS_VERSION, build_facets
+    from .search_index import SearchIndex
+except ImportError:  # loaded as a top-level module by standalone scripts
+    from export_manifest import write_atomic
+    from facet_index import FACETS_VERSION, build_facets
+    from search_index import SearchIndex
+
+try:
+    import brotli
+except ImportError:  # only .gz siblings are written
+    brotli = None
+
+
+SUMMARY_FIELDS = ["id", "name", "lat", "lng", "category", "region", "ageRange", "priceType", "indoor"]
+PAYLOAD_VERSION = "1.0"
+
+
+def summary_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}-summary.json")
+
+
+def facets_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}-facets.json")
+
+
+def search_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}-search.json")
+
+
+def shard_dir(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}-districts")
+
+
+def siblings(path: Path) -> List[Path]:
+    """A payload file and its .gz / .br siblings"""
+    return [path, path.with_name(path.name + ".gz"), path.with_name(path.name + ".br")]
+
+
+def payload_paths(output_path: Path) -> List[Path]:
+    """Every file an export writes (plus the shard directory), e.g. to stage them together"""
+    paths = []
+    for path in (output_path, summary_path(output_path), facets_path(output_path), search_path(output_path)):
+        paths.extend(siblings(path))
+    paths.append(shard_dir(output_path))
+    return paths
+
+
+def shard_name(district: str) -> str:
+    """ASCII file name for a district shard (stable across runs)"""
+    return f"{hashlib.sha1(district.encode('utf-8')).hexdigest()[:10]}.json"
+
+
+def minify(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    write_atomic(path, data)
+    return True
+
+
+def _write_with_siblings(path: Path, data: bytes) -> Dict[str, Any]:
+    """Write a file plus its .gz / .br siblings; returns its size / parse-time row"""
+    _write_if_changed(path, data)
+    
+    row = {"bytes": len(data)}
+    gz_path = path.with_name(path.name + ".gz")
+    # mtime=0 keeps the .gz byte-identical when the content is
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_if_changed(gz_path, gz)
+    row["gzip"] = len(gz)
+    
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        _write_if_changed(path.with_name(path.name + ".br"), br)
+        row["brotli"] = len(br)
+    
+    start = time.perf_counter()
+    json.loads(data)
+    row["parse_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return row
+
+
+def _file_row(path: Path) -> Dict[str, Any]:
+    """Size row of a file written with its siblings already, from the file system"""
+    row = {"bytes": path.stat().st_size}
+    for key, sibling in zip(("gzip", "brotli"), siblings(path)[1:]):
+        if sibling.exists():
+            row[key] = sibling.stat().st_size
+    return row
+
+
+def _remove_with_siblings(path: Path):
+    for stale in siblings(path):
+        if stale.exists():
+            stale.unlink()
+
+
+def write_frontend_files(output_path: Path, output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write the summary, district shards, facets and search index for an
+    export already written to output_path with write_json_stream(compress=True);
+    returns the payload report
+    """
+    locations: List[Dict[str, Any]] = output.get("locations", [])
+    metadata = output.get("metadata", {})
+    
+    report: Dict[str, Any] = {"full": _file_row(output_path)}
+    
+    # Details grouped by district, keeping export order inside each shard
+    shards: Dict[str, Dict[str, Any]] = {}
+    for position, location in enumerate(locations):
+        district = location.get("district") or ""
+        shard = shards.setdefault(district, {"index": [], "locations": []})
+        shard["index"].append(position)
+        shard["locations"].append({
+            key: value for key, value in location.items() if key not in SUMMARY_FIELDS
+        })
+    
+    directory = shard_dir(output_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    shard_rows = []
+    written = set()
+    for district, shard in shards.items():
+        name = shard_name(district)
+        written.add(name)
+        shard_rows.append(_write_with_siblings(
+            directory / name,
+            minify({"district": district, "locations": shard["locations"]}),
+        ))
+        shard["file"] = f"{directory.name}/{name}"
+    for stale in directory.glob("*.json"):
+        if stale.name not in written:
+            _remove_with_siblings(stale)
+    
+    summary = {
+        "metadata": {
+            "exported_at": metadata.get("exported_at"),
+            "total_count": len(locations),
+            "version": PAYLOAD_VERSION,
+            "fields": SUMMARY_FIELDS,
+        },
+        "shards": [
+            {"district": district, "file": shard["file"], "index": shard["index"]}
+            for district, shard in shards.items()
+        ],
+        "locations": [
+            {key: location.get(key) for key in SUMMARY_FIELDS} for location in locations
+        ],
+    }
+    report["summary"] = _write_with_siblings(summary_path(output_path), minify(summary))
+    
+    # exported_at lets the frontend ignore facets that don't match its summary
+    facets = dict(
+        {"metadata": {
+            "exported_at": metadata.get("exported_at"),
+            "total_count": len(locations),
+            "version": FACETS_VERSION,
+        }},
+        **build_facets(locations),
+    )
+    report["facets"] = _write_with_siblings(facets_path(output_path), minify(facets))
+    
+    search = SearchIndex.build(locations)
+    report["search"] = _write_with_siblings(
+        search_path(output_path),
+        minify(search.to_json({"exported_at": metadata.get("exported_at")})),
+    )
+    report["search"]["build_ms"] = search.build_ms
+    
+    totals: Dict[str, Any] = {"count": len(shard_rows)}
+    for key in ("bytes", "gzip", "brotli", "parse_ms"):
+        if shard_rows and key in shard_rows[0]:
+            totals[key] = round(sum(row[key] for row in shard_rows), 2)
+    totals["largest"] = max((row["bytes"] for row in shard_rows), default=0)
+    report["shards"] = totals
+    return report
+
+
+def frontend_files_exist(output_path: Path) -> bool:
+    return (
+        summary_path(output_path).exists()
+        and facets_path(output_path).exists()
+        and search_path(output_path).exists()
+        and shard_dir(output_path).exists()
+        and siblings(output_path)[1].exists()
+    )
+
+
+def print_report(report: Dict[str, Any]):
+    """Payload sizes and parse times, one line per file kind"""
+    print("\n📦 Payload:")
+    for kind in ("full", "summary", "facets", "search", "shards"):
+        row = report.get(kind)
+        if not row:
+            continue
+        parts = [f"{row['bytes'] / 1024:8.1f} KB"]
+        if "gzip" in row:
+            parts.append(f"gzip {row['gzip'] / 1024:7.1f} KB")
+        if "brotli" in row:
+            parts.append(f"br {row['brotli'] / 1024:7.1f} KB")
+        if "parse_ms" in row:
+            parts.append(f"parse {row['parse_ms']:6.1f} ms")
+        if "build_ms" in row:
+            parts.append(f"built in {row['build_ms']:.1f} ms")
+        if kind == "shards":
+            parts.append(f"{row['count']} files, largest {row['largest'] / 1024:.1f} KB")
+        print(f"  {kind:8s} " + ", ".join(parts))
@@ -3,10 +3,11 @@ Extract places from various sources (RSS, sitemaps, tag pages)
 """
 
 import re
+import asyncio
 import hashlib
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from urllib.parse import urljoin, urlparse
 
 import feedparser
@@ -16,13 +17,17 @@ from .config import config, SourceConfig
 from .models import PlaceExtract, Place
 from .http_client import HttpClient
 from .cache import cache
+from .dedup_index import DedupIndex, Match, place_record, normalize_name, name_grams, gram_similarity
 
 
 class PlaceExtractor:
-    """Extract place information from various sources"""
+    """
+    Extract place information from various sources
+    Pass the run's HttpClient to share its connection pool and limits
+    """
     
-    def __init__(self):
-        self.client = HttpClient()
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or HttpClient()
     
     async def extract_from_source(self, source: SourceConfig) -> List[PlaceExtract]:
         """Extract places from a configured source"""
@@ -76,95 +81,124 @@ class PlaceExtractor:
     
     async def _extract_from_sitemap(self, source: SourceConfig) -> List[PlaceExtract]:
         """Extract from sitemap.xml"""
-        extracts = []
+        article_urls = []
+        
+        response = await self.client.get(source.url)
+        soup = BeautifulSoup(response.text, 'xml')
+        
+        urls = soup.find_all('url')
         
-        async with self.client as client:
-            response = await client.get(source.url)
-            soup = BeautifulSoup(response.text, 'xml')
+        for url_elem in urls:
+            loc = url_elem.find('loc')
+            if not loc:
+                continue
             
-            urls = soup.find_all('url')
+            url = loc.text
             
-            for url_elem in urls:
-                loc = url_elem.find('loc')
-                if not loc:
-                    continue
-                
-                url = loc.text
-                
-                # Check lastmod
-                lastmod = url_elem.find('lastmod')
-                if lastmod:
-                    modified = self._parse_date(lastmod.text)
-                    if modified:
-                        age_days = (datetime.utcnow() - modified).days
-                        if age_days > source.recency_window_days:
-                            continue
-                
-                # Fetch and parse article
-                try:
-                    article_extract = await self._parse_article(
-                        url, source.selectors or {}, source
-                    )
-                    if article_extract:
-                        extracts.append(article_extract)
-                except Exception as e:
-                    print(f"Error parsing {url}: {e}")
-                    continue
+            # Check lastmod
+            lastmod = url_elem.find('lastmod')
+            if lastmod:
+                modified = self._parse_date(lastmod.text)
+                if modified:
+                    age_days = (datetime.utcnow() - modified).days
+                    if age_days > source.recency_window_days:
+                        continue
+            
+            article_urls.append(url)
         
-        return extracts
+        # Fetch and parse articles
+        return await self._fetch_articles(article_urls, source)
     
     async def _extract_from_tag_page(self, source: SourceConfig) -> List[PlaceExtract]:
         """Extract from tag/category listing page"""
-        extracts = []
+        article_urls = []
         
-        async with self.client as client:
-            for page in range(1, source.max_pages + 1):
-                page_url = source.url
-                if page > 1 and source.pagination:
-                    page_url = f"{source.url}?page={page}"
-                
-                response = await client.get(page_url)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find article elements
-                article_selector = source.selectors.get('article_selector', 'article')
-                articles = soup.select(article_selector)
-                
-                for article in articles:
-                    try:
-                        # Extract link
-                        link_selector = source.selectors.get('link_selector', 'a[href]')
-                        link_elem = article.select_one(link_selector)
-                        if not link_elem:
-                            continue
-                        
-                        url = link_elem.get('href', '')
-                        if not url.startswith('http'):
-                            url = urljoin(source.url, url)
-                        
-                        # Extract date
-                        date_selector = source.selectors.get('date_selector')
-                        if date_selector:
-                            date_elem = article.select_one(date_selector)
-                            if date_elem:
-                                published = self._parse_date(date_elem.get_text(strip=True))
-                                if published:
-                                    age_days = (datetime.utcnow() - published).days
-                                    if age_days > source.recency_window_days:
-                                        continue
-                        
-                        # Fetch article
-                        article_extract = await self._parse_article(
-                            url, source.selectors or {}, source
-                        )
-                        if article_extract:
-                            extracts.append(article_extract)
-                            
-                    except Exception as e:
-                        print(f"Error extracting article: {e}")
+        for page in range(1, source.max_pages + 1):
+            page_url = source.url
+            if page > 1 and source.pagination:
+                page_url = f"{source.url}?page={page}"
+            
+            response = await self.client.get(page_url)
+            soup = BeautifulSoup(response.text, 'html.parser')
+            
+            # Find article elements
+            article_selector = source.selectors.get('article_selector', 'article')
+            articles = soup.select(article_selector)
+            
+            for article in articles:
+                try:
+                    # Extract link
+                    link_selector = source.selectors.get('link_selector', 'a[href]')
+                    link_elem = article.select_one(link_selector)
+                    if not link_elem:
                         continue
+                    
+                    url = link_elem.get('href', '')
+                    if not url.startswith('http'):
+                        url = urljoin(source.url, url)
+                    
+                    # Extract date
+                    date_selector = source.selectors.get('date_selector')
+                    if date_selector:
+                        date_elem = article.select_one(date_selector)
+                        if date_elem:
+                            published = self._parse_date(date_elem.get_text(strip=True))
+                            if published:
+                                age_days = (datetime.utcnow() - published).days
+                                if age_days > source.recency_window_days:
+                                    continue
+                    
+                    article_urls.append(url)
+                
+                except Exception as e:
+                    print(f"Error extracting article: {e}")
+                    continue
         
-        return extracts
+        # Fetch articles
+        return await self._fetch_articles(article_urls, source)
+    
+    async def _iter_articles(
+        self,
+        urls: List[str],
+        source: SourceConfig
+    ) -> AsyncIterator[Tuple[int, Optional[PlaceExtract]]]:
+        """
+        Fetch and parse articles concurrently
+        Yields (index into urls, extract or None) as each article completes.
+        At most MAX_CONCURRENT_REQUESTS articles are in flight; HttpClient's
+        per-host limits still apply underneath.
+        """
+        semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        
+        async def fetch(index: int, url: str) -> Tuple[int, Optional[PlaceExtract]]:
+            async with semaphore:
+                try:
+                    return index, await self._parse_article(url, source.selectors or {}, source)
+                except Exception as e:
+                    print(f"Error parsing {url}: {e}")
+                    return index, None
+        
+        tasks = [asyncio.ensure_future(fetch(i, url)) for i, url in enumerate(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Don't leave fetches running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+    
+    async def _fetch_articles(
+        self,
+        urls: List[str],
+        source: SourceConfig
+    ) -> List[PlaceExtract]:
+        """Fetch articles concurrently, returning extracts in the order of urls"""
+        results: List[Optional[PlaceExtract]] = [None] * len(urls)
+        
+        async for index, extract in self._iter_articles(urls, source):
+            results[index] = extract
+        
+        return [extract for extract in results if extract]
     
     async def _parse_article(
         self,
@@ -174,57 +208,56 @@ class PlaceExtractor:
     ) -> Optional[PlaceExtract]:
         """Parse an article page for place information"""
         
-        async with self.client as client:
-            response = await client.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title
-            title_selector = selectors.get('title_selector', 'h1')
-            title_elem = soup.select_one(title_selector)
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            # Extract content
-            content_selector = selectors.get('content_selector', 'article, .content, .post')
-            content_elem = soup.select_one(content_selector)
-            content = content_elem.get_text(strip=True) if content_elem else ""
-            
-            # Check keywords
-            if not self._matches_keywords(f"{title} {content}", source.category_keywords):
-                return None
-            
-            # Extract place details using heuristics
-            name = self._extract_name_from_title(title)
-            address = self._extract_address(content)
-            district = self._extract_district(address or content)
-            region = self._district_to_region(district)
-            
-            # Extract price info
-            price_note = self._extract_price(content)
-            
-            # Extract age info
-            age_min, age_max = self._extract_age_range(content)
-            
-            # Extract website
-            website = self._extract_website(content, url)
-            
-            # Extract description (first paragraph or meta)
-            description = self._extract_description(content_elem or soup)
-            
-            return PlaceExtract(
-                name=name,
-                address=address,
-                district=district,
-                region=region,
-                price_note=price_note,
-                age_min=age_min,
-                age_max=age_max,
-                website_url=website,
-                description=description,
-                source_url=url,
-                source_name=source.name,
-                extracted_at=datetime.utcnow(),
-                content_hash=hashlib.sha256(content.encode()).hexdigest()[:16],
-            )
+        response = await self.client.get(url)
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # Extract title
+        title_selector = selectors.get('title_selector', 'h1')
+        title_elem = soup.select_one(title_selector)
+        title = title_elem.get_text(strip=True) if title_elem else ""
+        
+        # Extract content
+        content_selector = selectors.get('content_selector', 'article, .content, .post')
+        content_elem = soup.select_one(content_selector)
+        content = content_elem.get_text(strip=True) if content_elem else ""
+        
+        # Check keywords
+        if not self._matches_keywords(f"{title} {content}", source.category_keywords):
+            return None
+        
+        # Extract place details using heuristics
+        name = self._extract_name_from_title(title)
+        address = self._extract_address(content)
+        district = self._extract_district(address or content)
+        region = self._district_to_region(district)
+        
+        # Extract price info
+        price_note = self._extract_price(content)
+        
+        # Extract age info
+        age_min, age_max = self._extract_age_range(content)
+        
+        # Extract website
+        website = self._extract_website(content, url)
+        
+        # Extract description (first paragraph or meta)
+        description = self._extract_description(content_elem or soup)
+        
+        return PlaceExtract(
+            name=name,
+            address=address,
+            district=district,
+            region=region,
+            price_note=price_note,
+            age_min=age_min,
+            age_max=age_max,
+            website_url=website,
+            description=description,
+            source_url=url,
+            source_name=source.name,
+            extracted_at=datetime.utcnow(),
+            content_hash=hashlib.sha256(content.encode()).hexdigest()[:16],
+        )
     
     def _extract_name_from_title(self, title: str) -> str:
         """Extract place name from article title"""
@@ -385,58 +418,79 @@ class PlaceExtractor:
 class DuplicateDetector:
     """Detect and handle duplicate places"""
     
-    def __init__(self):
+    def __init__(self, similarity_threshold: float = 0.8):
+        self.similarity_threshold = similarity_threshold
         self.seen_hashes: set = set()
         self.seen_names: Dict[str, str] = {}  # name -> place_id
+        self.index: Optional[DedupIndex] = None
+        self._indexed_places: Optional[List[Place]] = None
+        self._in_flight: Dict[int, str] = {}  # id(extract) -> provisional index key
     
-    def is_duplicate(self, extract: PlaceExtract, existing_places: List[Place]) -> Optional[str]:
+    def build_index(self, existing_places: List[Place]):
+        """Index existing places once so each lookup avoids a full scan"""
+        self.index = DedupIndex.build(
+            existing_places, similarity_threshold=self.similarity_threshold
+        )
+        self._indexed_places = existing_places
+    
+    def check(self, extract: PlaceExtract, existing_places: List[Place]) -> Optional[Match]:
         """
-        Check if extract is a duplicate
-        Returns existing place_id if duplicate, None if new
+        Best match for extract, or None if new
+        A match with review=True is only a possible duplicate (nearby, name
+        partly similar): flag it for review rather than skipping it
         """
         # Check content hash
         if extract.content_hash in self.seen_hashes:
-            return True
+            return Match("", 1.0, "content_hash")
         
-        # Check name similarity
-        normalized_name = self._normalize_name(extract.name)
-        
-        for place in existing_places:
-            existing_normalized = self._normalize_name(place.name)
-            
-            # Exact match
-            if normalized_name == existing_normalized:
-                return place.place_id
-            
-            # Similar name + same district
-            if (self._name_similarity(normalized_name, existing_normalized) > 0.8 and
-                extract.district == place.district):
-                return place.place_id
+        # Rebuild only when handed a different list of existing places
+        if self.index is None or self._indexed_places is not existing_places:
+            self.build_index(existing_places)
         
-        return None
+        # Exact name anywhere, or similar name + same district / location / address
+        return self.index.find_match(extract)
+    
+    def is_duplicate(self, extract: PlaceExtract, existing_places: List[Place]) -> Optional[str]:
+        """
+        Check if extract is a duplicate
+        Returns existing place_id if duplicate, None if new (or only possibly a duplicate)
+        """
+        match = self.check(extract, existing_places)
+        if match is None or match.review:
+            return None
+        return match.key or True
     
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison"""
-        name = name.lower()
-        name = re.sub(r'[^\w\s]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
-        return name
+        return normalize_name(name)
     
     def _name_similarity(self, name1: str, name2: str) -> float:
-        """Calculate name similarity (simple Jaccard)"""
-        set1 = set(name1.split())
-        set2 = set(name2.split())
-        
-        if not set1 or not set2:
-            return 0.0
-        
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        
-        return intersection / union if union > 0 else 0.0
+        """Calculate name similarity (Jaccard over CJK bigrams / Latin words)"""
+        return gram_similarity(name_grams(name1), name_grams(name2))
     
-    def add_seen(self, extract: PlaceExtract, place_id: str):
-        """Mark extract as seen"""
+    def add_seen(self, extract: PlaceExtract, place_id: Optional[str] = None):
+        """
+        Mark extract as seen. Without a place_id (still being validated) it
+        is indexed under a provisional key, swapped for place_id once assigned
+        """
         if extract.content_hash:
             self.seen_hashes.add(extract.content_hash)
         self.seen_names[self._normalize_name(extract.name)] = place_id
+        if self.index is None:
+            return
+        
+        # Places added this run (or in flight) should catch later near-duplicates too
+        self.release(extract)
+        if place_id:
+            if place_id not in self.index:
+                self.index.add(place_record(extract, key=place_id))
+        else:
+            key = f"in-flight:{uuid.uuid4().hex}"
+            self._in_flight[id(extract)] = key
+            self.index.add(place_record(extract, key=key))
+    
+    def release(self, extract: PlaceExtract):
+        """Drop an in-flight extract from the index (validation or write failed)"""
+        key = self._in_flight.pop(id(extract), None)
+        if key and self.index is not None:
+            self.index.remove(key)
@@ -0,0 +1,136 @@
+"""
+Precomputed filter index over exported locations
+Mirrors the dropdown filters in index.html (district, category, age,
+price, indoor) plus region, so the frontend intersects a few short
+position lists instead of scanning every location on each change
+
+Positions are indexes into locations.json / locations-summary.json. The
+JSON form holds a sorted position list and a count per facet value;
+FacetIndex answers the same filter combinations in Python with int bitsets
+
+No relative imports, so standalone scripts can use it via sys.path
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Age dropdown value -> (min, max) years, max None for "and older"
+AGE_BUCKETS: Dict[str, Tuple[int, Optional[int]]] = {
+    "0-1": (0, 1),
+    "1-2": (1, 2),
+    "2-3": (2, 3),
+    "3-6": (3, 6),
+    "6-12": (6, 12),
+    "12+": (12, None),
+}
+# Price dropdown value -> priceType values it matches
+PRICE_FILTERS: Dict[str, List[str]] = {
+    "free": ["free"],
+    "1-100": ["low"],
+    "100-200": ["medium"],
+    "200-400": ["high"],
+    "400+": ["high"],
+}
+FACETS_VERSION = "1.0"
+
+
+def age_matches(age_range: Any, bucket: str) -> bool:
+    """Same test as index.html: the place's age range overlaps the bucket"""
+    if not isinstance(age_range, (list, tuple)) or len(age_range) < 2:
+        return False
+    low, high = AGE_BUCKETS[bucket]
+    try:
+        if high is None:
+            return age_range[1] >= low
+        return not (age_range[1] < low or age_range[0] > high)
+    except TypeError:
+        return False
+
+
+def build_facets(locations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sorted positions and counts per facet value"""
+    facets: Dict[str, Dict[str, List[int]]] = {
+        "district": {},
+        "region": {},
+        "category": {},
+        "priceType": {},
+        "indoor": {},
+        "age": {bucket: [] for bucket in AGE_BUCKETS},
+    }
+    for position, location in enumerate(locations):
+        for facet in ("district", "region", "category", "priceType"):
+            value = location.get(facet)
+            if value is not None:
+                facets[facet].setdefault(str(value), []).append(position)
+        facets["indoor"].setdefault("true" if location.get("indoor") else "false", []).append(position)
+        for bucket in AGE_BUCKETS:
+            if age_matches(location.get("ageRange"), bucket):
+                facets["age"][bucket].append(position)
+    
+    return {
+        "facets": facets,
+        "counts": {
+            facet: {value: len(positions) for value, positions in values.items()}
+            for facet, values in facets.items()
+        },
+    }
+
+
+def _bits(positions: Iterable[int]) -> int:
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    return bits
+
+
+def _positions(bits: int) -> List[int]:
+    return [i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+
+class FacetIndex:
+    """Filter queries against build_facets() output"""
+    
+    def __init__(self, facets: Dict[str, Dict[str, List[int]]], total: int):
+        self.total = total
+        self.all = (1 << total) - 1
+        self.bits = {
+            facet: {value: _bits(positions) for value, positions in values.items()}
+            for facet, values in facets.items()
+        }
+    
+    @classmethod
+    def from_locations(cls, locations: List[Dict[str, Any]]) -> "FacetIndex":
+        return cls(build_facets(locations)["facets"], len(locations))
+    
+    def _union(self, facet: str, match) -> int:
+        bits = 0
+        for value, value_bits in self.bits[facet].items():
+            if match(value):
+                bits |= value_bits
+        return bits
+    
+    def query(
+        self,
+        district: str = "all",
+        category: str = "all",
+        age: str = "all",
+        price: str = "all",
+        indoor: str = "all",
+        region: str = "all",
+    ) -> List[int]:
+        """Positions matching the dropdown values ("all" = no filter), in export order"""
+        bits = self.all
+        if district != "all":
+            # The district dropdown matches on substring, as in index.html
+            bits &= self._union("district", lambda value: district in value)
+        if region != "all":
+            bits &= self.bits["region"].get(region, 0)
+        if category != "all":
+            bits &= self.bits["category"].get(category, 0)
+        if age != "all":
+            bits &= self.bits["age"].get(age, 0)
+        if price != "all":
+            types = PRICE_FILTERS.get(price, [])
+            bits &= self._union("priceType", lambda value: value in types)
+        if indoor != "all":
+            bits &= self.bits["indoor"].get("true" if indoor == "indoor" else "false", 0)
+        return _positions(bits)
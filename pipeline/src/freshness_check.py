@@ -1,18 +1,41 @@
 """
 Freshness check for existing places
 Periodic validation to detect closures and updates
+
+Due places go through a priority queue (risk tier, then how overdue) to a
+sliding pool of workers, within an optional per-run time / request budget.
+Every finished check goes to a checkpoint journal, so an interrupted run
+can be resumed without re-checking what it already did
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import sys
+import time
+import uuid
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from .check_journal import CheckJournal
+from .check_schedule import CheckQueue, RunBudget, next_check_time, spread_check_time
 from .config import config
 from .models import Place, PlaceStatus, PlaceValidation, RiskTier
 from .sheets_client import SheetsClient
 from .validate_places import PlaceValidator
+from .http_client import HttpClient
 from .logging_utils import AuditLogger
 
+# Sheet columns a check sets; everything else in the row is left to editors
+CHECKED_COLUMNS = [
+    "status",
+    "validation_stage",
+    "confidence",
+    "risk_tier",
+    "evidence_urls",
+    "evidence_snippets",
+    "last_checked_at",
+    "next_check_at",
+]
+
 
 class FreshnessChecker:
     """
@@ -20,10 +43,14 @@ class FreshnessChecker:
     Implements incremental processing (only check due places)
     """
     
-    def __init__(self, run_id: str):
+    def __init__(self, run_id: str, resume: bool = False):
         self.run_id = run_id
+        self.resume = resume
+        self.journal = CheckJournal(run_id)
         self.sheets = SheetsClient()
-        self.validator = PlaceValidator()
+        # One HTTP client for the whole run so connections stay warm
+        self.client = HttpClient()
+        self.validator = PlaceValidator(self.client)
         self.audit = AuditLogger(run_id)
         
         # Statistics
@@ -33,46 +60,182 @@ class FreshnessChecker:
             "flagged": 0,
             "updated": 0,
             "errors": 0,
+            "timed_out": 0,
+            "deferred": 0,
+            "skipped": 0,
+            "replayed": 0,
+        }
+        # Per risk tier: queued, outcomes, seconds spent checking
+        self.tier_stats: Dict[str, Dict[str, Any]] = {
+            tier.value: {"queued": 0, "checked": 0, "passed": 0, "flagged": 0, "updated": 0,
+                         "errors": 0, "timed_out": 0, "deferred": 0, "seconds": 0.0}
+            for tier in RiskTier
         }
     
-    async def run(self, dry_run: bool = False) -> Dict[str, Any]:
+    async def run(
+        self,
+        dry_run: bool = False,
+        max_minutes: Optional[float] = None,
+        max_requests: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Run freshness check for all due places
+        
+        Args:
+            dry_run: Don't write to Sheets
+            max_minutes: Stop starting checks after this long (default
+                FRESHNESS_MAX_MINUTES, 0 = no limit)
+            max_requests: Stop starting checks after this many HTTP requests
+                (default FRESHNESS_MAX_REQUESTS, 0 = no limit)
         """
-        print(f"Starting freshness check (run_id: {self.run_id})")
+        async with self.client:
+            return await self._run(dry_run, max_minutes, max_requests)
+    
+    async def _run(
+        self,
+        dry_run: bool = False,
+        max_minutes: Optional[float] = None,
+        max_requests: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        print(f"Starting freshness check (run_id: {self.run_id}, "
+              f"resume with `python -m pipeline check --resume {self.run_id}`)")
         
         # Get places needing check
         places = self.sheets.get_places_for_freshness_check()
         print(f"Found {len(places)} places due for check")
         
+        if self.resume:
+            places = self._resume(places, dry_run)
+        
         if not places:
             return self.stats
         
-        # Process in batches
-        batch_size = config.max_concurrent_requests
+        self.journal.log_start(len(places), dry_run=dry_run, resumed=self.resume)
         
-        for i in range(0, len(places), batch_size):
-            batch = places[i:i + batch_size]
-            
-            print(f"Processing batch {i//batch_size + 1}/{(len(places)-1)//batch_size + 1}")
-            
+        queue = CheckQueue(places)
+        for place in places:
+            self.tier_stats[place.risk_tier.value]["queued"] += 1
+        
+        max_minutes = config.freshness_max_minutes if max_minutes is None else max_minutes
+        max_requests = config.freshness_max_requests if max_requests is None else max_requests
+        budget = RunBudget(
+            max_seconds=max_minutes * 60,
+            max_requests=max_requests,
+            requests_made=lambda: self.client.stats["requests"],
+        )
+        
+        # Each worker takes the next place as soon as its last one is done,
+        # so one slow site only holds up its own worker; sheet updates are
+        # buffered and written in bulk at the end
+        workers = min(config.max_concurrent_requests, len(places))
+        with self.sheets.batch():
             await asyncio.gather(*[
-                self._check_place(place, dry_run)
-                for place in batch
+                self._worker(queue, budget, dry_run)
+                for _ in range(workers)
             ])
+        # Only reached once the buffered rows were written
+        self.journal.log_complete(self.stats)
+        elapsed = time.monotonic() - budget.started
+        
+        # Whatever is left stays due, and goes first next run
+        for place in queue.remaining():
+            self.stats["deferred"] += 1
+            self.tier_stats[place.risk_tier.value]["deferred"] += 1
         
         # Print summary
-        print(f"\nFreshness check complete:")
+        print(f"\nFreshness check complete in {elapsed:.1f}s ({workers} workers):")
         print(f"  Checked: {self.stats['checked']}")
         print(f"  Passed: {self.stats['passed']}")
         print(f"  Flagged: {self.stats['flagged']}")
         print(f"  Updated: {self.stats['updated']}")
         print(f"  Errors: {self.stats['errors']}")
+        if self.stats["timed_out"]:
+            print(f"  Timed out: {self.stats['timed_out']}")
+        if self.stats["skipped"]:
+            print(f"  Skipped (checked before resume): {self.stats['skipped']}")
+        if self.stats["deferred"]:
+            print(f"  Deferred to next run: {self.stats['deferred']} "
+                  f"({budget.exhausted() or 'budget'} budget reached)")
+        self._print_tier_report(elapsed)
+        
+        write_stats = self.sheets.write_stats
+        print(f"  Sheet rows written: {write_stats['rows_updated'] + write_stats['rows_appended']} "
+              f"in {write_stats['write_requests']} requests")
+        
+        http_stats = self.client.get_stats()
+        print(f"  HTTP requests: {http_stats['requests']} "
+              f"over {http_stats['connections_opened']} connections "
+              f"(reuse ratio {http_stats['connection_reuse_ratio']})")
         
+        self.stats["tiers"] = self.tier_stats
+        self.stats["seconds"] = round(elapsed, 2)
         return self.stats
     
-    async def _check_place(self, place: Place, dry_run: bool = False):
-        """Check a single place"""
+    def _resume(self, places: List[Place], dry_run: bool = False) -> List[Place]:
+        """
+        Write the rows the interrupted run had pending (one bulk batch) and
+        drop the places it already checked
+        """
+        if not self.journal.exists():
+            print(f"No checkpoint for run {self.run_id}, checking every due place")
+            return places
+        
+        pending = [] if dry_run else self.journal.pending_writes()
+        if pending:
+            with self.sheets.batch():
+                for place in pending:
+                    self.sheets.update_place(place, columns=CHECKED_COLUMNS)
+            self.journal.log_complete({"replayed": len(pending)})
+        self.stats["replayed"] = len(pending)
+        
+        completed = self.journal.completed()
+        remaining = [place for place in places if place.place_id not in completed]
+        self.stats["skipped"] = len(places) - len(remaining)
+        print(f"Resuming run {self.run_id}: {len(completed)} places already checked, "
+              f"{len(pending)} pending rows written, {len(remaining)} left")
+        return remaining
+    
+    async def _worker(self, queue: CheckQueue, budget: RunBudget, dry_run: bool = False):
+        """Check places from the queue until it is empty or the budget runs out"""
+        while not budget.exhausted():
+            place = queue.pop()
+            if place is None:
+                return
+            
+            tier = self.tier_stats[place.risk_tier.value]
+            start = time.monotonic()
+            try:
+                # A check still running at the deadline is cancelled; the
+                # place keeps its old next_check_at
+                outcome = await asyncio.wait_for(
+                    self._check_place(place, dry_run),
+                    timeout=budget.remaining_seconds(),
+                )
+            except asyncio.TimeoutError:
+                outcome = "timed_out"
+                self.stats["timed_out"] += 1
+                print(f"  ⏱️ Out of time: {place.name} ({place.place_id})")
+            else:
+                self.journal.log_checked(place, outcome, write=not dry_run and outcome != "errors")
+            tier["checked"] += 1
+            tier[outcome] += 1
+            tier["seconds"] += time.monotonic() - start
+    
+    def _print_tier_report(self, elapsed: float):
+        """Throughput per risk tier"""
+        print(f"\n  {'Tier':8s} {'Queued':>7s} {'Checked':>8s} {'Flagged':>8s} {'Errors':>7s} "
+              f"{'Deferred':>9s} {'Avg s':>7s} {'Per min':>8s}")
+        for tier, row in self.tier_stats.items():
+            if not row["queued"]:
+                continue
+            avg = row["seconds"] / row["checked"] if row["checked"] else 0.0
+            per_minute = row["checked"] / elapsed * 60 if elapsed else 0.0
+            print(f"  {tier:8s} {row['queued']:7d} {row['checked']:8d} "
+                  f"{row['flagged'] + row['updated']:8d} {row['errors'] + row['timed_out']:7d} "
+                  f"{row['deferred']:9d} {avg:7.2f} {per_minute:8.1f}")
+    
+    async def _check_place(self, place: Place, dry_run: bool = False) -> str:
+        """Check a single place; returns the outcome (passed / flagged / updated / errors)"""
         try:
             self.stats["checked"] += 1
             
@@ -90,6 +253,7 @@ class FreshnessChecker:
             hash_changed = validation.content_hash_changed
             
             if status_changed:
+                outcome = "flagged"
                 self.stats["flagged"] += 1
                 
                 print(f"    ⚠️ Status changed: {old_status.value} -> {new_status.value}")
@@ -108,8 +272,9 @@ class FreshnessChecker:
                 place.validation_stage = validation.validation_stage
                 place.confidence = validation.confidence
                 place.risk_tier = validation.risk_tier
-                
+            
             elif hash_changed:
+                outcome = "updated"
                 self.stats["updated"] += 1
                 print(f"    📝 Content changed (hash)")
                 
@@ -120,8 +285,9 @@ class FreshnessChecker:
                     confidence=validation.confidence,
                     evidence_urls=validation.evidence_urls,
                 )
-                
+            
             else:
+                outcome = "passed"
                 self.stats["passed"] += 1
                 print(f"    ✓ No changes")
             
@@ -137,11 +303,14 @@ class FreshnessChecker:
             
             # Save to sheets (unless dry run)
             if not dry_run:
-                self.sheets.update_place(place)
+                self.sheets.update_place(place, columns=CHECKED_COLUMNS)
             
+            return outcome
+        
         except Exception as e:
             self.stats["errors"] += 1
             print(f"    ❌ Error: {e}")
+            return "errors"
     
     def get_flagged_places_report(self) -> List[Dict[str, Any]]:
         """Generate report of flagged places for review"""
@@ -212,32 +381,62 @@ class RiskBasedScheduler:
         place.risk_tier = validation.risk_tier
         
         # Save
-        self.sheets.update_place(place)
+        self.sheets.update_place(place, columns=["risk_tier", "next_check_at"])
     
     def _calculate_next_check(self, risk_tier: RiskTier) -> datetime:
-        """Calculate next check time"""
-        now = datetime.utcnow()
-        
-        if risk_tier == RiskTier.HIGH:
-            days = config.risk_tier_high_days
-        elif risk_tier == RiskTier.MEDIUM:
-            days = config.risk_tier_medium_days
-        else:
-            days = config.risk_tier_low_days
-        
-        return now + timedelta(days=days)
+        """Calculate next check time (jittered)"""
+        return next_check_time(risk_tier)
     
     def rebalance_all_schedules(self):
         """
         Rebalance all place schedules
         Useful when changing risk tier parameters
+        Checks are spread evenly over each tier's interval instead of all
+        landing on the same day
         """
         places = self.sheets.get_all_places()
+        now = datetime.utcnow()
         
-        for place in places:
-            if place.status in (PlaceStatus.CLOSED, PlaceStatus.OPEN):
-                # Calculate new schedule based on current risk tier
-                place.next_check_at = self._calculate_next_check(place.risk_tier)
-                self.sheets.update_place(place)
+        with self.sheets.batch():
+            for place in places:
+                if place.status in (PlaceStatus.CLOSED, PlaceStatus.OPEN):
+                    # Calculate new schedule based on current risk tier
+                    place.next_check_at = spread_check_time(place.place_id, place.risk_tier, now)
+                    self.sheets.update_place(place, columns=["next_check_at"])
         
         print(f"Rebalanced {len(places)} place schedules")
+
+
+def main():
+    """CLI for freshness check"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run freshness check on existing places")
+    parser.add_argument("--dry-run", action="store_true", help="Don't update Sheets")
+    parser.add_argument("--export-flagged", help="Export flagged places to CSV file (no check is run)")
+    parser.add_argument("--resume", metavar="RUN_ID", help="Continue an interrupted run from its checkpoint journal")
+    parser.add_argument("--max-minutes", type=float, help="Stop starting checks after this long (default FRESHNESS_MAX_MINUTES)")
+    parser.add_argument("--max-requests", type=int, help="Stop starting checks after this many HTTP requests (default FRESHNESS_MAX_REQUESTS)")
+    
+    args = parser.parse_args()
+    
+    run_id = args.resume or str(uuid.uuid4())[:8]
+    checker = FreshnessChecker(run_id, resume=bool(args.resume))
+    
+    if args.export_flagged:
+        checker.export_flagged_report(args.export_flagged)
+        return
+    
+    try:
+        asyncio.run(checker.run(
+            dry_run=args.dry_run,
+            max_minutes=args.max_minutes,
+            max_requests=args.max_requests,
+        ))
+    except KeyboardInterrupt:
+        print(f"\nInterrupted - resume with `python -m pipeline check --resume {run_id}`")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
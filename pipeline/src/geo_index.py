@@ -0,0 +1,159 @@
+"""
+Grid index over place coordinates for radius and nearest-neighbour queries
+Cells are a fixed size in metres at Hong Kong's latitude, so a query only
+looks at a few cells and refines candidates with haversine distance
+
+No relative imports, so standalone scripts can use it via sys.path
+"""
+
+import heapq
+from collections import defaultdict
+from math import radians, sin, cos, sqrt, atan2, ceil
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+# Metres per degree of latitude, and of longitude at Hong Kong (~22.3°N)
+_M_PER_DEG_LAT = 111320.0
+_HK_LATITUDE = 22.3
+_M_PER_DEG_LNG = _M_PER_DEG_LAT * cos(radians(_HK_LATITUDE))
+
+
+def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """計算兩點之間的距離（米） - same as scripts/verify_coordinates.py"""
+    R = 6371000  # 地球半徑（米）
+    
+    lat1_rad = radians(lat1)
+    lat2_rad = radians(lat2)
+    delta_lat = radians(lat2 - lat1)
+    delta_lng = radians(lng2 - lng1)
+    
+    a = sin(delta_lat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lng / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    
+    return R * c
+
+
+class GeoIndex:
+    """
+    Uniform grid of lat/lng buckets (default 250m cells)
+    - radius(): every key within N metres, nearest first
+    - nearest(): k nearest keys, searching outward ring by ring
+    """
+    
+    def __init__(self, cell_m: float = 250.0):
+        self.cell_m = cell_m
+        self._lat_step = cell_m / _M_PER_DEG_LAT
+        self._lng_step = cell_m / _M_PER_DEG_LNG
+        self.cells: Dict[Tuple[int, int], List[Tuple[Hashable, float, float]]] = defaultdict(list)
+        self.points: Dict[Hashable, Tuple[float, float]] = {}
+        # Occupied cell extent (only grows), bounds how far nearest() searches
+        self._rows = (0, -1)
+        self._cols = (0, -1)
+    
+    def __len__(self) -> int:
+        return len(self.points)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.points
+    
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return int(lat // self._lat_step), int(lng // self._lng_step)
+    
+    def add(self, key: Hashable, lat: float, lng: float):
+        """Index a point (re-adding a key moves it)"""
+        if key in self.points:
+            self.remove(key)
+        self.points[key] = (lat, lng)
+        row, col = self._cell(lat, lng)
+        self.cells[(row, col)].append((key, lat, lng))
+        if self._rows[0] > self._rows[1]:
+            self._rows, self._cols = (row, row), (col, col)
+        else:
+            self._rows = (min(self._rows[0], row), max(self._rows[1], row))
+            self._cols = (min(self._cols[0], col), max(self._cols[1], col))
+    
+    def remove(self, key: Hashable):
+        """Drop a point from the index"""
+        point = self.points.pop(key, None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        self.cells[cell] = [entry for entry in self.cells[cell] if entry[0] != key]
+        if not self.cells[cell]:
+            del self.cells[cell]
+    
+    def _ring(self, row: int, col: int, ring: int):
+        """Entries in the square ring of cells `ring` steps from (row, col)"""
+        if ring == 0:
+            yield from self.cells.get((row, col), ())
+            return
+        # Only walk the part of the ring that overlaps occupied cells
+        min_row, max_row = self._rows
+        min_col, max_col = self._cols
+        col_range = range(max(col - ring, min_col), min(col + ring, max_col) + 1)
+        for edge_row in (row - ring, row + ring):
+            if min_row <= edge_row <= max_row:
+                for c in col_range:
+                    yield from self.cells.get((edge_row, c), ())
+        row_range = range(max(row - ring + 1, min_row), min(row + ring - 1, max_row) + 1)
+        for edge_col in (col - ring, col + ring):
+            if min_col <= edge_col <= max_col:
+                for r in row_range:
+                    yield from self.cells.get((r, edge_col), ())
+    
+    def radius(self, lat: float, lng: float, radius_m: float) -> List[Tuple[Hashable, float]]:
+        """(key, distance_m) for every point within radius_m, nearest first"""
+        row, col = self._cell(lat, lng)
+        rings = int(ceil(radius_m / self.cell_m))
+        found = []
+        for ring in range(rings + 1):
+            for key, p_lat, p_lng in self._ring(row, col, ring):
+                distance = calculate_distance(lat, lng, p_lat, p_lng)
+                if distance <= radius_m:
+                    found.append((key, distance))
+        found.sort(key=lambda item: item[1])
+        return found
+    
+    def nearest(
+        self, lat: float, lng: float, k: int = 1, max_distance_m: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """(key, distance_m) for the k nearest points, optionally capped by distance"""
+        if not self.points or k <= 0:
+            return []
+        
+        row, col = self._cell(lat, lng)
+        max_rings = max(
+            abs(row - self._rows[0]), abs(row - self._rows[1]),
+            abs(col - self._cols[0]), abs(col - self._cols[1]),
+        )
+        if max_distance_m is not None:
+            max_rings = min(max_rings, int(ceil(max_distance_m / self.cell_m)))
+        
+        # Rings closer than the occupied extent are empty, so start at its edge
+        ring = max(
+            self._rows[0] - row, row - self._rows[1],
+            self._cols[0] - col, col - self._cols[1], 0,
+        )
+        
+        heap: List[Tuple[float, int, Hashable]] = []  # max-heap on distance via negation
+        seen = 0
+        while True:
+            for key, p_lat, p_lng in self._ring(row, col, ring):
+                distance = calculate_distance(lat, lng, p_lat, p_lng)
+                if max_distance_m is not None and distance > max_distance_m:
+                    continue
+                seen += 1
+                entry = (-distance, seen, key)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif distance < -heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+            
+            # Anything in ring r+1 is at least r * cell_m away
+            if len(heap) == k and -heap[0][0] <= ring * self.cell_m:
+                break
+            if ring >= max_rings:
+                break
+            ring += 1
+        
+        return [(key, -neg_distance) for neg_distance, _, key in sorted(heap, reverse=True)]
@@ -3,8 +3,10 @@ HTTP client with rate limiting, retry, and concurrency control
 """
 
 import asyncio
+import importlib.util
 import random
 import time
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any, Callable
 from urllib.parse import urlparse
 
@@ -18,7 +20,7 @@ from tenacity import (
 )
 
 from .config import config
-from .cache import cache, compute_content_hash
+from .cache import async_cache, compute_content_hash
 
 
 class RateLimiter:
@@ -48,24 +50,64 @@ class RateLimiter:
                 wait_time = (1 - self.tokens) * (60 / self.requests_per_minute)
                 await asyncio.sleep(wait_time)
                 self.tokens = 0
+                self.last_update = time.time()
             else:
                 self.tokens -= 1
 
 
+class HostLimiter:
+    """
+    Per-host token buckets and concurrency limits
+    Limits come from the `http` section of sources.yaml
+    """
+    
+    def __init__(self):
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait for a rate-limit token and a concurrency slot for the URL's host"""
+        host = (urlparse(url).hostname or "").lower()
+        
+        if host not in self.rate_limiters:
+            limit = config.http.limit_for(host)
+            self.rate_limiters[host] = RateLimiter(limit.requests_per_minute)
+            self.semaphores[host] = asyncio.Semaphore(limit.max_concurrent)
+        
+        await self.rate_limiters[host].acquire()
+        async with self.semaphores[host]:
+            yield
+
+
 class HttpClient:
     """
     HTTP client with:
     - Rate limiting
     - Exponential backoff + jitter retry
-    - Caching
+    - Caching, with ETag / Last-Modified revalidation of stale entries
     - Concurrency control
     - Timeout handling
+    
+    One client is meant to live for a whole run (owned by ingest_sources or
+    FreshnessChecker and injected into extractors/validators) so that its
+    connection pool stays warm. Closing it is idempotent.
     """
     
     def __init__(self):
-        self.rate_limiter = RateLimiter(config.rate_limit_per_minute)
+        # Rate limits are per host; MAX_CONCURRENT_REQUESTS caps the total
+        self.host_limiter = HostLimiter()
         self.semaphore = asyncio.Semaphore(config.max_concurrent_requests)
         
+        # Request and connection counters for this client
+        self.stats = {
+            "requests": 0,
+            "conditional_requests": 0,
+            "not_modified": 0,
+            "connections_opened": 0,
+        }
+        self.closed = False
+        
         # HTTP client with timeout
         timeout = httpx.Timeout(
             connect=5.0,
@@ -74,8 +116,18 @@ class HttpClient:
             pool=5.0,
         )
         
+        # Keep-alive pool shared by every host; HTTP/2 needs the optional h2 package
+        limits = httpx.Limits(
+            max_connections=config.http.max_connections,
+            max_keepalive_connections=config.http.max_keepalive_connections,
+            keepalive_expiry=config.http.keepalive_expiry,
+        )
+        http2 = config.http.http2 and importlib.util.find_spec("h2") is not None
+        
         self.client = httpx.AsyncClient(
             timeout=timeout,
+            limits=limits,
+            http2=http2,
             follow_redirects=True,
             headers={
                 "User-Agent": "ParentMap-HK-Bot/1.0 (Data Pipeline)",
@@ -89,7 +141,28 @@ class HttpClient:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the connection pool (safe to call more than once)"""
+        if not self.closed:
+            self.closed = True
+            await self.client.aclose()
+    
+    async def _trace(self, event_name: str, info: Dict[str, Any]):
+        """httpcore trace hook used to count new connections"""
+        if event_name == "connection.connect_tcp.complete":
+            self.stats["connections_opened"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Request counters plus connection reuse"""
+        stats = dict(self.stats)
+        stats["connections_reused"] = max(0, stats["requests"] - stats["connections_opened"])
+        stats["connection_reuse_ratio"] = (
+            round(stats["connections_reused"] / stats["requests"], 3)
+            if stats["requests"] else None
+        )
+        return stats
     
     async def get(
         self,
@@ -101,6 +174,10 @@ class HttpClient:
         """
         Make a GET request with all safeguards
         
+        When the cached entry has expired but the server sent an ETag or
+        Last-Modified with it, a conditional GET is issued instead; a 304
+        refreshes the cached entry and returns the stored body.
+        
         Args:
             url: Target URL
             use_cache: Whether to use cache
@@ -108,35 +185,67 @@ class HttpClient:
             force_refresh: Ignore cache and fetch fresh
         """
         cache_key = f"http:get:{url}"
+        validators_key = f"http:validators:{url}"
         
         # Check cache first
         if use_cache and not force_refresh:
-            cached = cache.get(cache_key)
+            cached = await async_cache.get(cache_key)
             if cached:
                 # Reconstruct response from cache
-                return self._response_from_cache(url, cached)
+                response = await self._response_from_cache(url, cached)
+                if response is not None:
+                    return response
         
-        # Acquire rate limit token
-        await self.rate_limiter.acquire()
+        # Validators outlive the cached entry so stale entries can be revalidated
+        validators = None
+        if use_cache and not force_refresh:
+            entry = await async_cache.get(validators_key)
+            if entry and (entry["value"].get("etag") or entry["value"].get("last_modified")):
+                validators = entry
         
-        # Make request with concurrency control
-        async with self.semaphore:
+        # Acquire this host's rate limit token and slot, then a global slot
+        async with self.host_limiter.slot(url), self.semaphore:
             try:
-                response = await self._fetch_with_retry(url)
+                if validators:
+                    self.stats["conditional_requests"] += 1
+                    response = await self._fetch_with_retry(
+                        url, self._conditional_headers(validators["value"])
+                    )
+                    
+                    if response.status_code == 304:
+                        # Unchanged - serve the stored body and refresh the entry
+                        cached_response = await self._response_from_cache(url, validators)
+                        if cached_response is not None:
+                            self.stats["not_modified"] += 1
+                            await self._store_response(
+                                url, validators["value"], validators["content_hash"],
+                                cache_ttl_hours
+                            )
+                            return cached_response
+                        
+                        # Body was evicted - fall back to a full fetch
+                        response = await self._fetch_with_retry(url)
+                else:
+                    response = await self._fetch_with_retry(url)
                 
                 # Cache successful response
                 if use_cache and response.status_code == 200:
+                    # Body is stored once per distinct content; the URL entry
+                    # only points at it
                     content_hash = compute_content_hash(response.text)
-                    cache.set(
-                        cache_key,
+                    await async_cache.put_body(response.text, content_hash)
+                    await self._store_response(
+                        url,
                         {
                             "status_code": response.status_code,
                             "headers": dict(response.headers),
-                            "text": response.text,
+                            "body_hash": content_hash,
                             "url": str(response.url),
+                            "etag": response.headers.get("etag"),
+                            "last_modified": response.headers.get("last-modified"),
                         },
-                        content_hash=content_hash,
-                        ttl_hours=cache_ttl_hours,
+                        content_hash,
+                        cache_ttl_hours,
                     )
                 
                 return response
@@ -145,6 +254,39 @@ class HttpClient:
                 # Log and re-raise
                 raise
     
+    async def _store_response(
+        self,
+        url: str,
+        value: Dict[str, Any],
+        content_hash: str,
+        cache_ttl_hours: Optional[int] = None,
+    ):
+        """Cache a response entry, plus its validators if the server sent any"""
+        await async_cache.set(
+            f"http:get:{url}",
+            value,
+            content_hash=content_hash,
+            ttl_hours=cache_ttl_hours,
+        )
+        
+        if value.get("etag") or value.get("last_modified"):
+            # content_hash keeps the body referenced while only validators remain
+            await async_cache.set(
+                f"http:validators:{url}",
+                value,
+                content_hash=content_hash,
+                ttl_hours=config.http_validator_ttl_days * 24,
+            )
+    
+    def _conditional_headers(self, value: Dict[str, Any]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from stored validators"""
+        headers = {}
+        if value.get("etag"):
+            headers["If-None-Match"] = value["etag"]
+        if value.get("last_modified"):
+            headers["If-Modified-Since"] = value["last_modified"]
+        return headers
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential_jitter(initial=1, max=60, jitter=2),
@@ -155,9 +297,16 @@ class HttpClient:
         )),
         reraise=True,
     )
-    async def _fetch_with_retry(self, url: str) -> httpx.Response:
+    async def _fetch_with_retry(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
         """Fetch URL with retry logic"""
-        response = await self.client.get(url)
+        self.stats["requests"] += 1
+        response = await self.client.get(
+            url, headers=headers, extensions={"trace": self._trace}
+        )
         
         # Raise for 4xx/5xx status codes (but not for 404 - that's expected for closed places)
         if response.status_code >= 500:
@@ -165,12 +314,23 @@ class HttpClient:
         
         return response
     
-    def _response_from_cache(self, url: str, cached: Dict) -> httpx.Response:
-        """Reconstruct httpx.Response from cache"""
+    async def _response_from_cache(self, url: str, cached: Dict) -> Optional[httpx.Response]:
+        """
+        Reconstruct httpx.Response from cache
+        Returns None if the referenced body is no longer stored
+        """
+        value = cached["value"]
+        if "body_hash" in value:
+            text = await async_cache.get_body(value["body_hash"])
+            if text is None:
+                return None
+        else:
+            text = value["text"]
+        
         return httpx.Response(
-            status_code=cached["value"]["status_code"],
-            headers=cached["value"]["headers"],
-            text=cached["value"]["text"],
+            status_code=value["status_code"],
+            headers=value["headers"],
+            text=text,
             request=httpx.Request("GET", url),
         )
     
@@ -180,17 +340,18 @@ class HttpClient:
         Returns status info without full content fetch
         """
         cache_key = f"http:check:{url}"
-        cached = cache.get(cache_key)
+        cached = await async_cache.get(cache_key)
         
         if cached:
             return cached["value"]
         
-        await self.rate_limiter.acquire()
-        
-        async with self.semaphore:
+        async with self.host_limiter.slot(url), self.semaphore:
             try:
                 # Use HEAD request first (lighter)
-                response = await self.client.head(url, follow_redirects=True)
+                self.stats["requests"] += 1
+                response = await self.client.head(
+                    url, follow_redirects=True, extensions={"trace": self._trace}
+                )
                 
                 result = {
                     "url": str(response.url),
@@ -202,7 +363,7 @@ class HttpClient:
                 }
                 
                 # Cache check result (shorter TTL for status checks)
-                cache.set(cache_key, result, ttl_hours=1)
+                await async_cache.set(cache_key, result, ttl_hours=1)
                 
                 return result
                 
@@ -213,7 +374,7 @@ class HttpClient:
                     "error": str(e),
                     "checked_at": time.time(),
                 }
-                cache.set(cache_key, result, ttl_hours=1)
+                await async_cache.set(cache_key, result, ttl_hours=1)
                 return result
                 
             except Exception as e:
@@ -223,7 +384,7 @@ class HttpClient:
                     "error": str(e),
                     "checked_at": time.time(),
                 }
-                cache.set(cache_key, result, ttl_hours=1)
+                await async_cache.set(cache_key, result, ttl_hours=1)
                 return result
     
     async def batch_check_urls(
@@ -241,11 +402,9 @@ class HttpClient:
                 progress_callback(url, result)
             return result
         
-        # Process in batches to avoid overwhelming
-        batch_size = config.max_concurrent_requests
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i:i + batch_size]
-            await asyncio.gather(*[check_one(url) for url in batch])
+        # Per-host and global limits in check_url bound the concurrency, so
+        # a slow host doesn't hold back URLs on other hosts
+        await asyncio.gather(*[check_one(url) for url in urls])
         
         return results
 
@@ -253,4 +412,8 @@ class HttpClient:
 # Sync wrapper for convenience
 def check_url_sync(url: str) -> Dict[str, Any]:
     """Synchronous URL check"""
-    return asyncio.run(HttpClient().check_url(url))
+    async def check():
+        async with HttpClient() as client:
+            return await client.check_url(url)
+    
+    return asyncio.run(check())
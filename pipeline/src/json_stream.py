@@ -0,0 +1,177 @@
+"""
+Streaming JSON writer for exports
+- Records are serialised one at a time from any iterable (e.g. a
+  generator), so the full document is never held as one string
+- Indented output has the same layout as json.dumps(indent=2,
+  ensure_ascii=False); compact=True writes it minified
+- orjson is used per record when installed (falls back to json for values
+  it can't encode)
+- Written to a temp file in the same directory and renamed on completion,
+  so readers never see half a file; the sha256 is computed while writing
+- compress=True also writes .gz (and .br, if brotli is installed) siblings,
+  compressed chunk by chunk as the file is written
+
+No relative imports, so standalone scripts can use it via sys.path
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # plain json for every record
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # only .gz siblings are written
+    brotli = None
+
+# Dates and dataclasses go through default=str, as with json
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson else 0
+# Bytes buffered before each write to the temp file
+_BUFFER_SIZE = 1 << 16
+
+
+def dumps(value: Any, compact: bool = False, level: int = 0) -> bytes:
+    """One value as UTF-8 JSON, indented as if nested `level` deep"""
+    data = None
+    if orjson is not None:
+        try:
+            option = _ORJSON_OPTIONS if compact else _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+            data = orjson.dumps(value, default=str, option=option)
+        except TypeError:  # e.g. non-str keys or ints beyond 64 bits
+            pass
+    if data is None:
+        if compact:
+            text = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+        else:
+            text = json.dumps(value, ensure_ascii=False, indent=2, default=str)
+        data = text.encode("utf-8")
+    if level and not compact:
+        # Newlines only occur between tokens (strings escape theirs)
+        data = data.replace(b"\n", b"\n" + b"  " * level)
+    return data
+
+
+class _AtomicWriter:
+    """
+    Buffered writes to a temp file next to `path`, renamed into place on commit
+    compress=True feeds every chunk to .gz / .br siblings as well
+    """
+    
+    def __init__(self, path: Path, compress: bool = False):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        self.file = os.fdopen(fd, "wb")
+        self.sha256 = hashlib.sha256()
+        self.buffer = bytearray()
+        self.siblings = []
+        if compress:
+            self.siblings.append(_CompressedSibling(path, ".gz"))
+            if brotli is not None:
+                self.siblings.append(_CompressedSibling(path, ".br"))
+    
+    def write(self, data: bytes):
+        self.buffer += data
+        if len(self.buffer) >= _BUFFER_SIZE:
+            self._flush()
+    
+    def _flush(self):
+        self.sha256.update(self.buffer)
+        self.file.write(self.buffer)
+        for sibling in self.siblings:
+            sibling.write(bytes(self.buffer))
+        self.buffer.clear()
+    
+    def commit(self) -> str:
+        self._flush()
+        for sibling in self.siblings:
+            sibling.commit()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return self.sha256.hexdigest()
+    
+    def abort(self):
+        for sibling in self.siblings:
+            sibling.abort()
+        self.file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class _CompressedSibling:
+    """<path>.gz / <path>.br, compressed from the chunks written to path"""
+    
+    def __init__(self, path: Path, suffix: str):
+        self.writer = _AtomicWriter(path.with_name(path.name + suffix))
+        if suffix == ".gz":
+            # No file name and mtime=0, so the same content gives the same bytes
+            gz = gzip.GzipFile(filename="", mode="wb", fileobj=self.writer, compresslevel=9, mtime=0)
+            self.write, self._finish = gz.write, gz.close
+        else:
+            compressor = brotli.Compressor(quality=11)
+            self.write = lambda data: self.writer.write(compressor.process(data))
+            self._finish = lambda: self.writer.write(compressor.finish())
+    
+    def commit(self):
+        self._finish()
+        self.writer.commit()
+    
+    def abort(self):
+        self.writer.abort()
+
+
+def write_json_stream(
+    path: Path,
+    records: Iterable[Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    key: Optional[str] = "locations",
+    compact: bool = False,
+    compress: bool = False,
+) -> Tuple[str, int]:
+    """
+    Write {"metadata": ..., key: [records...]} to path, or a bare
+    [records...] array when key is None; returns (sha256, record count)
+    compress=True also writes path.gz (and path.br) alongside
+    """
+    newline = b"" if compact else b"\n"
+    separator = b":" if compact else b": "
+    # Records sit one level deeper inside the object form
+    depth = 1 if key is None else 2
+    indent = b"" if compact else b"  " * depth
+    
+    writer = _AtomicWriter(Path(path), compress=compress)
+    count = 0
+    try:
+        if key is not None:
+            writer.write(b"{" + newline)
+            if metadata is not None:
+                writer.write(
+                    (b"" if compact else b"  ") + b'"metadata"' + separator
+                    + dumps(metadata, compact, level=1) + b"," + newline
+                )
+            writer.write((b"" if compact else b"  ") + dumps(key) + separator)
+        
+        for record in records:
+            writer.write((b"[" if count == 0 else b",") + newline + indent + dumps(record, compact, level=depth))
+            count += 1
+        if count:
+            writer.write(newline + (b"" if compact else b"  " * (depth - 1)) + b"]")
+        else:
+            writer.write(b"[]")
+        
+        if key is not None:
+            writer.write(newline + b"}")
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.commit(), count
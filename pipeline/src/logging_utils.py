@@ -196,6 +196,9 @@ class PipelineMetrics:
         # Timing
         self.stage_timings: Dict[str, float] = {}
         
+        # HttpClient.get_stats() for the run
+        self.http_stats: Dict[str, Any] = {}
+        
         # Errors
         self.errors: list = []
     
@@ -238,6 +241,7 @@ class PipelineMetrics:
             "places_updated": self.places_updated,
             "places_flagged": self.places_flagged,
             "stage_timings": self.stage_timings,
+            "http_stats": self.http_stats,
             "errors": self.errors,
         }
     
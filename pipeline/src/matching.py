@@ -0,0 +1,351 @@
+"""
+Fuzzy place matching for deduplication
+MinHash signatures over CJK character n-grams / Latin words with LSH banding
+for candidate lookup, then name, English name, address and distance checks
+
+Importable as src.matching or, by standalone scripts, via sys.path
+"""
+
+import re
+import struct
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .geo_index import GeoIndex, calculate_distance
+except ImportError:
+    # Loaded as a top-level module by a standalone script
+    from geo_index import GeoIndex, calculate_distance
+
+
+# Runs of CJK ideographs, or Latin/digit words
+_CJK_CHARS = '\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_TOKEN_RE = re.compile(f'[{_CJK_CHARS}]+|[a-z0-9\u00c0-\u024f]+')
+_CJK_RE = re.compile(f'[{_CJK_CHARS}]')
+
+# Address tokens that say nothing about which venue it is
+_ADDRESS_STOPWORDS = {
+    '香港', '九龍', '新界', 'hong', 'kong', 'hk', 'kowloon', 'new', 'territories',
+    'road', 'rd', 'street', 'st', 'shop', 'floor', 'f', 'g', 'no', 'unit',
+}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize name for comparison"""
+    name = name.lower()
+    name = re.sub(r'[^\w\s]', '', name)
+    name = re.sub(r'\s+', ' ', name).strip()
+    return name
+
+
+def name_grams(normalized: str, n: int = 2) -> Set[str]:
+    """
+    Split a normalized name into comparison grams
+    CJK runs (no spaces between words) become character n-grams;
+    Latin words are kept whole
+    """
+    grams = set()
+    for token in _TOKEN_RE.findall(normalized):
+        if _CJK_RE.match(token):
+            if len(token) <= n:
+                grams.add(token)
+            else:
+                grams.update(token[i:i + n] for i in range(len(token) - n + 1))
+        else:
+            grams.add(token)
+    return grams
+
+
+def address_tokens(address: str, n: int = 2) -> Set[str]:
+    """Address grams without generic place words"""
+    return name_grams(normalize_name(address), n) - _ADDRESS_STOPWORDS
+
+
+def gram_similarity(grams1: Set[str], grams2: Set[str]) -> float:
+    """Jaccard similarity of two gram sets"""
+    if not grams1 or not grams2:
+        return 0.0
+    intersection = len(grams1 & grams2)
+    return intersection / (len(grams1) + len(grams2) - intersection)
+
+
+# Words naming what kind of venue a place is -> venue type. Chinese names end
+# with the type (沙田公共圖書館, 沙田公園), so the rightmost one counts
+_VENUE_TYPES = {
+    '圖書館': 'library', '體育館': 'sports_centre', '運動場': 'sports_ground',
+    '游泳池': 'pool', '泳池': 'pool', '泳灘': 'beach', '海灘': 'beach',
+    '公園': 'park', '花園': 'park', '遊樂場': 'playground', '球場': 'pitch',
+    '博物館': 'museum', '科學館': 'science_museum', '太空館': 'space_museum',
+    '藝術館': 'art_museum', '文物館': 'heritage_museum', '單車館': 'velodrome',
+    '休憩處': 'sitting_out_area', '活動中心': 'activity_centre', '郊遊區': 'picnic_area',
+    '遊戲室': 'playroom', '商場': 'mall', '營地': 'campsite', '文娛中心': 'civic_centre',
+    'library': 'library', 'sports centre': 'sports_centre', 'sports center': 'sports_centre',
+    'sports ground': 'sports_ground', 'swimming pool': 'pool', 'beach': 'beach',
+    'park': 'park', 'garden': 'park', 'playground': 'playground',
+    'science museum': 'science_museum', 'space museum': 'space_museum',
+    'velodrome': 'velodrome', 'playroom': 'playroom',
+}
+
+# Numbers that tell sibling venues apart (界限街一號 / 二號體育館, 演講廳1 / 2)
+_NUMBER_RE = re.compile(r'\d+|[一二三四五六七八九十]+(?=[號期座])')
+
+
+def venue_type(normalized: str) -> Optional[str]:
+    """Venue type from the rightmost type word in a normalized name (longest on ties)"""
+    found, found_end = None, -1
+    for word, kind in _VENUE_TYPES.items():
+        start = normalized.rfind(word)
+        if start < 0:
+            continue
+        end = start + len(word)
+        # Latin words must be whole words ("park" in "parkview" isn't a park)
+        if word.isascii() and (
+            (start and normalized[start - 1].isalnum())
+            or (end < len(normalized) and normalized[end].isalnum())
+        ):
+            continue
+        if end > found_end or (end == found_end and len(word) > len(found[0])):
+            found, found_end = (word, kind), end
+    return found[1] if found else None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Coordinates arrive as floats, strings or blanks depending on the source"""
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class PlaceRecord:
+    """The fields matching looks at, from any place-shaped source"""
+    key: str
+    name: str
+    name_en: str = ''
+    district: str = ''
+    address: str = ''
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], key: Optional[str] = None) -> "PlaceRecord":
+        """Build from a sheet row (name_en) or a frontend/scout record (nameEn)"""
+        return cls(
+            key=str(key if key is not None else data.get('place_id') or data.get('id') or ''),
+            name=str(data.get('name') or ''),
+            name_en=str(data.get('name_en') or data.get('nameEn') or ''),
+            district=str(data.get('district') or ''),
+            address=str(data.get('address') or ''),
+            lat=_to_float(data.get('lat')),
+            lng=_to_float(data.get('lng')),
+        )
+    
+    @property
+    def has_coordinates(self) -> bool:
+        # Sources without a position fill in (0, 0), which is nowhere near Hong Kong
+        return self.lat is not None and self.lng is not None and (self.lat, self.lng) != (0, 0)
+
+
+@dataclass
+class Match:
+    """A probable duplicate of an indexed place"""
+    key: str
+    score: float
+    reason: str  # exact_name, name+district, name+distance, name+address
+    distance_m: Optional[float] = None
+    # Only nearby with a partly similar name: a possible duplicate for a
+    # person to check, not one to skip automatically
+    review: bool = False
+
+
+class _Features:
+    """Precomputed comparison features of one record"""
+    __slots__ = ('record', 'exact_names', 'name_sets', 'address', 'district', 'venue_type', 'numbers')
+    
+    def __init__(self, record: PlaceRecord, ngram_size: int):
+        self.record = record
+        self.exact_names = {
+            normalized for normalized in (normalize_name(record.name), normalize_name(record.name_en))
+            if normalized
+        }
+        self.name_sets = [name_grams(normalized, ngram_size) for normalized in self.exact_names]
+        self.address = address_tokens(record.address, ngram_size)
+        self.district = record.district or ''
+        self.venue_type = (
+            venue_type(normalize_name(record.name)) or venue_type(normalize_name(record.name_en))
+        )
+        self.numbers = frozenset(_NUMBER_RE.findall(record.name))
+
+
+class PlaceMatcher:
+    """
+    Index of known places answering "is this a duplicate?" in sub-millisecond time
+    Candidates come from exact names, MinHash LSH buckets and the GeoIndex
+    radius; each candidate is then scored exactly, so LSH only limits what is compared
+    """
+    
+    def __init__(
+        self,
+        name_threshold: float = 0.8,
+        ngram_size: int = 2,
+        num_perm: int = 64,
+        bands: int = 16,
+        near_name_threshold: float = 0.5,
+        near_distance_m: float = 200.0,
+        address_threshold: float = 0.6,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        
+        self.name_threshold = name_threshold
+        self.ngram_size = ngram_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.near_name_threshold = near_name_threshold
+        self.near_distance_m = near_distance_m
+        self.address_threshold = address_threshold
+        
+        self._unpack = struct.Struct(f'<{num_perm}I').unpack
+        self._gram_hashes = lru_cache(maxsize=65536)(self._hash_gram)
+        
+        self.features: Dict[str, _Features] = {}
+        self.exact: Dict[str, str] = {}
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+        self.geo = GeoIndex()
+    
+    def __len__(self) -> int:
+        return len(self.features)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.features
+    
+    def _hash_gram(self, gram: str) -> Tuple[int, ...]:
+        """num_perm independent 32-bit hashes of one gram (cached, grams repeat a lot)"""
+        return self._unpack(hashlib.shake_128(gram.encode('utf-8')).digest(4 * self.num_perm))
+    
+    def signature(self, grams: Set[str]) -> Tuple[int, ...]:
+        """MinHash signature of a gram set"""
+        return tuple(map(min, zip(*(self._gram_hashes(gram) for gram in grams))))
+    
+    def _band_keys(self, grams: Set[str]) -> List[Tuple[int, Tuple[int, ...]]]:
+        signature = self.signature(grams)
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+    
+    def add(self, record: PlaceRecord):
+        """Index a place (keys are expected to be unique)"""
+        features = _Features(record, self.ngram_size)
+        self.features[record.key] = features
+        
+        # First place wins, matching the order places are listed in
+        for normalized in features.exact_names:
+            self.exact.setdefault(normalized, record.key)
+        for grams in features.name_sets:
+            if grams:
+                for band_key in self._band_keys(grams):
+                    self.buckets[band_key].append(record.key)
+        if record.has_coordinates:
+            self.geo.add(record.key, record.lat, record.lng)
+    
+    def add_many(self, records: Iterable[PlaceRecord]):
+        for record in records:
+            self.add(record)
+    
+    def remove(self, key: str):
+        """Drop a place from the index"""
+        features = self.features.pop(key, None)
+        if features is None:
+            return
+        for normalized in features.exact_names:
+            if self.exact.get(normalized) == key:
+                del self.exact[normalized]
+        for grams in features.name_sets:
+            if grams:
+                for band_key in self._band_keys(grams):
+                    bucket = self.buckets.get(band_key)
+                    if bucket and key in bucket:
+                        bucket.remove(key)
+                        if not bucket:
+                            del self.buckets[band_key]
+        self.geo.remove(key)
+    
+    def candidates(self, record: PlaceRecord) -> Set[str]:
+        """Keys worth scoring against this record"""
+        features = _Features(record, self.ngram_size)
+        return self._candidates(features)
+    
+    def _candidates(self, features: _Features) -> Set[str]:
+        found = set()
+        for grams in features.name_sets:
+            if grams:
+                for band_key in self._band_keys(grams):
+                    found.update(self.buckets.get(band_key, ()))
+        
+        record = features.record
+        if record.has_coordinates:
+            found.update(key for key, _ in self.geo.radius(record.lat, record.lng, self.near_distance_m))
+        return found
+    
+    def _name_similarity(self, a: _Features, b: _Features) -> float:
+        """Best similarity across Chinese / English names of both places"""
+        return max(
+            (gram_similarity(x, y) for x in a.name_sets for y in b.name_sets),
+            default=0.0,
+        )
+    
+    def score(self, a: _Features, b: _Features) -> Optional[Match]:
+        """Decide whether two records are the same place"""
+        # A library next to a park of the same name is still a different venue,
+        # as is No. 2 next to No. 1
+        if a.venue_type and b.venue_type and a.venue_type != b.venue_type:
+            return None
+        if a.numbers and b.numbers and a.numbers != b.numbers:
+            return None
+        
+        key = b.record.key
+        name_sim = self._name_similarity(a, b)
+        
+        distance = None
+        if a.record.has_coordinates and b.record.has_coordinates:
+            distance = calculate_distance(a.record.lat, a.record.lng, b.record.lat, b.record.lng)
+        
+        if name_sim > self.name_threshold and a.district == b.district:
+            return Match(key, name_sim, 'name+district', distance)
+        
+        if distance is not None and distance <= self.near_distance_m:
+            if name_sim > self.name_threshold:
+                return Match(key, name_sim, 'name+distance', distance)
+            if name_sim >= self.near_name_threshold:
+                return Match(key, name_sim, 'name+distance', distance, review=True)
+        
+        if name_sim > self.name_threshold:
+            address_sim = gram_similarity(a.address, b.address)
+            if address_sim >= self.address_threshold:
+                return Match(key, name_sim, 'name+address', distance)
+        
+        return None
+    
+    def match(self, record: PlaceRecord) -> Optional[Match]:
+        """Find the indexed place this record most likely duplicates"""
+        features = _Features(record, self.ngram_size)
+        
+        for normalized in features.exact_names:
+            if normalized in self.exact:
+                return Match(self.exact[normalized], 1.0, 'exact_name')
+        
+        best = None
+        for key in self._candidates(features):
+            if key == record.key:
+                continue
+            found = self.score(features, self.features[key])
+            # A definite match beats any possible one
+            if found and (best is None or (not found.review, found.score) > (not best.review, best.score)):
+                best = found
+        return best
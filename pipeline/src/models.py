@@ -8,6 +8,10 @@ from enum import Enum
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, HttpUrl, validator
 
+# Layout of Place.to_frontend_dict(); bump it whenever the output changes,
+# so incremental exports rebuild records whose sheet rows didn't change
+FRONTEND_RECORD_VERSION = 1
+
 
 class PlaceStatus(str, Enum):
     """Status of a place in the pipeline"""
@@ -182,6 +186,7 @@ class Place(BaseModel):
     status: PlaceStatus = PlaceStatus.PENDING_REVIEW
     validation_stage: ValidationStage = ValidationStage.EXTRACTED
     confidence: int = Field(0, ge=0, le=100)
+    risk_tier: RiskTier = RiskTier.MEDIUM
     
     # Evidence & Sources
     evidence_urls: List[str] = Field(default_factory=list)
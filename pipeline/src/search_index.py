@@ -0,0 +1,265 @@
+"""
+Static inverted index for searching exported locations
+- Chinese text (name, address, description): single characters and
+  character bigrams, so any substring query matches without word splitting
+- Latin text (nameEn, and English words elsewhere): lowercase word tokens,
+  matched by prefix
+- Every query token has to match (AND), ranked by the best field each
+  token was found in: name > nameEn > address > description
+
+Serialised as <stem>-search.json next to locations.json:
+    terms     sorted list, so prefixes are a binary search away
+    postings  one list per term; each entry is (position delta << 4) | field
+              bits, positions being indexes into locations.json
+
+No relative imports, so standalone scripts can use it via sys.path
+"""
+
+import bisect
+import heapq
+import json
+import re
+import time
+from array import array
+from itertools import accumulate, product
+from math import prod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SEARCH_VERSION = "1.0"
+
+# Field bit, and the weight a match in that field scores
+FIELDS: Dict[str, Tuple[int, int]] = {
+    "name": (1, 8),
+    "nameEn": (2, 6),
+    "address": (4, 3),
+    "description": (8, 1),
+}
+# Field bits -> weight of the best field among them
+_WEIGHTS = bytes(
+    max((weight for bit, weight in FIELDS.values() if bits & bit), default=0) for bits in range(256)
+)
+
+_CJK_RUN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_WORD = re.compile(r"[a-z0-9]+")
+# Merged postings kept for recent prefix queries
+_PREFIX_CACHE_SIZE = 1024
+# Multi-token queries are ranked by intersecting per-weight position sets
+# while there are at most this many weight combinations
+_MAX_LEVEL_COMBINATIONS = 64
+
+
+def tokenize(text: str) -> set:
+    """Index terms for a field value"""
+    text = text.lower()
+    terms = set(_WORD.findall(text))
+    for run in _CJK_RUN.findall(text):
+        terms.update(run)
+        terms.update(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def query_tokens(query: str) -> List[Tuple[str, bool]]:
+    """(term, is_prefix) per query token: CJK bigrams (or the lone character) and word prefixes"""
+    query = query.lower()
+    tokens = []
+    for run in _CJK_RUN.findall(query):
+        if len(run) == 1:
+            tokens.append((run, False))
+        else:
+            tokens.extend((run[i:i + 2], False) for i in range(len(run) - 1))
+    tokens.extend((word, True) for word in _WORD.findall(query))
+    return tokens
+
+
+def build_postings(locations: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, int]]]:
+    """term -> [(position, field bits)] in position order"""
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    for position, location in enumerate(locations):
+        bits_by_term: Dict[str, int] = {}
+        for field, (bit, _) in FIELDS.items():
+            value = location.get(field)
+            if not value:
+                continue
+            for term in tokenize(str(value)):
+                bits_by_term[term] = bits_by_term.get(term, 0) | bit
+        for term, bits in bits_by_term.items():
+            postings.setdefault(term, []).append((position, bits))
+    return postings
+
+
+class Posting:
+    """Sorted positions of one term with the field bits / weight at each"""
+    
+    __slots__ = ("positions", "bits", "weights", "_ranked", "_levels", "_weight_map")
+    
+    def __init__(self, positions: array, bits: bytes):
+        self.positions = positions
+        self.bits = bits
+        self.weights = bits.translate(_WEIGHTS)
+        self._ranked: Optional[List[Tuple[int, int]]] = None
+        self._levels: Optional[List[Tuple[int, set]]] = None
+        self._weight_map: Optional[Dict[int, int]] = None
+    
+    def ranked(self) -> List[Tuple[int, int]]:
+        """(position, weight), best first (computed once)"""
+        if self._ranked is None:
+            self._ranked = sorted(zip(self.positions, self.weights), key=lambda item: (-item[1], item[0]))
+        return self._ranked
+    
+    def levels(self) -> List[Tuple[int, set]]:
+        """(weight, positions with that weight), highest weight first (computed once)"""
+        if self._levels is None:
+            by_weight: Dict[int, list] = {}
+            for position, weight in zip(self.positions, self.weights):
+                by_weight.setdefault(weight, []).append(position)
+            self._levels = [(weight, set(by_weight[weight])) for weight in sorted(by_weight, reverse=True)]
+        return self._levels
+    
+    def weight_map(self) -> Dict[int, int]:
+        """position -> weight (computed once)"""
+        if self._weight_map is None:
+            self._weight_map = dict(zip(self.positions, self.weights))
+        return self._weight_map
+
+
+_EMPTY = Posting(array("I"), b"")
+
+
+class SearchIndex:
+    """Query API over the serialised index"""
+    
+    def __init__(self, terms: List[str], postings: List[Posting], total: int):
+        self.terms = terms
+        self.postings = postings
+        self.total = total
+        self._term_ids = {term: i for i, term in enumerate(terms)}
+        self._prefixes: Dict[str, Posting] = {}
+        self.build_ms: Optional[float] = None
+    
+    @classmethod
+    def build(cls, locations: List[Dict[str, Any]]) -> "SearchIndex":
+        start = time.perf_counter()
+        postings = build_postings(locations)
+        terms = sorted(postings)
+        index = cls(
+            terms,
+            [
+                Posting(
+                    array("I", (position for position, _ in postings[term])),
+                    bytes(bits for _, bits in postings[term]),
+                )
+                for term in terms
+            ],
+            len(locations),
+        )
+        index.build_ms = round((time.perf_counter() - start) * 1000, 2)
+        return index
+    
+    def to_json(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Serialisable form, with optional extra metadata"""
+        encoded_postings = []
+        for posting in self.postings:
+            previous = 0
+            encoded = []
+            for position, bits in zip(posting.positions, posting.bits):
+                encoded.append(((position - previous) << 4) | bits)
+                previous = position
+            encoded_postings.append(encoded)
+        return {
+            "metadata": dict(
+                metadata or {},
+                total_count=self.total,
+                version=SEARCH_VERSION,
+                fields={field: bit for field, (bit, _) in FIELDS.items()},
+            ),
+            "terms": self.terms,
+            "postings": encoded_postings,
+        }
+    
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "SearchIndex":
+        postings = [
+            Posting(
+                array("I", accumulate(value >> 4 for value in encoded)),
+                bytes(value & 15 for value in encoded),
+            )
+            for encoded in data["postings"]
+        ]
+        return cls(data["terms"], postings, data["metadata"]["total_count"])
+    
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_json(json.load(f))
+    
+    def _posting(self, term: str, prefix: bool) -> Posting:
+        """Posting for one query token (every term a prefix covers, merged)"""
+        if not prefix:
+            i = self._term_ids.get(term)
+            return self.postings[i] if i is not None else _EMPTY
+        
+        start = bisect.bisect_left(self.terms, term)
+        end = bisect.bisect_left(self.terms, term + "\uffff", start)
+        if end - start <= 1:
+            return self.postings[start] if end > start else _EMPTY
+        
+        merged = self._prefixes.get(term)
+        if merged is None:
+            best: Dict[int, int] = {}
+            for posting in self.postings[start:end]:
+                for position, bits in zip(posting.positions, posting.bits):
+                    best[position] = best.get(position, 0) | bits
+            positions = array("I", sorted(best))
+            merged = Posting(positions, bytes(best[position] for position in positions))
+            if len(self._prefixes) >= _PREFIX_CACHE_SIZE:
+                self._prefixes.clear()
+            self._prefixes[term] = merged
+        return merged
+    
+    def search(self, query: str, limit: Optional[int] = 20) -> List[Tuple[int, int]]:
+        """(position, score) of locations matching every query token, best first"""
+        tokens = query_tokens(query)
+        if not tokens:
+            return []
+        
+        postings = sorted((self._posting(term, prefix) for term, prefix in tokens), key=lambda p: len(p.positions))
+        if len(postings) == 1:
+            ranked = postings[0].ranked()
+            return ranked[:limit] if limit else list(ranked)
+        
+        level_lists = [posting.levels() for posting in postings]
+        if prod(len(levels) for levels in level_lists) <= _MAX_LEVEL_COMBINATIONS:
+            return self._search_levels(level_lists, limit)
+        
+        matched = set(postings[0].positions)
+        for posting in postings[1:]:
+            matched.intersection_update(posting.positions)
+            if not matched:
+                return []
+        
+        weight_maps = [posting.weight_map() for posting in postings]
+        scored = [(-sum(weights[position] for weights in weight_maps), position) for position in matched]
+        top = heapq.nsmallest(limit, scored) if limit else sorted(scored)
+        return [(position, -score) for score, position in top]
+    
+    @staticmethod
+    def _search_levels(level_lists: List[List[Tuple[int, set]]], limit: Optional[int]) -> List[Tuple[int, int]]:
+        """
+        Rank by intersecting one weight level per token at a time, highest
+        total first, stopping once `limit` results are certain
+        """
+        by_score: Dict[int, List[List[set]]] = {}
+        for combination in product(*level_lists):
+            score = sum(weight for weight, _ in combination)
+            by_score.setdefault(score, []).append(sorted((positions for _, positions in combination), key=len))
+        
+        results: List[Tuple[int, int]] = []
+        for score in sorted(by_score, reverse=True):
+            hits = set()
+            for sets in by_score[score]:
+                hits |= sets[0].intersection(*sets[1:])
+            results.extend((position, score) for position in sorted(hits))
+            if limit and len(results) >= limit:
+                return results[:limit]
+        return results
@@ -0,0 +1,410 @@
+"""
+Storage backends behind SheetsClient
+- GoogleSheetsBackend: the real spreadsheet (gspread + Drive API)
+- LocalSheetsBackend: SQLite stand-in answering the same worksheet calls,
+  with simulated per-request latency and per-minute quotas, for offline
+  runs and load tests (SHEETS_BACKEND=local)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import gspread
+import requests
+from gspread.utils import a1_to_rowcol, numericise_all, rowcol_to_a1
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+
+from .config import config
+
+
+class GoogleSheetsBackend:
+    """Google Sheets via a service account"""
+    
+    name = "google"
+    
+    def __init__(self):
+        self.credentials = None
+        self.client = self._authenticate()
+        self._drive = None
+    
+    def _authenticate(self):
+        """Authenticate with Google Sheets API"""
+        # Try service account first
+        creds_path = config.base_dir / "credentials.json"
+        
+        if creds_path.exists():
+            creds = Credentials.from_service_account_file(
+                str(creds_path),
+                scopes=[
+                    "https://www.googleapis.com/auth/spreadsheets",
+                    "https://www.googleapis.com/auth/drive",
+                ]
+            )
+            self.credentials = creds
+            return gspread.authorize(creds)
+        
+        # Fall back to OAuth (for local development)
+        # This would require a token.json file
+        raise FileNotFoundError(
+            f"credentials.json not found at {creds_path}. "
+            "Please download service account credentials from Google Cloud Console."
+        )
+    
+    def open(self, spreadsheet_id: str):
+        """gspread Spreadsheet"""
+        return self.client.open_by_key(spreadsheet_id)
+    
+    def revision(self, spreadsheet_id: str) -> Dict[str, Any]:
+        """Drive version and modifiedTime of the spreadsheet"""
+        if self._drive is None:
+            self._drive = build("drive", "v3", credentials=self.credentials, cache_discovery=False)
+        return self._drive.files().get(
+            fileId=spreadsheet_id,
+            fields="version,modifiedTime",
+        ).execute()
+
+
+def _quota_error(kind: str) -> gspread.exceptions.APIError:
+    """The 429 Google returns once a per-minute quota is used up"""
+    response = requests.Response()
+    response.status_code = 429
+    response._content = json.dumps({
+        "error": {
+            "code": 429,
+            "status": "RESOURCE_EXHAUSTED",
+            "message": f"Quota exceeded for quota metric '{kind.title()} requests' "
+                       "and limit 'per minute per user' (simulated)",
+        }
+    }).encode()
+    return gspread.exceptions.APIError(response)
+
+
+def _cell(value: Any) -> str:
+    """Cell value as Sheets would show it"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+
+class LocalSheetsBackend:
+    """
+    SQLite-backed spreadsheets
+    Every call made through LocalSpreadsheet / LocalWorksheet counts as one
+    API request: it sleeps for the configured latency and raises the same
+    429 APIError as Google once the per-minute read/write quota is spent
+    """
+    
+    name = "local"
+    
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        latency_ms: Optional[int] = None,
+        read_quota: Optional[int] = None,
+        write_quota: Optional[int] = None,
+    ):
+        self.db_path = Path(db_path or config.sheets_local_path)
+        self.client = None
+        self.latency = (config.sheets_local_latency_ms if latency_ms is None else latency_ms) / 1000
+        # Requests per minute, 0 = unlimited
+        self.quotas = {
+            "read": config.sheets_local_read_quota if read_quota is None else read_quota,
+            "write": config.sheets_local_write_quota if write_quota is None else write_quota,
+        }
+        self._calls: Dict[str, deque] = defaultdict(deque)
+        self.request_counts: Dict[str, int] = defaultdict(int)
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_db()
+    
+    def _init_db(self):
+        """Initialize worksheet / row / revision tables"""
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS worksheets (
+                    spreadsheet_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    sheet_id INTEGER NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    col_count INTEGER NOT NULL,
+                    PRIMARY KEY (spreadsheet_id, title)
+                );
+                CREATE TABLE IF NOT EXISTS rows (
+                    spreadsheet_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    row_num INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (spreadsheet_id, title, row_num)
+                );
+                CREATE TABLE IF NOT EXISTS revisions (
+                    spreadsheet_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    modified_time TEXT NOT NULL
+                );
+            """)
+    
+    def close(self):
+        self._conn.close()
+    
+    def _request(self, kind: str):
+        """One simulated API call: latency, then the per-minute quota"""
+        if self.latency:
+            time.sleep(self.latency)
+        
+        with self._lock:
+            now = time.monotonic()
+            calls = self._calls[kind]
+            while calls and now - calls[0] >= 60:
+                calls.popleft()
+            
+            limit = self.quotas.get(kind)
+            if limit and len(calls) >= limit:
+                self.request_counts["throttled"] += 1
+                raise _quota_error(kind)
+            calls.append(now)
+            self.request_counts[kind] += 1
+    
+    def open(self, spreadsheet_id: Optional[str] = None) -> "LocalSpreadsheet":
+        """Spreadsheet handle (worksheets are created on first use)"""
+        spreadsheet_id = spreadsheet_id or "local"
+        # Versions start from the clock, so a recreated database never reuses
+        # one that a sheet snapshot might still be keyed by
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO revisions VALUES (?, ?, ?)",
+                (spreadsheet_id, int(time.time() * 1000), datetime.utcnow().isoformat() + "Z"),
+            )
+        return LocalSpreadsheet(self, spreadsheet_id)
+    
+    def revision(self, spreadsheet_id: str) -> Dict[str, Any]:
+        """Same shape as the Drive files.get response"""
+        self._request("drive")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, modified_time FROM revisions WHERE spreadsheet_id = ?",
+                (spreadsheet_id,),
+            ).fetchone()
+        return {"version": str(row[0]), "modifiedTime": row[1]}
+    
+    def _bump_revision(self, spreadsheet_id: str):
+        self._conn.execute("""
+            UPDATE revisions SET version = version + 1, modified_time = ?
+            WHERE spreadsheet_id = ?
+        """, (datetime.utcnow().isoformat() + "Z", spreadsheet_id))
+    
+    def _titles(self, spreadsheet_id: str) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT title FROM worksheets WHERE spreadsheet_id = ? ORDER BY sheet_id",
+                (spreadsheet_id,),
+            )]
+    
+    def _add_worksheet(self, spreadsheet_id: str, title: str, rows: int, cols: int):
+        with self._lock, self._conn:
+            sheet_id = self._conn.execute(
+                "SELECT COALESCE(MAX(sheet_id), -1) + 1 FROM worksheets WHERE spreadsheet_id = ?",
+                (spreadsheet_id,),
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT INTO worksheets VALUES (?, ?, ?, ?, ?)",
+                (spreadsheet_id, title, sheet_id, rows, cols),
+            )
+            self._bump_revision(spreadsheet_id)
+    
+    def _read_rows(self, spreadsheet_id: str, title: str) -> List[List[str]]:
+        """Every row up to the last non-empty one (gaps as empty rows)"""
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT row_num, data FROM rows WHERE spreadsheet_id = ? AND title = ? ORDER BY row_num",
+                (spreadsheet_id, title),
+            ).fetchall()
+        
+        values: List[List[str]] = []
+        for row_num, data in stored:
+            while len(values) < row_num - 1:
+                values.append([])
+            values.append(json.loads(data))
+        return values
+    
+    def _last_row(self, spreadsheet_id: str, title: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(MAX(row_num), 0) FROM rows WHERE spreadsheet_id = ? AND title = ?",
+                (spreadsheet_id, title),
+            ).fetchone()[0]
+    
+    def _write_cells(self, spreadsheet_id: str, updates: List[tuple]):
+        """Write (title, row, col, [[values]]) blocks as one transaction"""
+        with self._lock, self._conn:
+            for title, first_row, first_col, block in updates:
+                for offset, values in enumerate(block):
+                    row_num = first_row + offset
+                    stored = self._conn.execute(
+                        "SELECT data FROM rows WHERE spreadsheet_id = ? AND title = ? AND row_num = ?",
+                        (spreadsheet_id, title, row_num),
+                    ).fetchone()
+                    row = json.loads(stored[0]) if stored else []
+                    end = first_col - 1 + len(values)
+                    if len(row) < end:
+                        row.extend([""] * (end - len(row)))
+                    row[first_col - 1:end] = [_cell(value) for value in values]
+                    while row and row[-1] == "":
+                        row.pop()
+                    
+                    if row:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+                            (spreadsheet_id, title, row_num, json.dumps(row, ensure_ascii=False)),
+                        )
+                    else:
+                        self._conn.execute(
+                            "DELETE FROM rows WHERE spreadsheet_id = ? AND title = ? AND row_num = ?",
+                            (spreadsheet_id, title, row_num),
+                        )
+            self._bump_revision(spreadsheet_id)
+
+
+def _parse_range(range_name: str, default_title: Optional[str] = None) -> tuple:
+    """Split "'Places'!B5:C6" into ("Places", 5, 2)"""
+    title = default_title
+    if "!" in range_name:
+        title, range_name = range_name.rsplit("!", 1)
+        title = title.strip("'")
+    row, col = a1_to_rowcol(range_name.split(":")[0])
+    return title, row, col
+
+
+class LocalSpreadsheet:
+    """The part of gspread.Spreadsheet that SheetsClient and the scripts use"""
+    
+    def __init__(self, backend: LocalSheetsBackend, spreadsheet_id: str):
+        self.backend = backend
+        self.id = spreadsheet_id
+        self.title = spreadsheet_id
+    
+    def worksheets(self) -> List["LocalWorksheet"]:
+        self.backend._request("read")
+        return [LocalWorksheet(self, title) for title in self.backend._titles(self.id)]
+    
+    def worksheet(self, title: str) -> "LocalWorksheet":
+        self.backend._request("read")
+        if title not in self.backend._titles(self.id):
+            raise gspread.WorksheetNotFound(title)
+        return LocalWorksheet(self, title)
+    
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, **kwargs) -> "LocalWorksheet":
+        self.backend._request("write")
+        self.backend._add_worksheet(self.id, title, rows, cols)
+        return LocalWorksheet(self, title)
+    
+    def values_batch_update(self, body: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Only the values are kept, valueInputOption makes no difference here"""
+        self.backend._request("write")
+        updates = []
+        for entry in body.get("data", []):
+            title, row, col = _parse_range(entry["range"])
+            updates.append((title, row, col, entry["values"]))
+        self.backend._write_cells(self.id, updates)
+        return {"spreadsheetId": self.id, "totalUpdatedRows": sum(len(u[3]) for u in updates)}
+
+
+class LocalWorksheet:
+    """The part of gspread.Worksheet that SheetsClient and the scripts use"""
+    
+    def __init__(self, spreadsheet: LocalSpreadsheet, title: str):
+        self.spreadsheet = spreadsheet
+        self.backend = spreadsheet.backend
+        self.title = title
+    
+    def get_all_values(self) -> List[List[str]]:
+        self.backend._request("read")
+        values = self.backend._read_rows(self.spreadsheet.id, self.title)
+        width = max((len(row) for row in values), default=0)
+        return [row + [""] * (width - len(row)) for row in values]
+    
+    def get_all_records(self, head: int = 1, default_blank: Any = "", **kwargs) -> List[Dict[str, Any]]:
+        """Rows below the header as dicts, numbers numericised like gspread"""
+        values = self.get_all_values()
+        if len(values) < head:
+            return []
+        
+        keys = values[head - 1]
+        return [
+            dict(zip(keys, numericise_all(row[:len(keys)] + [""] * (len(keys) - len(row)),
+                                          default_blank=default_blank)))
+            for row in values[head:]
+        ]
+    
+    def row_values(self, row: int, **kwargs) -> List[str]:
+        self.backend._request("read")
+        values = self.backend._read_rows(self.spreadsheet.id, self.title)
+        return list(values[row - 1]) if row <= len(values) else []
+    
+    def col_values(self, col: int, **kwargs) -> List[str]:
+        self.backend._request("read")
+        values = self.backend._read_rows(self.spreadsheet.id, self.title)
+        column = [row[col - 1] if len(row) >= col else "" for row in values]
+        while column and column[-1] == "":
+            column.pop()
+        return column
+    
+    def append_row(self, values: List[Any], **kwargs) -> Dict[str, Any]:
+        return self.append_rows([values], **kwargs)
+    
+    def append_rows(self, values: List[List[Any]], **kwargs) -> Dict[str, Any]:
+        """Rows go after the last non-empty row, like the append API"""
+        self.backend._request("write")
+        with self.backend._lock:
+            first_row = self.backend._last_row(self.spreadsheet.id, self.title) + 1
+            self.backend._write_cells(self.spreadsheet.id, [(self.title, first_row, 1, values)])
+        
+        last_row = first_row + len(values) - 1
+        width = max((len(row) for row in values), default=1)
+        return {
+            "spreadsheetId": self.spreadsheet.id,
+            "updates": {
+                "updatedRange": f"'{self.title}'!A{first_row}:{rowcol_to_a1(last_row, width)}",
+                "updatedRows": len(values),
+            },
+        }
+    
+    def update(self, values: Any = None, range_name: Any = None, **kwargs) -> Dict[str, Any]:
+        # Accept the pre-6.0 update(range_name, values) order as gspread does
+        if isinstance(values, str) and not isinstance(range_name, str):
+            values, range_name = range_name, values
+        self.backend._request("write")
+        _, row, col = _parse_range(range_name or "A1", self.title)
+        self.backend._write_cells(self.spreadsheet.id, [(self.title, row, col, values)])
+        return {"updatedRange": range_name, "updatedRows": len(values)}
+    
+    def update_cell(self, row: int, col: int, value: Any) -> Dict[str, Any]:
+        return self.update([[value]], rowcol_to_a1(row, col))
+    
+    def batch_update(self, data: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        self.backend._request("write")
+        updates = []
+        for entry in data:
+            title, row, col = _parse_range(entry["range"], self.title)
+            updates.append((title, row, col, entry["values"]))
+        self.backend._write_cells(self.spreadsheet.id, updates)
+        return {"totalUpdatedRows": sum(len(u[3]) for u in updates)}
+
+
+def create_backend(name: Optional[str] = None):
+    """Backend named by SHEETS_BACKEND (google | local)"""
+    name = (name or config.sheets_backend).lower()
+    if name == "google":
+        return GoogleSheetsBackend()
+    if name == "local":
+        return LocalSheetsBackend()
+    raise ValueError(f"Unknown SHEETS_BACKEND: {name} (expected 'google' or 'local')")
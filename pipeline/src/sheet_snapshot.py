@@ -0,0 +1,115 @@
+"""
+On-disk snapshot of Google Sheets worksheets
+Keyed by the spreadsheet's Drive revision, so a sheet is only downloaded
+again after someone (or something) has edited it
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .body_codec import compress_body, decompress_body
+from .config import config
+
+
+_SQL_GET = """
+    SELECT revision, modified_time, fetched_at, codec, data, row_count
+    FROM snapshots
+    WHERE spreadsheet_id = ? AND sheet_name = ?
+"""
+_SQL_SET = """
+    INSERT OR REPLACE INTO snapshots
+        (spreadsheet_id, sheet_name, revision, modified_time, fetched_at, codec, data, row_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_DELETE = "DELETE FROM snapshots WHERE spreadsheet_id = ? AND sheet_name = ?"
+
+
+@dataclass
+class Snapshot:
+    """Worksheet values (header row first) as of a Drive revision"""
+    revision: str
+    modified_time: Optional[str]
+    fetched_at: datetime
+    values: List[List[Any]]
+
+
+class SheetSnapshot:
+    """SQLite store of get_all_values() results, one compressed blob per worksheet"""
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or (config.cache_dir / "sheet_snapshot.db")
+        self._lock = threading.Lock()
+        self._init_db()
+    
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection, committed and closed on exit"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _init_db(self):
+        """Initialize snapshot table"""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    spreadsheet_id TEXT NOT NULL,
+                    sheet_name TEXT NOT NULL,
+                    revision TEXT NOT NULL,
+                    modified_time TEXT,
+                    fetched_at TIMESTAMP NOT NULL,
+                    codec TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    PRIMARY KEY (spreadsheet_id, sheet_name)
+                )
+            """)
+    
+    def load(self, spreadsheet_id: str, sheet_name: str) -> Optional[Snapshot]:
+        """Stored snapshot of a worksheet, if any"""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(_SQL_GET, (spreadsheet_id, sheet_name)).fetchone()
+        if not row:
+            return None
+        
+        revision, modified_time, fetched_at, codec, data, _ = row
+        try:
+            values = json.loads(decompress_body(codec, data))
+        except (ValueError, json.JSONDecodeError) as e:
+            print(f"Ignoring unreadable sheet snapshot for {sheet_name}: {e}")
+            return None
+        if values and not isinstance(values[0], list):
+            return None  # Older snapshot of get_all_records() dicts
+        return Snapshot(revision, modified_time, datetime.fromisoformat(fetched_at), values)
+    
+    def save(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        revision: str,
+        values: List[List[Any]],
+        modified_time: Optional[str] = None,
+    ) -> Snapshot:
+        """Store a freshly downloaded worksheet"""
+        fetched_at = datetime.utcnow()
+        codec, data = compress_body(json.dumps(values, ensure_ascii=False, default=str))
+        with self._lock, self._connect() as conn:
+            conn.execute(_SQL_SET, (
+                spreadsheet_id, sheet_name, revision, modified_time,
+                fetched_at.isoformat(), codec, data, max(len(values) - 1, 0),
+            ))
+        return Snapshot(revision, modified_time, fetched_at, values)
+    
+    def invalidate(self, spreadsheet_id: str, sheet_name: str):
+        """Drop a worksheet's snapshot"""
+        with self._lock, self._connect() as conn:
+            conn.execute(_SQL_DELETE, (spreadsheet_id, sheet_name))
@@ -3,18 +3,58 @@ Google Sheets client for staging and CMS
 Handles read/write operations with the Google Sheets API
 """
 
+import re
 import json
+import time
 import uuid
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
 import gspread
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from gspread.utils import numericise_all
+from pydantic import HttpUrl, TypeAdapter
 
 from .config import config
 from .models import Place, PlaceStatus, RiskTier, ValidationStage
+from .sheet_backends import create_backend
+from .sheet_snapshot import SheetSnapshot, Snapshot
+from .sheets_gateway import get_gateway, value_ranges
+
+
+# Lookups for the columnar row -> Place path (see SheetsClient._values_to_places)
+_STATUSES = {status.value: status for status in PlaceStatus}
+_STAGES = {stage.value: stage for stage in ValidationStage}
+_RISK_TIERS = {tier.value: tier for tier in RiskTier}
+_HTTP_URL = TypeAdapter(HttpUrl)
+_INVALID = object()
+
+
+def _memoised(parse):
+    """Per-call cache for columns with many repeated values (dates, URLs)"""
+    cache = {}
+    def parse_cached(value):
+        if value not in cache:
+            cache[value] = parse(value)
+        return cache[value]
+    return parse_cached
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _parse_url(value: str):
+    try:
+        return _HTTP_URL.validate_python(value)
+    except ValueError:
+        return _INVALID
 
 
 class SheetsClient:
@@ -63,43 +103,81 @@ class SheetsClient:
         "resolution",
         "false_alarm_reason",
     ]
+    # Columns with no Place field: blank in new rows, never touched by update_place
+    UNMAPPED_COLUMNS = {"google_maps_url", "checked_at"}
     
-    def __init__(self):
-        self.spreadsheet_id = config.google_sheets_id
-        self.client = self._authenticate()
-        self.sheet = self.client.open_by_key(self.spreadsheet_id)
+    # Rows per values.batchUpdate / append request
+    WRITE_BATCH_SIZE = 200
+    # Buffered rows that trigger an early flush while batching
+    AUTO_FLUSH_ROWS = 500
     
-    def _authenticate(self):
-        """Authenticate with Google Sheets API"""
-        # Try service account first
-        creds_path = config.base_dir / "credentials.json"
-        
-        if creds_path.exists():
-            creds = Credentials.from_service_account_file(
-                str(creds_path),
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive",
-                ]
-            )
-            return gspread.authorize(creds)
+    def __init__(self, backend=None):
+        # Google Sheets, or the offline stand-in with SHEETS_BACKEND=local
+        self.backend = backend or create_backend()
+        # Quota-aware scheduling / retries, shared by every client in the process
+        self.gateway = get_gateway()
+        self.client = self.backend.client
+        self.sheet = self.backend.open(config.google_sheets_id)
+        self.spreadsheet_id = self.sheet.id
         
-        # Fall back to OAuth (for local development)
-        # This would require a token.json file
-        raise FileNotFoundError(
-            f"credentials.json not found at {creds_path}. "
-            "Please download service account credentials from Google Cloud Console."
-        )
+        self._worksheets: Dict[str, Any] = {}
+        # sheet name -> place_id -> row number, loaded once per sheet
+        self._row_index: Dict[str, Dict[str, int]] = {}
+        
+        # Write buffer (see batch()): sheet name -> place_id -> row values
+        # (updates: column -> value, only the columns being written)
+        self.buffering = False
+        self._buffer_lock = threading.RLock()
+        self._pending_updates: Dict[str, Dict[str, Dict[int, Any]]] = defaultdict(dict)
+        self._pending_appends: Dict[str, Dict[str, list]] = defaultdict(dict)
+        
+        self.write_stats = {
+            "rows_updated": 0,
+            "rows_appended": 0,
+            "write_requests": 0,
+        }
+        
+        # Read side: worksheet records are reused until the Drive revision changes
+        self.snapshot = SheetSnapshot() if config.sheets_snapshot_enabled else None
+        self._revision: Optional[Dict[str, Any]] = None
+        self._revision_checked_at = 0.0
+        self._snapshots: Dict[str, Snapshot] = {}
+        # sheet name -> (revision, parsed places)
+        self._places: Dict[str, tuple] = {}
+        
+        self.read_stats = {
+            "downloads": 0,
+            "snapshot_hits": 0,
+            "memory_hits": 0,
+            "revision_checks": 0,
+        }
     
     def get_worksheet(self, sheet_name: str = "Places"):
-        """Get or create a worksheet"""
+        """Get or create a worksheet (cached, each lookup is an API call)"""
+        if sheet_name in self._worksheets:
+            return self._worksheets[sheet_name]
+        
         try:
-            return self.sheet.worksheet(sheet_name)
+            ws = self.gateway.read(self.sheet.worksheet, sheet_name)
         except gspread.WorksheetNotFound:
             # Create new worksheet with headers
-            ws = self.sheet.add_worksheet(sheet_name, rows=1000, cols=len(self.COLUMNS))
-            ws.append_row(self.COLUMNS)
-            return ws
+            ws = self.gateway.write(self.sheet.add_worksheet, sheet_name, rows=1000, cols=len(self.COLUMNS))
+            self.gateway.append(ws.append_row, self.COLUMNS)
+        
+        self._worksheets[sheet_name] = ws
+        return ws
+    
+    def _get_row_index(self, sheet_name: str = "Places") -> Dict[str, int]:
+        """place_id -> sheet row number, from a single column read"""
+        if sheet_name not in self._row_index:
+            ws = self.get_worksheet(sheet_name)
+            ids = self.gateway.read(ws.col_values, 1)
+            self._row_index[sheet_name] = {
+                place_id: row_num
+                for row_num, place_id in enumerate(ids, start=1)
+                if row_num > 1 and place_id
+            }
+        return self._row_index[sheet_name]
     
     def _place_to_row(self, place: Place) -> list:
         """Convert Place model to sheet row"""
@@ -127,6 +205,7 @@ class SheetsClient:
             str(place.website_url) if place.website_url else "",
             str(place.facebook_url) if place.facebook_url else "",
             place.instagram_url or "",
+            "",  # google_maps_url
             place.status.value,
             place.validation_stage.value,
             place.confidence,
@@ -138,6 +217,7 @@ class SheetsClient:
             place.updated_at.isoformat() if place.updated_at else "",
             place.last_checked_at.isoformat() if place.last_checked_at else "",
             place.next_check_at.isoformat() if place.next_check_at else "",
+            "",  # checked_at
             place.review_owner or "",
             place.review_due_at.isoformat() if place.review_due_at else "",
             place.resolution or "",
@@ -189,20 +269,259 @@ class SheetsClient:
             false_alarm_reason=data.get("false_alarm_reason") or None,
         )
     
-    def get_all_places(self, sheet_name: str = "Places") -> List[Place]:
-        """Get all places from sheet"""
+    def _current_revision(self) -> Optional[str]:
+        """
+        Drive version of the spreadsheet, re-checked at most every
+        SHEETS_REVISION_CHECK_SECONDS (and after our own writes)
+        """
+        now = time.monotonic()
+        if (self._revision is not None and
+                now - self._revision_checked_at < config.sheets_revision_check_seconds):
+            return self._revision["version"]
+        
+        self.read_stats["revision_checks"] += 1
+        self._revision_checked_at = now
+        try:
+            self._revision = self.backend.revision(self.spreadsheet_id)
+        except Exception as e:
+            print(f"Drive revision check failed, reading the sheet directly from now on: {e}")
+            self._revision = None
+            self.snapshot = None
+            return None
+        
+        return self._revision["version"]
+    
+    def _get_values(self, sheet_name: str) -> Snapshot:
+        """
+        Worksheet grid from memory, the on-disk snapshot, or a download
+        (an unsaved one with an empty revision when Drive can't be asked)
+        """
+        revision = self._current_revision() if self.snapshot else None
+        
+        if revision is not None:
+            cached = self._snapshots.get(sheet_name)
+            if cached and cached.revision == revision:
+                self.read_stats["memory_hits"] += 1
+                return cached
+            
+            stored = self.snapshot.load(self.spreadsheet_id, sheet_name)
+            if stored and stored.revision == revision:
+                self.read_stats["snapshot_hits"] += 1
+                self._snapshots[sheet_name] = stored
+                return stored
+        
         ws = self.get_worksheet(sheet_name)
-        records = ws.get_all_records()
+        values = self.gateway.read(ws.get_all_values)
+        self.read_stats["downloads"] += 1
+        
+        if revision is None:
+            return Snapshot(revision="", modified_time=None, fetched_at=datetime.utcnow(), values=values)
+        
+        self._snapshots[sheet_name] = self.snapshot.save(
+            self.spreadsheet_id, sheet_name, revision, values,
+            modified_time=self._revision.get("modifiedTime"),
+        )
+        return self._snapshots[sheet_name]
+    
+    def _sheet_changed(self, sheet_name: str):
+        """Our own write: force a revision check and drop cached reads"""
+        self._revision = None
+        self._snapshots.pop(sheet_name, None)
+        self._places.pop(sheet_name, None)
+        if self.snapshot:
+            self.snapshot.invalidate(self.spreadsheet_id, sheet_name)
+    
+    def get_all_places(self, sheet_name: str = "Places") -> List[Place]:
+        """Get all places from sheet (copies, safe to modify)"""
+        snapshot = self._get_values(sheet_name)
+        values = snapshot.values
+        
+        cached = self._places.get(sheet_name)
+        if cached and cached[0] is snapshot:
+            return [place.model_copy() for place in cached[1]]
+        
+        # Data starts at row 2, so the row map comes for free
+        if values and "place_id" in values[0]:
+            id_col = values[0].index("place_id")
+            self._row_index[sheet_name] = {
+                row[id_col]: row_num
+                for row_num, row in enumerate(values[1:], start=2)
+                if len(row) > id_col and row[id_col]
+            }
+        
+        places = self._values_to_places(values)
+        
+        if not snapshot.revision:
+            return places
+        self._places[sheet_name] = (snapshot, places)
+        return [place.model_copy() for place in places]
+    
+    def get_all_values(self, sheet_name: str = "Places") -> List[list]:
+        """Raw worksheet grid, header row first (shared with the cache, don't modify)"""
+        return self._get_values(sheet_name).values
+    
+    def rows_to_places(self, header: list, rows: List[list]) -> List[Optional[Place]]:
+        """Places for get_all_values() rows, None where a row doesn't parse"""
+        return self._values_to_places([header] + rows, skip_invalid=False)
+    
+    def _values_to_places(self, values: List[list], skip_invalid: bool = True) -> List[Optional[Place]]:
+        """
+        Columnar get_all_values() -> Place conversion
+        Each column is parsed in one pass (dates and URLs memoised, enums by
+        lookup); rows that come out valid are built with Place.model_construct,
+        the rest get full validation through _dict_to_place
+        """
+        if len(values) < 2:
+            return []
+        
+        header, rows = values[0], values[1:]
+        count = len(rows)
+        positions = {name: i for i, name in enumerate(header)}
+        fallback = set()  # row positions that need full validation
+        
+        def column(name: str, default: Any = None) -> list:
+            if name not in positions:
+                return [default] * count
+            i = positions[name]
+            return [str(row[i]) if i < len(row) else "" for row in rows]
+        
+        def optional(name: str) -> list:
+            return [value or None for value in column(name)]
+        
+        def numbers(name: str, cast, low, high, blank=None) -> list:
+            parsed = []
+            for pos, value in enumerate(column(name, "")):
+                if not value.strip():
+                    parsed.append(blank)
+                    continue
+                try:
+                    number = cast(value)
+                except ValueError:
+                    number = None
+                if number is None or not low <= number <= high:
+                    fallback.add(pos)
+                parsed.append(number)
+            return parsed
+        
+        def enums(name: str, lookup: Dict[str, Any], default: str) -> list:
+            parsed = []
+            for pos, value in enumerate(column(name, "")):
+                member = lookup.get(value or default)
+                if member is None:
+                    fallback.add(pos)
+                parsed.append(member)
+            return parsed
+        
+        def urls(name: str) -> list:
+            parse = _memoised(_parse_url)
+            parsed = []
+            for pos, value in enumerate(column(name, "")):
+                url = parse(value) if value else None
+                if url is _INVALID:
+                    fallback.add(pos)
+                parsed.append(url)
+            return parsed
+        
+        def datetimes(name: str) -> list:
+            parse = _memoised(_parse_datetime)
+            return [parse(value) if value else None for value in column(name, "")]
+        
+        def lists(name: str, separator: str = ",") -> list:
+            return [
+                [item.strip() for item in value.split(separator) if item.strip()]
+                for value in column(name, "")
+            ]
+        
+        names = column("name", "")
+        descriptions = column("description", "")
+        for pos in range(count):
+            if not 2 <= len(names[pos]) <= 100 or len(descriptions[pos]) > 500:
+                fallback.add(pos)
+        
+        place_ids = column("place_id")
+        if "place_id" not in positions:
+            place_ids = [str(uuid.uuid4()) for _ in range(count)]
+        age_min = numbers("age_min", int, 0, 18)
+        age_max = numbers("age_max", int, 0, 18)
+        
+        fields = {
+            "place_id": place_ids,
+            "slug": column("slug", ""),
+            "name": names,
+            "name_en": optional("name_en"),
+            "region": column("region", ""),
+            "district": column("district", ""),
+            "address": optional("address"),
+            "lat": numbers("lat", float, 22.0, 23.0),
+            "lng": numbers("lng", float, 113.0, 115.0),
+            "geocode_confidence": optional("geocode_confidence"),
+            "category": column("category", "playhouse"),
+            "indoor": [
+                value is None or value.upper() in ("TRUE", "YES", "1")
+                for value in column("indoor")
+            ],
+            "age_min": age_min,
+            "age_max": age_max,
+            "age_range": [
+                [low, high] if low is not None and high is not None else [0, 6]
+                for low, high in zip(age_min, age_max)
+            ],
+            "price_tier": optional("price_tier"),
+            "price_description": optional("price_description"),
+            "description": descriptions,
+            "tips": optional("tips"),
+            "facilities": lists("facilities"),
+            "opening_hours": column("opening_hours", "請查詢官網"),
+            "website_url": urls("website_url"),
+            "facebook_url": urls("facebook_url"),
+            "instagram_url": optional("instagram_url"),
+            "status": enums("status", _STATUSES, "PendingReview"),
+            "validation_stage": enums("validation_stage", _STAGES, "extracted"),
+            "confidence": numbers("confidence", int, 0, 100, blank=0),
+            "risk_tier": enums("risk_tier", _RISK_TIERS, "medium"),
+            "evidence_urls": lists("evidence_urls"),
+            "evidence_snippets": lists("evidence_snippets", " | "),
+            "source_urls": lists("source_urls"),
+            "published_at": datetimes("published_at"),
+            "updated_at": datetimes("updated_at"),
+            "last_checked_at": datetimes("last_checked_at"),
+            "next_check_at": datetimes("next_check_at"),
+            "review_owner": optional("review_owner"),
+            "review_due_at": datetimes("review_due_at"),
+            "resolution": optional("resolution"),
+            "false_alarm_reason": optional("false_alarm_reason"),
+        }
+        
+        # Remaining fields get their defaults here rather than inside
+        # model_construct, which is slow at resolving default factories
+        keys = list(fields)
+        fields_set = set(keys)
+        defaults, factories = {}, {}
+        for name, info in Place.model_fields.items():
+            if name in fields_set:
+                continue
+            if info.default_factory is not None:
+                factories[name] = info.default_factory
+            else:
+                defaults[name] = info.default
         
         places = []
-        for record in records:
+        for pos, row_values in enumerate(zip(*fields.values())):
+            if pos not in fallback:
+                data = dict(zip(keys, row_values), **defaults)
+                for name, factory in factories.items():
+                    data[name] = factory()
+                places.append(Place.model_construct(_fields_set=set(fields_set), **data))
+                continue
+            
+            # Same record get_all_records() would have produced
+            row = rows[pos] + [""] * (len(header) - len(rows[pos]))
             try:
-                place = self._dict_to_place(record)
-                places.append(place)
+                places.append(self._dict_to_place(dict(zip(header, numericise_all(row)))))
             except Exception as e:
                 print(f"Error parsing place: {e}")
-                continue
-        
+                if not skip_invalid:
+                    places.append(None)
         return places
     
     def _dict_to_place(self, data: Dict[str, Any]) -> Place:
@@ -224,6 +543,10 @@ class SheetsClient:
             except:
                 return None
         
+        # Helper for optional text (numericised cells back to str)
+        def parse_text(val):
+            return str(val) if val not in (None, "") else None
+        
         return Place(
             place_id=str(data.get("place_id", uuid.uuid4())),
             slug=str(data.get("slug", "")),
@@ -234,6 +557,7 @@ class SheetsClient:
             address=data.get("address") or None,
             lat=float(data["lat"]) if data.get("lat") else None,
             lng=float(data["lng"]) if data.get("lng") else None,
+            geocode_confidence=parse_text(data.get("geocode_confidence")),
             category=str(data.get("category", "playhouse")),
             indoor=parse_bool(data.get("indoor", True)),
             age_min=int(data["age_min"]) if data.get("age_min") and str(data["age_min"]).strip() else None,
@@ -241,6 +565,8 @@ class SheetsClient:
             price_tier=data.get("price_tier") or None,
             price_description=data.get("price_description") or None,
             description=str(data.get("description", "")),
+            tips=parse_text(data.get("tips")),
+            facilities=[f.strip() for f in str(data.get("facilities", "")).split(",") if f.strip()],
             opening_hours=str(data.get("opening_hours", "請查詢官網")),
             website_url=data.get("website_url") or None,
             facebook_url=data.get("facebook_url") or None,
@@ -250,39 +576,163 @@ class SheetsClient:
             confidence=int(data.get("confidence")) if data.get("confidence") and str(data.get("confidence")).strip() else 0,
             risk_tier=RiskTier(str(data.get("risk_tier") or "medium")),
             evidence_urls=[u.strip() for u in str(data.get("evidence_urls", "")).split(",") if u.strip()],
+            evidence_snippets=[s.strip() for s in str(data.get("evidence_snippets", "")).split(" | ") if s.strip()],
             source_urls=[u.strip() for u in str(data.get("source_urls", "")).split(",") if u.strip()],
             published_at=parse_datetime(data.get("published_at")),
             updated_at=parse_datetime(data.get("updated_at")),
             last_checked_at=parse_datetime(data.get("last_checked_at")),
             next_check_at=parse_datetime(data.get("next_check_at")),
+            review_owner=parse_text(data.get("review_owner")),
+            review_due_at=parse_datetime(data.get("review_due_at")),
+            resolution=parse_text(data.get("resolution")),
+            false_alarm_reason=parse_text(data.get("false_alarm_reason")),
         )
     
     def add_place(self, place: Place, sheet_name: str = "Places") -> str:
-        """Add a new place to sheet"""
-        ws = self.get_worksheet(sheet_name)
+        """Add a new place to sheet (buffered while batching)"""
         row = self._place_to_row(place)
-        ws.append_row(row)
+        
+        if self.buffering:
+            with self._buffer_lock:
+                self._pending_appends[sheet_name][place.place_id] = row
+            self._maybe_flush()
+            return place.place_id
+        
+        self._append_rows(sheet_name, {place.place_id: row})
         return place.place_id
     
-    def update_place(self, place: Place, sheet_name: str = "Places") -> bool:
-        """Update existing place in sheet"""
-        ws = self.get_worksheet(sheet_name)
+    def update_place(
+        self,
+        place: Place,
+        sheet_name: str = "Places",
+        columns: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Update existing place in sheet (one write per row, buffered while batching)
+        Only `columns` are written (default: every column Place carries), so
+        the rest of the row keeps what is in the sheet
+        """
+        row_data = self._place_to_row(place)
+        cells = {col: row_data[col - 1] for col in self._column_numbers(columns)}
         
-        # Find row with matching place_id
-        cell = ws.find(place.place_id)
-        if not cell:
-            return False
+        with self._buffer_lock:
+            # Added earlier in this batch and not written yet
+            pending_row = self._pending_appends.get(sheet_name, {}).get(place.place_id)
+            if pending_row is not None:
+                for col, value in cells.items():
+                    pending_row[col - 1] = value
+                return True
         
-        # Update row
-        row_num = cell.row
-        row_data = self._place_to_row(place)
+        row_num = self._get_row_index(sheet_name).get(place.place_id)
+        if not row_num:
+            return False
         
-        # Update each cell
-        for col_num, value in enumerate(row_data, start=1):
-            ws.update_cell(row_num, col_num, value)
+        if self.buffering:
+            with self._buffer_lock:
+                self._pending_updates[sheet_name].setdefault(place.place_id, {}).update(cells)
+            self._maybe_flush()
+            return True
         
+        self._write_rows(sheet_name, {row_num: cells})
         return True
     
+    def _column_numbers(self, columns: Optional[List[str]] = None) -> List[int]:
+        """1-based sheet columns for COLUMNS names (default: all but UNMAPPED_COLUMNS)"""
+        if columns is None:
+            columns = [name for name in self.COLUMNS if name not in self.UNMAPPED_COLUMNS]
+        return [self.COLUMNS.index(name) + 1 for name in columns]
+    
+    @contextmanager
+    def batch(self):
+        """
+        Buffer add_place / update_place calls and write them in bulk:
+        updates go out as values.batchUpdate requests, new rows as append
+        requests, WRITE_BATCH_SIZE rows per request. Flushes on exit.
+        """
+        self.buffering = True
+        try:
+            yield self
+        finally:
+            self.buffering = False
+            self.flush()
+    
+    def pending_writes(self) -> int:
+        """Number of buffered rows"""
+        with self._buffer_lock:
+            return (
+                sum(len(rows) for rows in self._pending_updates.values())
+                + sum(len(rows) for rows in self._pending_appends.values())
+            )
+    
+    def _maybe_flush(self):
+        if self.pending_writes() >= self.AUTO_FLUSH_ROWS:
+            self.flush()
+    
+    def flush(self) -> int:
+        """Write all buffered rows; returns the number of rows written"""
+        written = 0
+        with self._buffer_lock:
+            for sheet_name, rows in list(self._pending_updates.items()):
+                index = self._get_row_index(sheet_name)
+                by_row = {index[place_id]: row for place_id, row in rows.items() if place_id in index}
+                written += self._write_rows(sheet_name, by_row)
+                del self._pending_updates[sheet_name]
+            
+            for sheet_name, rows in list(self._pending_appends.items()):
+                written += self._append_rows(sheet_name, rows)
+                del self._pending_appends[sheet_name]
+        return written
+    
+    def _write_rows(self, sheet_name: str, rows: Dict[int, Dict[int, Any]]) -> int:
+        """
+        Write row number -> {column: value}, many rows per values.batchUpdate
+        request (adjacent cells and rows are coalesced into ranges)
+        """
+        items = sorted(rows.items())
+        for start in range(0, len(items), self.WRITE_BATCH_SIZE):
+            chunk = items[start:start + self.WRITE_BATCH_SIZE]
+            cells = {
+                (row_num, col): value
+                for row_num, row_cells in chunk
+                for col, value in row_cells.items()
+            }
+            self.gateway.write(self.sheet.values_batch_update, {
+                "valueInputOption": "USER_ENTERED",
+                "data": value_ranges(sheet_name, cells),
+            })
+            self.write_stats["write_requests"] += 1
+        
+        if items:
+            self._sheet_changed(sheet_name)
+        self.write_stats["rows_updated"] += len(items)
+        return len(items)
+    
+    def _append_rows(self, sheet_name: str, rows: Dict[str, list]) -> int:
+        """Append new rows and record where they landed"""
+        ws = self.get_worksheet(sheet_name)
+        items = list(rows.items())
+        for start in range(0, len(items), self.WRITE_BATCH_SIZE):
+            chunk = items[start:start + self.WRITE_BATCH_SIZE]
+            response = self.gateway.append(ws.append_rows, [values for _, values in chunk])
+            self.write_stats["write_requests"] += 1
+            
+            index = self._row_index.get(sheet_name)
+            if index is None:
+                continue
+            match = re.search(r"![A-Z]+(\d+)", response.get("updates", {}).get("updatedRange", ""))
+            if match:
+                first_row = int(match.group(1))
+                for offset, (place_id, _) in enumerate(chunk):
+                    index[place_id] = first_row + offset
+            else:
+                # Unknown position, reload on next lookup
+                self._row_index.pop(sheet_name, None)
+        
+        if items:
+            self._sheet_changed(sheet_name)
+        self.write_stats["rows_appended"] += len(items)
+        return len(items)
+    
     def get_places_needing_review(
         self,
         sheet_name: str = "Places",
@@ -319,16 +769,9 @@ class SheetsClient:
     
     def upsert_place(self, place: Place, sheet_name: str = "Places") -> str:
         """Insert or update place"""
-        ws = self.get_worksheet(sheet_name)
-        
-        # Try to find existing
-        try:
-            cell = ws.find(place.place_id)
-            if cell:
-                self.update_place(place, sheet_name)
-                return place.place_id
-        except:
-            pass
+        # update_place looks the row up in the cached place_id -> row map
+        if self.update_place(place, sheet_name):
+            return place.place_id
         
         # Add new
         return self.add_place(place, sheet_name)
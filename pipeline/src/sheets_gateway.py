@@ -0,0 +1,301 @@
+"""
+Shared gateway for Google Sheets API calls
+- Token buckets sized to the per-user read / write quotas (60 req/min each
+  by default), so callers wait instead of getting 429s
+- Exponential backoff with jitter when a 429 / 5xx still comes back;
+  non-idempotent calls (appends) are only retried on 429, since a 5xx
+  may come back after the rows were already added
+- Queued cell updates coalesced into rectangular ranges, written with one
+  values.batchUpdate per spreadsheet
+- Per-run request counts and quota usage
+
+No relative imports, so standalone scripts can use it via sys.path
+(works with gspread calls and raw REST calls made with requests)
+
+Settings (env):
+    SHEETS_READ_PER_MINUTE   (default 60, 0 = unlimited)
+    SHEETS_WRITE_PER_MINUTE  (default 60, 0 = unlimited)
+"""
+
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+try:
+    from gspread.exceptions import APIError
+    from gspread.utils import rowcol_to_a1
+except ImportError:  # REST-only scripts
+    APIError = None
+    
+    def rowcol_to_a1(row: int, col: int) -> str:
+        letters = ""
+        while col:
+            col, remainder = divmod(col - 1, 26)
+            letters = chr(65 + remainder) + letters
+        return f"{letters}{row}"
+
+
+# Status codes worth retrying: quota, and Google's transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# The request was rejected before doing anything, so even an append can be retried
+REJECTED_STATUSES = {429}
+# Ranges per values.batchUpdate request when flushing queued cells
+MAX_RANGES_PER_REQUEST = 500
+
+
+class TokenBucket:
+    """
+    Blocking token bucket for a per-minute quota
+    Holds `burst` tokens and refills at (per_minute - burst) a minute, so no
+    60 second window ever sees more than per_minute requests
+    """
+    
+    def __init__(self, per_minute: int, burst: Optional[int] = None):
+        self.per_minute = per_minute
+        self.burst = burst if burst is not None else max(1, per_minute // 10)
+        self.rate = max(per_minute - self.burst, 1) / 60.0  # tokens per second
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def status_of(error: Exception) -> Optional[int]:
+    """HTTP status behind a gspread APIError / requests HTTPError, if any"""
+    if APIError is not None and isinstance(error, APIError):
+        return getattr(error, "code", None) or error.response.status_code
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def coalesce_cells(cells: Dict[Tuple[int, int], Any]) -> List[Tuple[int, int, List[List[Any]]]]:
+    """
+    Merge (row, col) -> value into rectangular blocks (row, col, values)
+    Runs of adjacent columns in a row become one range, and runs spanning
+    the same columns on consecutive rows are stacked; cells that weren't
+    queued are never overwritten
+    """
+    runs = []  # (row, col, values) per row
+    row_cells = defaultdict(list)
+    for (row, col), value in cells.items():
+        row_cells[row].append((col, value))
+    for row in sorted(row_cells):
+        run = None
+        for col, value in sorted(row_cells[row], key=lambda item: item[0]):
+            if run and col == run[1] + len(run[2]):
+                run[2].append(value)
+            else:
+                run = (row, col, [value])
+                runs.append(run)
+    
+    blocks: List[Tuple[int, int, List[List[Any]]]] = []
+    open_blocks: Dict[Tuple[int, int], Tuple[int, int, List[List[Any]]]] = {}
+    for row, col, values in runs:
+        key = (col, len(values))
+        block = open_blocks.get(key)
+        if block and block[0] + len(block[2]) == row:
+            block[2].append(values)
+        else:
+            block = (row, col, [values])
+            open_blocks[key] = block
+            blocks.append(block)
+    return blocks
+
+
+def value_ranges(sheet_name: str, cells: Dict[Tuple[int, int], Any]) -> List[Dict[str, Any]]:
+    """values.batchUpdate `data` entries for the coalesced cells"""
+    data = []
+    for row, col, values in coalesce_cells(cells):
+        end = rowcol_to_a1(row + len(values) - 1, col + len(values[0]) - 1)
+        data.append({
+            "range": f"'{sheet_name}'!{rowcol_to_a1(row, col)}:{end}",
+            "values": values,
+        })
+    return data
+
+
+class SheetsGateway:
+    """
+    Every Sheets request goes through read() / write() (or request() for
+    raw REST calls), which wait for quota and retry throttled calls
+    """
+    
+    def __init__(
+        self,
+        read_per_minute: Optional[int] = None,
+        write_per_minute: Optional[int] = None,
+        max_retries: int = 6,
+        max_backoff: float = 64.0,
+    ):
+        if read_per_minute is None:
+            read_per_minute = int(os.getenv("SHEETS_READ_PER_MINUTE", "60"))
+        if write_per_minute is None:
+            write_per_minute = int(os.getenv("SHEETS_WRITE_PER_MINUTE", "60"))
+        self.quotas = {"read": read_per_minute, "write": write_per_minute}
+        self.buckets = {
+            kind: TokenBucket(per_minute) for kind, per_minute in self.quotas.items() if per_minute > 0
+        }
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        
+        # spreadsheet -> sheet name -> (row, col) -> value
+        self._queue: Dict[Any, Dict[str, Dict[Tuple[int, int], Any]]] = defaultdict(lambda: defaultdict(dict))
+        self._queue_lock = threading.RLock()
+        
+        self.stats: Dict[str, float] = defaultdict(float)
+        # Request times over the last minute, for the busiest-minute figure
+        self._recent: Dict[str, deque] = defaultdict(deque)
+        self.peak_per_minute: Dict[str, int] = defaultdict(int)
+        self._stats_lock = threading.Lock()
+    
+    def _count(self, key: str, amount: float = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _record_request(self, kind: str):
+        now = time.monotonic()
+        with self._stats_lock:
+            self.stats[f"{kind}_requests"] += 1
+            recent = self._recent[kind]
+            recent.append(now)
+            while now - recent[0] >= 60:
+                recent.popleft()
+            self.peak_per_minute[kind] = max(self.peak_per_minute[kind], len(recent))
+    
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Truncated exponential backoff with jitter (Retry-After wins if sent)"""
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if retry_after and str(retry_after).isdigit():
+            return float(retry_after)
+        return min(self.max_backoff, 2 ** attempt) + random.uniform(0, 1)
+    
+    def call(self, kind: str, fn: Callable, *args, idempotent: bool = True, **kwargs):
+        """
+        Run one API call under the `kind` ("read" / "write") quota
+        idempotent=False (e.g. appending rows): retry only when rejected (429)
+        """
+        retry_statuses = RETRY_STATUSES if idempotent else REJECTED_STATUSES
+        attempt = 0
+        while True:
+            bucket = self.buckets.get(kind)
+            if bucket:
+                self._count("waited_seconds", bucket.acquire())
+            self._record_request(kind)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                status = status_of(e)
+                if status not in retry_statuses or attempt >= self.max_retries:
+                    if status is not None:
+                        self._count("errors")
+                    raise
+                if status == 429:
+                    self._count("rate_limited")
+                self._count("retries")
+                delay = self._backoff(attempt, e)
+                self._count("backoff_seconds", delay)
+                time.sleep(delay)
+                attempt += 1
+    
+    def read(self, fn: Callable, *args, **kwargs):
+        return self.call("read", fn, *args, **kwargs)
+    
+    def write(self, fn: Callable, *args, **kwargs):
+        return self.call("write", fn, *args, **kwargs)
+    
+    def append(self, fn: Callable, *args, **kwargs):
+        """A write that adds rows (append_row / append_rows): not retried on 5xx"""
+        return self.call("write", fn, *args, idempotent=False, **kwargs)
+    
+    def request(self, kind: str, method: str, url: str, idempotent: bool = True, **kwargs) -> requests.Response:
+        """requests.request() under the quota; raises for retryable statuses left after retries"""
+        def send():
+            response = requests.request(method, url, **kwargs)
+            if response.status_code in RETRY_STATUSES:
+                response.raise_for_status()
+            return response
+        return self.call(kind, send, idempotent=idempotent)
+    
+    def queue_cell(self, worksheet, row: int, col: int, value: Any):
+        """Queue one cell update (1-based row / col) until flush()"""
+        with self._queue_lock:
+            self._queue[worksheet.spreadsheet][worksheet.title][(row, col)] = value
+        self._count("cells_queued")
+    
+    def queue_row(self, worksheet, row: int, values: List[Any], col: int = 1):
+        """Queue consecutive cells of a row starting at `col`"""
+        with self._queue_lock:
+            cells = self._queue[worksheet.spreadsheet][worksheet.title]
+            for offset, value in enumerate(values):
+                cells[(row, col + offset)] = value
+        self._count("cells_queued", len(values))
+    
+    def pending_cells(self) -> int:
+        with self._queue_lock:
+            return sum(len(cells) for sheets in self._queue.values() for cells in sheets.values())
+    
+    def flush(self, value_input_option: str = "RAW") -> int:
+        """Write queued cells as coalesced ranges; returns the number of requests"""
+        with self._queue_lock:
+            queue, self._queue = self._queue, defaultdict(lambda: defaultdict(dict))
+        
+        sent = 0
+        for spreadsheet, sheets in queue.items():
+            data = []
+            for sheet_name, cells in sheets.items():
+                data.extend(value_ranges(sheet_name, cells))
+            for start in range(0, len(data), MAX_RANGES_PER_REQUEST):
+                self.write(spreadsheet.values_batch_update, {
+                    "valueInputOption": value_input_option,
+                    "data": data[start:start + MAX_RANGES_PER_REQUEST],
+                })
+                sent += 1
+            self._count("ranges_written", len(data))
+        return sent
+    
+    def summary(self) -> Dict[str, Any]:
+        """Request counts, and the busiest minute against each quota"""
+        summary: Dict[str, Any] = {key: round(value, 2) for key, value in self.stats.items()}
+        for kind, per_minute in self.quotas.items():
+            peak = self.peak_per_minute.get(kind, 0)
+            summary[f"{kind}_peak_per_minute"] = peak
+            if per_minute:
+                summary[f"{kind}_quota_used"] = f"{peak / per_minute:.0%}"
+        return summary
+    
+    def print_summary(self):
+        summary = self.summary()
+        print("📈 Sheets API usage: " + ", ".join(f"{key}={value}" for key, value in sorted(summary.items())))
+
+
+_default_gateway: Optional[SheetsGateway] = None
+_default_lock = threading.Lock()
+
+
+def get_gateway() -> SheetsGateway:
+    """Process-wide gateway; quotas are per user, so every client shares it"""
+    global _default_gateway
+    with _default_lock:
+        if _default_gateway is None:
+            _default_gateway = SheetsGateway()
+        return _default_gateway
@@ -12,7 +12,8 @@ from urllib.parse import urlparse
 from .config import config
 from .models import Place, PlaceExtract, PlaceValidation, PlaceStatus, ValidationStage, RiskTier, Evidence
 from .http_client import HttpClient
-from .cache import cache, compute_content_hash
+from .cache import async_cache, compute_content_hash
+from .check_schedule import next_check_time
 
 
 class CheapValidator:
@@ -20,8 +21,8 @@ class CheapValidator:
     Low-cost validation checks that don't require LLM
     """
     
-    def __init__(self):
-        self.client = HttpClient()
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or HttpClient()
     
     async def validate(self, place: Place) -> PlaceValidation:
         """
@@ -42,23 +43,22 @@ class CheapValidator:
             if validation.http_ok:
                 # Fetch and hash content
                 try:
-                    async with self.client as client:
-                        response = await client.get(str(place.website_url), use_cache=True)
-                        content_hash = compute_content_hash(response.text[:5000])
-                        validation.content_hash = content_hash
-                        
-                        # Check if hash changed
-                        cache_key = f"content_hash:{place.place_id}"
-                        if cache.has_hash_changed(cache_key, content_hash):
-                            validation.content_hash_changed = True
-                            cache.set(cache_key, {}, content_hash=content_hash)
-                        
-                        # Extract Last-Modified/ETag
-                        validation.last_modified = self._parse_last_modified(
-                            response.headers.get("last-modified")
-                        )
-                        validation.etag = response.headers.get("etag")
-                        
+                    response = await self.client.get(str(place.website_url), use_cache=True)
+                    content_hash = compute_content_hash(response.text[:5000])
+                    validation.content_hash = content_hash
+                    
+                    # Check if hash changed
+                    cache_key = f"content_hash:{place.place_id}"
+                    if await async_cache.has_hash_changed(cache_key, content_hash):
+                        validation.content_hash_changed = True
+                        await async_cache.set(cache_key, {}, content_hash=content_hash)
+                    
+                    # Extract Last-Modified/ETag
+                    validation.last_modified = self._parse_last_modified(
+                        response.headers.get("last-modified")
+                    )
+                    validation.etag = response.headers.get("etag")
+                
                 except Exception as e:
                     # Content fetch failed, but HTTP check passed
                     pass
@@ -123,8 +123,8 @@ class SearchValidator:
     Search-based validation with evidence collection
     """
     
-    def __init__(self):
-        self.client = HttpClient()
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or HttpClient()
     
     async def search_evidence(
         self,
@@ -208,7 +208,7 @@ class LLMValidator:
             validation.llm_rationale = result.get("rationale", "")
             validation.confidence = result.get("confidence", 50)
             validation.validation_stage = ValidationStage.LLM_FLAG
-            
+        
         except Exception as e:
             # LLM failed, mark for review
             validation.status = PlaceStatus.NEEDS_REVIEW
@@ -283,11 +283,13 @@ class PlaceValidator:
     """
     Main validation orchestrator
     Implements "cheap checks before LLM" principle
+    Pass the run's HttpClient to share its connection pool and limits
     """
     
-    def __init__(self):
-        self.cheap_validator = CheapValidator()
-        self.search_validator = SearchValidator()
+    def __init__(self, client: Optional[HttpClient] = None):
+        client = client or HttpClient()
+        self.cheap_validator = CheapValidator(client)
+        self.search_validator = SearchValidator(client)
         self.llm_validator = LLMValidator()
     
     async def validate_place(self, place: Place) -> PlaceValidation:
@@ -376,17 +378,8 @@ class PlaceValidator:
         )
     
     def _calculate_next_check(self, risk_tier: RiskTier) -> datetime:
-        """Calculate next check time based on risk tier"""
-        now = datetime.utcnow()
-        
-        if risk_tier == RiskTier.HIGH:
-            days = config.risk_tier_high_days
-        elif risk_tier == RiskTier.MEDIUM:
-            days = config.risk_tier_medium_days
-        else:
-            days = config.risk_tier_low_days
-        
-        return now + timedelta(days=days)
+        """Calculate next check time based on risk tier (jittered)"""
+        return next_check_time(risk_tier)
 
 
 # Import needed for slugify
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Regression test for PlaceMatcher (standalone, no relative imports)
+Pairs of different venues from data/locations.json that used to match
+each other, and records of the same venue that still have to match
+
+Usage: python -m pytest test_matching.py   (or python test_matching.py)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from matching import PlaceMatcher, PlaceRecord
+
+
+def place(name, name_en, district, address, lat, lng):
+    return {"name": name, "nameEn": name_en, "district": district, "address": address, "lat": lat, "lng": lng}
+
+
+SHA_TIN_LIBRARY = place('沙田公共圖書館', 'Sha Tin Public Library', '沙田', '新界沙田源禾路1號', 22.38066294, 114.1892452)
+SHA_TIN_PARK = place('沙田公園', 'Sha Tin Park', '沙田', '沙田源禾路2號', 22.37949163, 114.1898733)
+SHA_TIN_PARK_AREAS = place('沙田公園 (指定位置)', 'Sha Tin Park (Designated Areas)', '沙田', '沙田源禾路2號', 22.3800468, 114.1904143)
+BOUNDARY_ST_1 = place('界限街一號體育館', 'Boundary Street Sports Centre No. 1', '油尖旺', '太子洗衣街200號', 22.3256, 114.1709)
+BOUNDARY_ST_2 = place('界限街二號體育館', 'Boundary Street Sports Centre No. 2', '油尖旺', '太子洗衣街200號', 22.3261, 114.1705)
+HO_MAN_TIN_POOL = place('何文田游泳池', 'Ho Man Tin Swimming Pool', '九龍城', '何文田忠義街1號', 22.31226858, 114.181037)
+HO_MAN_TIN_SPORTS = place('何文田體育館', 'Ho Man Tin Sports Centre', '九龍城', '九龍何文田忠義街1號', 22.31196785, 114.1812418)
+HUNG_HOM_SPORTS = place('紅磡市政大廈體育館', 'Hung Hom Municipal Services Building Sports Centre', '九龍城',
+                        '九龍紅磡馬頭圍道11號紅磡市政大廈3-5樓', 22.30727166, 114.1873559)
+HUNG_HOM_LIBRARY = place('紅磡公共圖書館', 'Hung Hom Public Library', '九龍城',
+                         '九龍紅磡馬頭圍道11號紅磡市政大廈六樓', 22.30727166, 114.1873559)
+TING_TAI_PLAYGROUND = place('汀太路兒童遊樂場', "Ting Tai Road Children's Playground", '大埔', '大埔汀太路', 22.45479578, 114.1654161)
+TAI_PO_SPORTS = place('大埔體育館', 'Tai Po Sports Centre', '大埔', '大埔汀太路13號', 22.4553, 114.1649)
+ART_MUSEUM = place('香港藝術館', 'Hong Kong Museum of Art', '油尖旺', '尖沙咀梳士巴利道10號', 22.29346412, 114.1719737)
+SPACE_MUSEUM = place('香港太空館', 'Hong Kong Space Museum', '油尖旺', '尖沙咀梳士巴利道10號', 22.29424075, 114.171867)
+
+# (new record, indexed place): different venues that must not match
+DIFFERENT_VENUES = [
+    (SHA_TIN_LIBRARY, SHA_TIN_PARK),
+    (BOUNDARY_ST_2, BOUNDARY_ST_1),
+    (HO_MAN_TIN_POOL, HO_MAN_TIN_SPORTS),
+    (HUNG_HOM_SPORTS, HUNG_HOM_LIBRARY),
+    (TING_TAI_PLAYGROUND, TAI_PO_SPORTS),
+    (ART_MUSEUM, SPACE_MUSEUM),
+]
+
+
+def match(new, existing):
+    matcher = PlaceMatcher()
+    matcher.add(PlaceRecord.from_dict(existing, key="existing"))
+    return matcher.match(PlaceRecord.from_dict(new, key=""))
+
+
+def test_different_venues_do_not_match():
+    for new, existing in DIFFERENT_VENUES:
+        for a, b in ((new, existing), (existing, new)):
+            found = match(a, b)
+            assert found is None, f"{a['name']} matched {b['name']} ({found.reason} {found.score:.2f})"
+
+
+def test_same_venue_still_matches():
+    # Same name, other source: no coordinates, address written differently
+    found = match(dict(SHA_TIN_LIBRARY, lat=None, lng=None, address='沙田源禾路1號'), SHA_TIN_LIBRARY)
+    assert found and not found.review and found.key == "existing"
+    
+    # English name only, at the same spot
+    found = match(place('', 'Sha Tin Public Library', '', '', 22.3807, 114.1892), SHA_TIN_LIBRARY)
+    assert found and not found.review
+    
+    # Spelled slightly differently, same district
+    found = match(dict(HUNG_HOM_SPORTS, name='紅磡市政大廈 體育館', nameEn='', lat=None, lng=None), HUNG_HOM_SPORTS)
+    assert found and not found.review
+
+
+def test_nearby_partial_name_is_only_possible_duplicate():
+    found = match(SHA_TIN_PARK_AREAS, SHA_TIN_PARK)
+    assert found is not None and found.review
+    assert found.reason == 'name+distance' and found.distance_m < 200
+
+
+def test_definite_match_beats_possible_one():
+    matcher = PlaceMatcher()
+    matcher.add(PlaceRecord.from_dict(SHA_TIN_PARK_AREAS, key="areas"))
+    matcher.add(PlaceRecord.from_dict(dict(SHA_TIN_PARK, name='沙田 公園'), key="park"))
+    found = matcher.match(PlaceRecord.from_dict(SHA_TIN_PARK, key=""))
+    assert found.key == "park" and not found.review
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for SheetsClient against the local Sheets stand-in
+(no network, no credentials)
+
+Usage: python -m pytest test_sheets_client.py   (or python test_sheets_client.py)
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+os.environ.update({
+    "SHEETS_BACKEND": "local",
+    "SHEETS_READ_PER_MINUTE": "0",
+    "SHEETS_WRITE_PER_MINUTE": "0",
+    "SHEETS_REVISION_CHECK_SECONDS": "0",
+    "SHEETS_SNAPSHOT": "false",
+})
+
+# Add pipeline to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gspread.utils import numericise_all
+
+from src.models import Place, PlaceStatus
+from src.sheet_backends import LocalSheetsBackend
+from src.sheets_client import SheetsClient
+
+# Cells an editor filled in by hand, which no update may blank
+EDITED = {"google_maps_url": "https://maps.app.goo.gl/abc", "checked_at": "2026-01-02"}
+
+
+def new_client() -> SheetsClient:
+    db_path = Path(tempfile.mkdtemp(prefix="sheets-test-")) / "sheets.db"
+    return SheetsClient(LocalSheetsBackend(db_path, latency_ms=0, read_quota=0, write_quota=0))
+
+
+def seed(client: SheetsClient) -> Place:
+    place = Place(
+        place_id="test-0001",
+        slug="test-playhouse",
+        name="測試遊樂場",
+        region="kowloon",
+        district="油尖旺",
+        description="Playroom with a cafe",
+        tips="bring socks",
+        facilities=["toilet", "cafe"],
+        status=PlaceStatus.OPEN,
+    )
+    client.add_place(place)
+    ws = client.get_worksheet()
+    for name, value in EDITED.items():
+        ws.update_cell(2, client.COLUMNS.index(name) + 1, value)
+    return place
+
+
+def sheet_row(client: SheetsClient) -> dict:
+    header, row = client.get_worksheet().get_all_values()[:2]
+    return dict(zip(header, row))
+
+
+def test_column_update_keeps_the_rest_of_the_row():
+    client = new_client()
+    seed(client)
+    before = sheet_row(client)
+    
+    place = client.get_all_places()[0]
+    place.status = PlaceStatus.SUSPECTED_CLOSED
+    place.next_check_at = datetime(2026, 3, 1)
+    assert client.update_place(place, columns=["status", "next_check_at"])
+    
+    after = sheet_row(client)
+    assert after["status"] == "SuspectedClosed"
+    assert after["next_check_at"] == "2026-03-01T00:00:00"
+    assert {name: value for name, value in after.items() if name not in ("status", "next_check_at")} == \
+        {name: value for name, value in before.items() if name not in ("status", "next_check_at")}
+
+
+def test_batched_column_updates_merge_per_place():
+    client = new_client()
+    seed(client)
+    
+    place = client.get_all_places()[0]
+    with client.batch():
+        place.confidence = 80
+        client.update_place(place, columns=["confidence"])
+        place.status = PlaceStatus.CLOSED
+        client.update_place(place, columns=["status"])
+    
+    row = sheet_row(client)
+    assert row["confidence"] == "80" and row["status"] == "Closed"
+    assert row["tips"] == "bring socks" and row["facilities"] == "toilet,cafe"
+    assert client.write_stats["rows_updated"] == 1
+
+
+def test_whole_place_update_keeps_unmapped_columns():
+    client = new_client()
+    place = seed(client)
+    
+    place.name = "測試遊樂場（新址）"
+    assert client.update_place(place)
+    
+    row = sheet_row(client)
+    assert row["name"] == "測試遊樂場（新址）"
+    assert {name: row[name] for name in EDITED} == EDITED
+
+
+
+def test_read_back_place_keeps_every_column():
+    client = new_client()
+    seed(client)
+    before = sheet_row(client)
+    
+    # Whole-place update from a Place parsed out of the sheet
+    place = client.get_all_places()[0]
+    assert place.tips == "bring socks" and place.facilities == ["toilet", "cafe"]
+    assert client.update_place(place)
+    assert sheet_row(client) == before
+
+
+def test_columnar_parse_matches_dict_parse():
+    client = new_client()
+    rows = [
+        [
+            "p-1", "slug-1", "親子樂園", "Kids Park", "kowloon", "油尖旺", "尖沙咀1號",
+            "22.3", "114.17", "manual", "playhouse", "FALSE", "2", "8", "low", "$80",
+            "Soft play", "bring socks", "toilet, cafe", "10:00-19:00",
+            "https://example.com/", "", "@kidspark", "https://maps.app.goo.gl/x",
+            "Open", "cheap_pass", "75", "high", "https://a.example/1,https://a.example/2",
+            "opens daily | new branch", "https://src.example/", "2026-01-01T00:00:00",
+            "2026-01-02T03:04:05", "2026-01-03T00:00:00", "2026-02-01T00:00:00", "2026-01-03",
+            "alex", "2026-01-10T00:00:00", "kept", "sign was temporary",
+        ],
+        # Sparse row, trailing cells missing
+        ["p-2", "slug-2", "公園", "", "nt", "沙田", "", "", "", "", "park", "TRUE"],
+        # Out-of-range latitude: goes through full validation and is dropped
+        ["p-3", "slug-3", "遠方", "", "nt", "離島", "", "40.0", "114.0"],
+    ]
+    header = list(client.COLUMNS)
+    
+    columnar = client._values_to_places([header] + rows, skip_invalid=False)
+    
+    expected = []
+    for row in rows:
+        row = row + [""] * (len(header) - len(row))
+        try:
+            expected.append(client._dict_to_place(dict(zip(header, numericise_all(row)))))
+        except Exception:
+            expected.append(None)
+    
+    assert expected[0].tips == "bring socks" and expected[0].review_owner == "alex"
+    assert expected[2] is None
+    assert [place and place.model_dump() for place in columnar] == \
+        [place and place.model_dump() for place in expected]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
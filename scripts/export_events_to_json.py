@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """
 Script to export events from Google Sheets to JSON for the website
+Events are streamed to the file one at a time (--compact for minified JSON)
 """
 
+import sys
+from pathlib import Path
+
 import gspread
 from google.oauth2.service_account import Credentials
-import json
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline" / "src"))
+from json_stream import write_json_stream
+
 def export_events_to_json():
     print("🚀 Exporting events from Google Sheets to JSON...")
     
@@ -27,41 +33,44 @@ def export_events_to_json():
     # Get all data
     data = worksheet.get_all_records()
     
-    # Process events
-    events = []
-    for row in data:
-        event = {
-            'event_id': row.get('event_id', ''),
-            'name': row.get('name', ''),
-            'description': row.get('description', ''),
-            'start_date': row.get('start_date', ''),
-            'end_date': row.get('end_date', ''),
-            'location': row.get('location', ''),
-            'organizer': row.get('organizer', ''),
-            'source_url': row.get('source_url', ''),
-            'image_url': row.get('image_url', ''),
-            'age_range': row.get('age_range', ''),
-            'is_free': row.get('is_free', False),
-            'category': row.get('category', ''),
-            'venue_slug': row.get('venue_slug', ''),
-            'status': row.get('status', ''),
-            'created_at': row.get('created_at', ''),
-            'notes': row.get('notes', ''),
-            'crawler_source': row.get('crawler_source', '')
-        }
-        events.append(event)
+    today = datetime.now().strftime('%Y-%m-%d')
+    active_count = 0
     
-    # Save to JSON
-    output_path = '../src/data/events.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(events, f, ensure_ascii=False, indent=2)
+    # Process events (generator, consumed by the writer)
+    def events():
+        nonlocal active_count
+        for row in data:
+            event = {
+                'event_id': row.get('event_id', ''),
+                'name': row.get('name', ''),
+                'description': row.get('description', ''),
+                'start_date': row.get('start_date', ''),
+                'end_date': row.get('end_date', ''),
+                'location': row.get('location', ''),
+                'organizer': row.get('organizer', ''),
+                'source_url': row.get('source_url', ''),
+                'image_url': row.get('image_url', ''),
+                'age_range': row.get('age_range', ''),
+                'is_free': row.get('is_free', False),
+                'category': row.get('category', ''),
+                'venue_slug': row.get('venue_slug', ''),
+                'status': row.get('status', ''),
+                'created_at': row.get('created_at', ''),
+                'notes': row.get('notes', ''),
+                'crawler_source': row.get('crawler_source', '')
+            }
+            if event.get('end_date', '') >= today:
+                active_count += 1
+            yield event
     
-    print(f"✅ Exported {len(events)} events to {output_path}")
+    # Save to JSON (temp file + rename, same top-level array as before)
+    output_path = Path('../src/data/events.json')
+    _, count = write_json_stream(output_path, events(), key=None, compact='--compact' in sys.argv[1:])
+    
+    print(f"✅ Exported {count} events to {output_path}")
     
     # Print summary
-    today = datetime.now().strftime('%Y-%m-%d')
-    active_events = [e for e in events if e.get('end_date', '') >= today]
-    print(f"📊 Active events: {len(active_events)}")
+    print(f"📊 Active events: {active_count}")
 
 if __name__ == '__main__':
     export_events_to_json()
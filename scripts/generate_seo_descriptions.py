@@ -4,14 +4,22 @@ SEO Description Generator for Parent Map HK
 自動生成 seo_description 並寫入 Google Sheets
 """
 
+import sys
+from pathlib import Path
+
 import gspread
 from google.oauth2.service_account import Credentials
 from datetime import datetime
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline" / "src"))
+from sheets_gateway import SheetsGateway
+
 # Google Sheets 配置
 import os
 SHEET_ID = os.getenv("GOOGLE_SHEETS_ID", "")  # 從環境變數讀取，或手動填入
 WORKSHEET_NAME = "03_places"
+FLUSH_EVERY = 500  # 每幾多格寫一次
 
 if not SHEET_ID:
     print("❌ 錯誤：請設定 GOOGLE_SHEETS_ID 環境變數，或編輯腳本中的 SHEET_ID")
@@ -147,18 +155,20 @@ def main():
         if not creds:
             raise FileNotFoundError("找不到 credentials.json，請確保服務帳戶憑證存在")
         client = gspread.authorize(creds)
+        gateway = SheetsGateway()
         
         # 打開工作表
-        sheet = client.open_by_key(SHEET_ID).worksheet(WORKSHEET_NAME)
+        spreadsheet = gateway.read(client.open_by_key, SHEET_ID)
+        sheet = gateway.read(spreadsheet.worksheet, WORKSHEET_NAME)
         
         # 獲取所有記錄
         print("正在讀取 Google Sheets 數據...")
         print(f"  工作表: {WORKSHEET_NAME}")
-        records = sheet.get_all_records()
+        records = gateway.read(sheet.get_all_records)
         print(f"  成功讀取 {len(records)} 筆記錄")
         
         # 找到 header row
-        headers = sheet.row_values(1)
+        headers = gateway.read(sheet.row_values, 1)
         
         # 檢查是否已有 seo_description 欄位
         if 'seo_description' not in headers:
@@ -166,12 +176,12 @@ def main():
             try:
                 desc_short_idx = headers.index('description_short')
                 new_col = desc_short_idx + 2  # +2 因為 gspread 是 1-based
-                sheet.update_cell(1, new_col, 'seo_description')
+                gateway.write(sheet.update_cell, 1, new_col, 'seo_description')
                 print(f"已新增 'seo_description' 欄位在第 {new_col} 列")
             except ValueError:
                 # 如果找不到，加到最後
                 new_col = len(headers) + 1
-                sheet.update_cell(1, new_col, 'seo_description')
+                gateway.write(sheet.update_cell, 1, new_col, 'seo_description')
                 print(f"已新增 'seo_description' 欄位在最後（第 {new_col} 列）")
         else:
             new_col = headers.index('seo_description') + 1
@@ -181,37 +191,29 @@ def main():
         start_row = 2  # 從第 2 行開始（第 1 行是 header）
         
         print(f"\n開始生成 SEO 描述（共 {len(records)} 筆記錄）...")
-        print("（每 50 筆批量更新，API 限制時會自動等待）\n")
+        print(f"（每 {FLUSH_EVERY} 筆合併成一個範圍寫入，API 配額由 gateway 排程）\n")
         
         # 測試生成一個示例
         test_desc = generate_seo_description(records[0])
         print(f"示例輸出（第 1 筆）：{test_desc[:60]}...\n")
         
-        updates = []
         for i, row in enumerate(records, start=start_row):  # start=2 因為第 1 行是 header
             try:
-                seo_desc = generate_seo_description(row)
-                updates.append({
-                    'row': i,
-                    'col': new_col,
-                    'value': seo_desc
-                })
-                
-                if len(updates) >= 50:  # 每 50 筆批量更新
-                    _batch_update(sheet, updates)
-                    print(f"  ✅ 已更新 {i-1} / {len(records)} 筆...")
-                    updates = []
-                    time.sleep(2)  # 每次批量更新後等待 2 秒
-                    
+                gateway.queue_cell(sheet, i, new_col, generate_seo_description(row))
             except Exception as e:
                 print(f"  ❌ 錯誤：第 {i} 行 - {e}")
-                time.sleep(5)  # 錯誤後等待更長時間
+                continue
+            
+            # 同一欄連續嘅格會合併成一個範圍，一個 request 寫晒
+            if gateway.pending_cells() >= FLUSH_EVERY:
+                gateway.flush()
+                print(f"  ✅ 已更新 {i-1} / {len(records)} 筆...")
         
         # 更新剩餘的
-        if updates:
-            _batch_update(sheet, updates)
+        gateway.flush()
         
         print(f"\n✅ 完成！共更新 {len(records)} 筆記錄的 seo_description")
+        gateway.print_summary()
         
         # 顯示幾個示例
         print("\n示例輸出：")
@@ -223,39 +225,5 @@ def main():
         print(f"錯誤：{e}")
         raise
 
-import time
-
-def _batch_update(sheet, updates, max_retries=3):
-    """批量更新單元格，帶重試機制"""
-    cells = []
-    for update in updates:
-        cell = sheet.cell(update['row'], update['col'])
-        cell.value = update['value']
-        cells.append(cell)
-    
-    for attempt in range(max_retries):
-        try:
-            sheet.update_cells(cells, value_input_option='RAW')
-            return True
-        except Exception as e:
-            if '429' in str(e):
-                wait_time = (attempt + 1) * 10  # 10s, 20s, 30s
-                print(f"    API 配額限制，等待 {wait_time} 秒後重試...")
-                time.sleep(wait_time)
-            else:
-                raise
-    
-    # 如果還是失敗，逐個更新
-    print("    批量更新失敗，改用逐個更新...")
-    for update in updates:
-        try:
-            sheet.update_cell(update['row'], update['col'], update['value'])
-            time.sleep(0.5)  # 每個請求間隔 0.5 秒
-        except Exception as e:
-            if '429' in str(e):
-                time.sleep(5)
-                sheet.update_cell(update['row'], update['col'], update['value'])
-    return True
-
 if __name__ == "__main__":
     main()
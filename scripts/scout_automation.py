@@ -9,6 +9,7 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
+import sys
 import requests
 
 # Load .env file
@@ -17,6 +18,10 @@ env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
+# 共用比對模組（pipeline/src/matching.py, geo_index.py）
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline" / "src"))
+from matching import PlaceMatcher, PlaceRecord
+
 # API Keys (從環境變數讀取)
 GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY", "")
 BRAVE_API_KEY = os.getenv("BRAVE_API_KEY", "")
@@ -26,6 +31,9 @@ EXISTING_LOCATIONS_FILE = "/root/.openclaw/workspace/parent-map-hk/data/location
 WORKSPACE = Path("/root/.openclaw/workspace/parent-map-hk")
 LOG_FILE = WORKSPACE / "scout_log.txt"
 
+# 距離現有地點少於呢個距離（米）就標記為可能重覆
+NEARBY_DUPLICATE_RADIUS_M = 100
+
 def log(message):
     """記錄日誌"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -35,16 +43,26 @@ def log(message):
         f.write(msg + "\n")
 
 def load_existing_locations():
-    """讀取現有地點名稱（用於比對重覆）"""
-    existing_names = set()
+    """讀取現有地點（名稱 + 座標索引，用於比對重覆）"""
+    matcher = PlaceMatcher()
     try:
         with open(EXISTING_LOCATIONS_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
-            for loc in data.get("locations", []):
-                existing_names.add(loc.get("name", ""))
+            for i, loc in enumerate(data.get("locations", [])):
+                matcher.add(PlaceRecord.from_dict(loc, key=loc.get("slug") or loc.get("name") or f"row-{i}"))
     except Exception as e:
         log(f"讀取現有地點錯誤: {e}")
-    return existing_names
+    return matcher
+
+def find_nearby_places(matcher, place):
+    """搵出距離 NEARBY_DUPLICATE_RADIUS_M 米內嘅現有地點"""
+    if not place.get("lat") or not place.get("lng"):
+        return []
+    nearby = matcher.geo.radius(place["lat"], place["lng"], NEARBY_DUPLICATE_RADIUS_M)
+    return [
+        {"slug": key, "name": matcher.features[key].record.name, "distance": round(distance)}
+        for key, distance in nearby
+    ]
 
 def search_google_places_new(query, location="Hong Kong"):
     """使用 Google Places API (New) 搜尋"""
@@ -155,8 +173,8 @@ def main():
         log("❌ 請先設定 GOOGLE_PLACES_API_KEY 環境變數")
         return
     
-    existing_names = load_existing_locations()
-    log(f"📊 現有地點數量: {len(existing_names)}")
+    existing = load_existing_locations()
+    log(f"📊 現有地點數量: {len(existing)}")
     
     # 搜尋關鍵字
     search_queries = [
@@ -180,12 +198,21 @@ def main():
         log(f"   找到 {len(places)} 個地點")
         
         for place in places:
-            if place["name"] in existing_names:
-                log(f"   ⏭️ 已存在: {place['name']}")
+            match = existing.match(PlaceRecord.from_dict(place, key=""))
+            # 只係附近名相近 (match.review) 唔跳過，下面 possibleDuplicates 會標記
+            if match and not match.review:
+                log(f"   ⏭️ 已存在: {place['name']} ({match.reason})")
                 continue
             
             location = format_location_data(place)
+            nearby = find_nearby_places(existing, place)
+            if nearby:
+                # 唔自動跳過（同一商場可能有幾個地點），標記俾人手審查
+                location["possibleDuplicates"] = nearby
+                log(f"   ⚠️ 可能重覆: {place['name']} 附近有 "
+                    + ", ".join(f"{n['name']} ({n['distance']}m)" for n in nearby))
             new_locations.append(location)
+            existing.add(PlaceRecord.from_dict(location, key=location["id"]))
             log(f"   ✅ 新地點: {place['name']}")
             
             if len(new_locations) >= 3:
@@ -11,6 +11,10 @@ import requests
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline', 'src'))
+from sheets_gateway import SheetsGateway
+
 # 從環境變數讀取
 GOOGLE_PLACES_API_KEY = os.environ.get('GOOGLE_PLACES_API_KEY', '')
 GOOGLE_SHEETS_API_KEY = os.environ.get('GOOGLE_SHEETS_API_KEY', GOOGLE_PLACES_API_KEY)  # 使用同一個 Key
@@ -133,39 +137,18 @@ def verify_single_place(row_index, place_name, address, original_lat, original_l
     return result
 
 
-def read_sheet_with_retry(sheet_id, tab_name, api_key, max_retries=3):
-    """帶重試的 Sheet 讀取"""
+def read_sheet_with_retry(sheet_id, tab_name, api_key, gateway=None):
+    """讀取 Sheet（配額排程同 429 / 5xx 重試由 SheetsGateway 處理）"""
+    gateway = gateway or SheetsGateway()
     url = f"{SHEETS_API_BASE}/spreadsheets/{sheet_id}/values/{tab_name}"
-    params = {'key': api_key}
+    response = gateway.request('read', 'GET', url, params={'key': api_key}, timeout=30)
+    data = response.json()
     
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            data = response.json()
-            
-            if 'values' in data:
-                return data['values']
-            
-            error = data.get('error', {})
-            error_msg = error.get('message', 'Unknown error')
-            
-            if 'Quota exceeded' in error_msg:
-                wait_time = (attempt + 1) * 30
-                print(f"    配額限制，等待 {wait_time} 秒後重試...")
-                time.sleep(wait_time)
-                continue
-            else:
-                raise ValueError(f"無法讀取 tab: {error_msg}")
-                
-        except Exception as e:
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 10
-                print(f"    錯誤: {e}，等待 {wait_time} 秒後重試...")
-                time.sleep(wait_time)
-            else:
-                raise
+    if 'values' in data:
+        return data['values']
     
-    raise ValueError("超過最大重試次數")
+    error_msg = data.get('error', {}).get('message', 'Unknown error')
+    raise ValueError(f"無法讀取 tab: {error_msg}")
 
 
 def process_sheet():
@@ -14,6 +14,10 @@ from datetime import datetime
 
 import requests
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline', 'src'))
+from sheets_gateway import SheetsGateway, value_ranges
+
 # Google API 設置
 GOOGLE_PLACES_API_KEY = os.environ.get('GOOGLE_PLACES_API_KEY', '')
 GOOGLE_SHEETS_API_KEY = os.environ.get('GOOGLE_SHEETS_API_KEY', '')
@@ -21,6 +25,7 @@ GOOGLE_SHEETS_API_KEY = os.environ.get('GOOGLE_SHEETS_API_KEY', '')
 # Sheet 配置
 SHEET_ID = os.environ.get('GOOGLE_SHEET_ID', '')  # 你的 Google Sheet ID
 TAB_NAME = "99_pin_to_check"
+FLUSH_ROWS = 20  # 每幾多行結果寫一次 Sheet
 
 BASE_URL_PLACES = 'https://maps.googleapis.com/maps/api/place'
 BASE_URL_SHEETS = 'https://sheets.googleapis.com/v4/spreadsheets'
@@ -165,13 +170,15 @@ class GoogleSheetsClient:
         self.sheet_id = sheet_id
         self.api_key = api_key
         self.base_url = f"{BASE_URL_SHEETS}/{sheet_id}"
+        self.gateway = SheetsGateway()
+        self._headers: Dict[str, List[str]] = {}
+        # tab -> (row, col) -> value，等 flush() 寫入
+        self._pending: Dict[str, Dict[Tuple[int, int], str]] = {}
+        self._pending_rows = set()
     
     def read_tab(self, tab_name: str) -> List[Dict[str, Any]]:
         """讀取整個 tab 的數據"""
-        url = f"{self.base_url}/values/{tab_name}"
-        params = {'key': self.api_key}
-        
-        response = requests.get(url, params=params, timeout=30)
+        response = self._request('read', 'GET', f"{self.base_url}/values/{tab_name}")
         data = response.json()
         
         if 'values' not in data:
@@ -182,7 +189,7 @@ class GoogleSheetsClient:
             return []
         
         # 第一行是標題
-        headers = rows[0]
+        headers = self._headers[tab_name] = rows[0]
         
         # 轉換為字典列表
         results = []
@@ -199,57 +206,47 @@ class GoogleSheetsClient:
     
     def update_cells(self, tab_name: str, row: int, updates: Dict[str, str]):
         """
-        更新指定行的單元格
+        更新指定行的單元格（先排隊，每 FLUSH_ROWS 行合併寫一次）
         
         Args:
             tab_name: tab 名稱
             row: 行號（1-based）
             updates: {列名: 值} 的字典
         """
-        # 先獲取標題行以確定列索引
-        url = f"{self.base_url}/values/{tab_name}!1:1"
-        params = {'key': self.api_key}
-        
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
-        headers = data.get('values', [[]])[0]
+        headers = self._headers.get(tab_name)
+        if headers is None:
+            response = self._request('read', 'GET', f"{self.base_url}/values/{tab_name}!1:1")
+            headers = self._headers[tab_name] = response.json().get('values', [[]])[0]
         
-        # 構建更新範圍和值
-        ranges_and_values = []
         for col_name, value in updates.items():
             if col_name not in headers:
                 print(f"    警告: 列 '{col_name}' 不存在")
                 continue
-            
-            col_index = headers.index(col_name)
-            col_letter = self._column_to_letter(col_index)
-            cell_range = f"{tab_name}!{col_letter}{row}"
-            
-            ranges_and_values.append({
-                'range': cell_range,
-                'values': [[value]]
-            })
+            self._pending.setdefault(tab_name, {})[(row, headers.index(col_name) + 1)] = value
+        self._pending_rows.add((tab_name, row))
         
-        # 批量更新
-        if ranges_and_values:
-            url = f"{self.base_url}/values:batchUpdate"
-            params = {'key': self.api_key}
-            body = {
-                'valueInputOption': 'RAW',
-                'data': ranges_and_values
-            }
-            
-            response = requests.post(url, params=params, json=body, timeout=30)
-            if response.status_code != 200:
-                print(f"    更新失敗: {response.json()}")
-    
-    def _column_to_letter(self, index: int) -> str:
-        """將列索引轉換為字母（0 -> A, 1 -> B, ...）"""
-        result = ""
-        while index >= 0:
-            result = chr(ord('A') + (index % 26)) + result
-            index = index // 26 - 1
-        return result or 'A'
+        if len(self._pending_rows) >= FLUSH_ROWS:
+            self.flush()
+    
+    def flush(self):
+        """相連嘅格合併成範圍，一個 values:batchUpdate 寫晒"""
+        data = []
+        for tab_name, cells in self._pending.items():
+            data.extend(value_ranges(tab_name, cells))
+        self._pending, self._pending_rows = {}, set()
+        if not data:
+            return
+        
+        response = self._request('write', 'POST', f"{self.base_url}/values:batchUpdate", json={
+            'valueInputOption': 'RAW',
+            'data': data
+        })
+        if response.status_code != 200:
+            print(f"    更新失敗: {response.text}")
+    
+    def _request(self, kind: str, method: str, url: str, **kwargs) -> requests.Response:
+        """經 gateway 發送（配額排程 + 429 重試）"""
+        return self.gateway.request(kind, method, url, params={'key': self.api_key}, timeout=30, **kwargs)
 
 
 def process_sheet():
@@ -364,6 +361,10 @@ def process_sheet():
         # 避免速率限制
         time.sleep(0.5)
     
+    # 寫入未 flush 嘅結果
+    sheets.flush()
+    sheets.gateway.print_summary()
+    
     # 輸出統計
     print("\n" + "="*70)
     print("查核完成！")
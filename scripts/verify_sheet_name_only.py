@@ -15,6 +15,10 @@ import requests
 import gspread
 from google.oauth2.service_account import Credentials
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline', 'src'))
+from sheets_gateway import SheetsGateway
+
 # 配置
 GOOGLE_PLACES_API_KEY = os.environ.get('GOOGLE_PLACES_API_KEY', '')
 GOOGLE_SHEET_ID = os.environ.get('GOOGLE_SHEET_ID', '')
@@ -169,8 +173,9 @@ def process_sheet():
     print("\n🔌 正在連接 Google Sheets...")
     try:
         client = get_gspread_client()
-        spreadsheet = client.open_by_key(GOOGLE_SHEET_ID)
-        worksheet = spreadsheet.worksheet(TAB_NAME)
+        gateway = SheetsGateway()
+        spreadsheet = gateway.read(client.open_by_key, GOOGLE_SHEET_ID)
+        worksheet = gateway.read(spreadsheet.worksheet, TAB_NAME)
         print("   ✅ 連接成功")
     except Exception as e:
         print(f"❌ 連接失敗: {e}")
@@ -179,7 +184,7 @@ def process_sheet():
     # 讀取所有數據
     print(f"\n📖 正在讀取 '{TAB_NAME}'...")
     try:
-        all_values = worksheet.get_all_values()
+        all_values = gateway.read(worksheet.get_all_values)
         print(f"   找到 {len(all_values)} 行數據")
     except Exception as e:
         print(f"❌ 讀取失敗: {e}")
@@ -277,26 +282,19 @@ def process_sheet():
     if batch_updates:
         print(f"\n💾 正在批量更新 {len(batch_updates)} 行到 Google Sheet...")
         try:
-            cells_to_update = []
+            # 每行四格相連嘅會合併成範圍，一個 batchUpdate 寫晒
             for update in batch_updates:
                 row = update['row']
-                cells_to_update.extend([
-                    gspread.Cell(row, col_google_lat + 1, update['google_lat']),
-                    gspread.Cell(row, col_google_lng + 1, update['google_lng']),
-                    gspread.Cell(row, col_google_result + 1, update['google_result']),
-                    gspread.Cell(row, col_checked + 1, update['checked']),
-                ])
-            
-            batch_size = 100
-            for i in range(0, len(cells_to_update), batch_size):
-                batch = cells_to_update[i:i+batch_size]
-                worksheet.update_cells(batch)
-                print(f"   已更新 {len(batch)} 個單元格...")
-                time.sleep(1)
+                gateway.queue_cell(worksheet, row, col_google_lat + 1, update['google_lat'])
+                gateway.queue_cell(worksheet, row, col_google_lng + 1, update['google_lng'])
+                gateway.queue_cell(worksheet, row, col_google_result + 1, update['google_result'])
+                gateway.queue_cell(worksheet, row, col_checked + 1, update['checked'])
             
-            print("   ✅ 批量更新完成")
+            requests_sent = gateway.flush()
+            print(f"   ✅ 批量更新完成（{requests_sent} 個 API request）")
         except Exception as e:
             print(f"   ❌ 批量更新失敗: {e}")
+        gateway.print_summary()
     
     # 統計
     print("\n" + "="*70)
@@ -8,12 +8,16 @@ import os
 import sys
 import time
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 import requests
 
+# 共用 Sheets 配額排程（pipeline/src/sheets_gateway.py）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline', 'src'))
+from sheets_gateway import SheetsGateway, value_ranges
+
 # 從環境變數讀取配置
 GOOGLE_PLACES_API_KEY = os.environ.get('GOOGLE_PLACES_API_KEY', '')
 GOOGLE_SHEET_ID = os.environ.get('GOOGLE_SHEET_ID', '')
@@ -25,6 +29,7 @@ GOOGLE_SERVICE_ACCOUNT_FILE = os.environ.get('GOOGLE_SERVICE_ACCOUNT_FILE', '')
 GOOGLE_SERVICE_ACCOUNT_JSON = os.environ.get('GOOGLE_SERVICE_ACCOUNT_JSON', '')
 
 TAB_NAME = "99_pin_to_check"
+FLUSH_ROWS = 20  # 每幾多行結果寫一次 Sheet
 
 BASE_URL_PLACES = 'https://maps.googleapis.com/maps/api/place'
 SHEETS_API_BASE = 'https://sheets.googleapis.com/v4'
@@ -116,6 +121,12 @@ class GoogleSheetsClient:
     def __init__(self, sheet_id: str):
         self.sheet_id = sheet_id
         self.auth = ServiceAccountAuth()
+        self.base_url = f"{SHEETS_API_BASE}/spreadsheets/{sheet_id}"
+        self.gateway = SheetsGateway()
+        self._headers: Dict[str, List[str]] = {}
+        # tab -> (row, col) -> value，等 flush() 寫入
+        self._pending: Dict[str, Dict[Tuple[int, int], str]] = {}
+        self._pending_rows = set()
     
     def _get_headers(self) -> Dict[str, str]:
         """獲取請求頭"""
@@ -126,9 +137,7 @@ class GoogleSheetsClient:
     
     def read_tab(self, tab_name: str) -> List[Dict[str, Any]]:
         """讀取整個 tab"""
-        url = f"{SHEETS_API_BASE}/spreadsheets/{self.sheet_id}/values/{tab_name}"
-        
-        response = requests.get(url, headers=self._get_headers(), timeout=30)
+        response = self._request('read', 'GET', f"{self.base_url}/values/{tab_name}")
         data = response.json()
         
         if 'values' not in data:
@@ -139,7 +148,7 @@ class GoogleSheetsClient:
         if len(rows) < 2:
             return []
         
-        headers = rows[0]
+        headers = self._headers[tab_name] = rows[0]
         
         results = []
         for i, row in enumerate(rows[1:], start=2):
@@ -153,55 +162,48 @@ class GoogleSheetsClient:
         return results
     
     def update_cells(self, tab_name: str, row: int, updates: Dict[str, str]):
-        """更新單元格"""
-        # 獲取標題行
-        url = f"{SHEETS_API_BASE}/spreadsheets/{self.sheet_id}/values/{tab_name}!1:1"
-        response = requests.get(url, headers=self._get_headers(), timeout=30)
-        data = response.json()
-        headers = data.get('values', [[]])[0]
+        """
+        更新指定行的單元格（先排隊，每 FLUSH_ROWS 行合併寫一次）
+        
+        Args:
+            tab_name: tab 名稱
+            row: 行號（1-based）
+            updates: {列名: 值} 的字典
+        """
+        headers = self._headers.get(tab_name)
+        if headers is None:
+            response = self._request('read', 'GET', f"{self.base_url}/values/{tab_name}!1:1")
+            headers = self._headers[tab_name] = response.json().get('values', [[]])[0]
         
-        # 構建批量更新數據
-        data_entries = []
         for col_name, value in updates.items():
             if col_name not in headers:
                 print(f"    警告: 列 '{col_name}' 不存在")
                 continue
-            
-            col_index = headers.index(col_name)
-            col_letter = self._column_to_letter(col_index)
-            
-            data_entries.append({
-                'range': f"{tab_name}!{col_letter}{row}",
-                'values': [[value]]
-            })
+            self._pending.setdefault(tab_name, {})[(row, headers.index(col_name) + 1)] = value
+        self._pending_rows.add((tab_name, row))
         
-        if not data_entries:
+        if len(self._pending_rows) >= FLUSH_ROWS:
+            self.flush()
+    
+    def flush(self):
+        """相連嘅格合併成範圍，一個 values:batchUpdate 寫晒"""
+        data = []
+        for tab_name, cells in self._pending.items():
+            data.extend(value_ranges(tab_name, cells))
+        self._pending, self._pending_rows = {}, set()
+        if not data:
             return
         
-        # 批量更新
-        url = f"{SHEETS_API_BASE}/spreadsheets/{self.sheet_id}/values:batchUpdate"
-        body = {
+        response = self._request('write', 'POST', f"{self.base_url}/values:batchUpdate", json={
             'valueInputOption': 'RAW',
-            'data': data_entries
-        }
-        
-        response = requests.post(
-            url, 
-            headers=self._get_headers(),
-            json=body,
-            timeout=30
-        )
-        
+            'data': data
+        })
         if response.status_code != 200:
             print(f"    更新失敗: {response.text}")
     
-    def _column_to_letter(self, index: int) -> str:
-        """列索引轉字母"""
-        result = ""
-        while index >= 0:
-            result = chr(ord('A') + (index % 26)) + result
-            index = index // 26 - 1
-        return result or 'A'
+    def _request(self, kind: str, method: str, url: str, **kwargs) -> requests.Response:
+        """經 gateway 發送（配額排程 + 429 重試）"""
+        return self.gateway.request(kind, method, url, headers=self._get_headers(), timeout=30, **kwargs)
 
 
 def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
@@ -428,6 +430,10 @@ def process_sheet():
         
         time.sleep(0.5)
     
+    # 寫入未 flush 嘅結果
+    sheets.flush()
+    sheets.gateway.print_summary()
+    
     # 統計
     print("\n" + "="*70)
     print("查核完成！")